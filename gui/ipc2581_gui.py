@@ -4,20 +4,112 @@ IPC-2581 to KiCad Converter - GUI
 A graphical interface for the ipc2581-to-kicad command-line tool.
 """
 
+import collections
+import functools
+import json
 import os
+import platform
+import queue
+import stat
 import sys
 import subprocess
 import threading
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from itertools import groupby
+from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 
 # Ensure sibling modules are importable regardless of working directory
 sys.path.insert(0, str(Path(__file__).parent.resolve()))
 
-from pcb_data import PcbData
-from pcb_viewer_2d import PcbViewer2D
-from pcb_viewer_3d import PcbViewer3D
+from pcb_data import PcbData, _tree_signature
+
+# Oldest log lines are dropped beyond this many to keep the Text widget fast
+MAX_LOG_LINES = 5000
+# Interval at which queued log messages are written to the widget
+LOG_POLL_MS = 30
+# Only the last this many stderr lines of a process are kept and logged
+STDERR_TAIL_LINES = 2000
+
+CACHE_DIR = Path.home() / ".cache" / "ipc2581-gui"
+# Persistent cache of --list-steps results, validated by _steps_stamp()
+STEPS_CACHE_FILE = CACHE_DIR / "steps.json"
+# Last converter executable found, tried before scanning the usual locations
+CONVERTER_CACHE_FILE = CACHE_DIR / "converter_path"
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_for_converter():
+    """Search the build tree, working directory and PATH for the converter.
+
+    Memoized: the PATH scan in shutil.which runs at most once per session.
+    """
+    script_dir = Path(__file__).parent.resolve()
+    project_dir = script_dir.parent
+
+    possible_paths = [
+        # Inside .app bundle: script is in Resources/, binary is also in Resources/
+        script_dir / "ipc2581-to-kicad",
+        project_dir / "build" / "ipc2581-to-kicad",
+        project_dir / "ipc2581-to-kicad",
+        Path.cwd() / "ipc2581-to-kicad",
+        Path.cwd() / "build" / "ipc2581-to-kicad",
+    ]
+
+    # One stat per distinct candidate: a regular file with any execute bit.
+    # cwd often coincides with the project dir, so drop duplicate paths.
+    for p in dict.fromkeys(str(p) for p in possible_paths):
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+            return p
+
+    # Try to find in PATH
+    import shutil
+    found = shutil.which("ipc2581-to-kicad")
+    if found:
+        return found
+
+    return None
+
+
+class _WorkerPool:
+    """Reusable daemon threads for the GUI's background tasks.
+
+    Idle threads pick up new tasks instead of a thread being created per
+    action. Unlike ThreadPoolExecutor the threads are daemons, so closing
+    the window never waits for a conversion that is still running.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._tasks = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+        self._count = 0
+
+    def submit(self, fn):
+        """Run fn() on an idle worker, starting a new one if all are busy."""
+        with self._lock:
+            if self._idle:
+                # Reserve an idle worker so it is not counted twice
+                self._idle -= 1
+            else:
+                self._count += 1
+                threading.Thread(target=self._work, name=f"{self._name}-{self._count}",
+                                 daemon=True).start()
+            self._tasks.put(fn)
+
+    def _work(self):
+        while True:
+            fn = self._tasks.get()
+            try:
+                fn()
+            finally:
+                with self._lock:
+                    self._idle += 1
 
 
 class Ipc2581ConverterGUI:
@@ -27,8 +119,14 @@ class Ipc2581ConverterGUI:
         self.root.geometry("700x600")
         self.root.minsize(600, 500)
 
-        # Find the converter executable
-        self.converter_path = self._find_converter()
+        # The converter executable is located in the background once the
+        # window is up; see _discover_converter_async
+        self.converter_path = None
+        self._discovering_converter = True
+        self._steps_pending = False
+
+        # Background work runs on reused threads; see _submit
+        self._workers = _WorkerPool("ipc-gui")
 
         # Variables
         self.input_file = tk.StringVar()
@@ -37,40 +135,78 @@ class Ipc2581ConverterGUI:
         self.selected_step = tk.StringVar()
         self.verbose = tk.BooleanVar(value=True)
         self.available_steps = []
+        self._steps_cache = self._read_steps_cache()
+
+        # Pending log messages; any thread may queue, the Tk poller drains
+        self._log_q = queue.Queue()
+
+        # While set, the log poller also steps the progress bar
+        self._busy = False
 
         # Build UI
         self._create_widgets()
 
+        self.root.after_idle(self._discover_converter_async)
+        self.root.after(LOG_POLL_MS, self._drain_log)
+
+    def _submit(self, work, on_done, on_error):
+        """Run work() in the background and report back on the Tk thread.
+
+        on_done receives work's return value; on_error receives the
+        exception if it raised.
+        """
+        def run():
+            try:
+                result = work()
+            except Exception as e:
+                self.root.after(0, on_error, e)
+            else:
+                self.root.after(0, on_done, result)
+
+        self._workers.submit(run)
+
+    def _task_error(self, error):
+        """Report a failed background task."""
+        self._log(f"Error: {error}", "error")
+        self._set_status("Ready")
+
+    def _discover_converter_async(self):
+        """Run converter discovery on a worker thread so startup never blocks."""
+        self._submit(self._find_converter, self._set_converter_path,
+                     lambda e: self._set_converter_path(None))
+
+    def _set_converter_path(self, path):
+        """Record the discovered converter (main thread)."""
+        self.converter_path = path
+        self._discovering_converter = False
+
         # Check if converter exists
         if not self.converter_path:
             self._log("WARNING: Converter executable not found!", "error")
             self._log("Please build the project first: cd build && cmake .. && make", "error")
 
+        if self._steps_pending:
+            self._steps_pending = False
+            self._load_steps()
+
     def _find_converter(self):
         """Find the converter executable in common locations."""
-        script_dir = Path(__file__).parent.resolve()
-        project_dir = script_dir.parent
-
-        possible_paths = [
-            # Inside .app bundle: script is in Resources/, binary is also in Resources/
-            script_dir / "ipc2581-to-kicad",
-            project_dir / "build" / "ipc2581-to-kicad",
-            project_dir / "ipc2581-to-kicad",
-            Path.cwd() / "ipc2581-to-kicad",
-            Path.cwd() / "build" / "ipc2581-to-kicad",
-        ]
-
-        for p in possible_paths:
-            if p.exists() and os.access(p, os.X_OK):
-                return str(p)
-
-        # Try to find in PATH
-        import shutil
-        found = shutil.which("ipc2581-to-kicad")
-        if found:
-            return found
+        # Fast path: the location found last session, if still executable
+        try:
+            cached = CONVERTER_CACHE_FILE.read_text(encoding="utf-8").strip()
+        except OSError:
+            cached = ""
+        if cached and os.path.isfile(cached) and os.access(cached, os.X_OK):
+            return cached
 
-        return None
+        found = _scan_for_converter()
+        if found:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                CONVERTER_CACHE_FILE.write_text(found, encoding="utf-8")
+            except OSError:
+                pass
+        return found
 
     def _create_widgets(self):
         """Create all GUI widgets."""
@@ -173,7 +309,7 @@ class Ipc2581ConverterGUI:
                    command=self._clear_log).pack(side="left", padx=5)
 
         # === Progress Bar ===
-        self.progress = ttk.Progressbar(main_frame, mode="indeterminate")
+        self.progress = ttk.Progressbar(main_frame, mode="determinate", maximum=100)
         self.progress.grid(row=row, column=0, columnspan=3, sticky="ew", pady=(0, 10))
         row += 1
 
@@ -182,15 +318,15 @@ class Ipc2581ConverterGUI:
             row=row, column=0, sticky="w", pady=(0, 5))
         row += 1
 
-        self.log_text = scrolledtext.ScrolledText(main_frame, height=15, width=80,
-                                                   font=("Courier", 10))
-        self.log_text.grid(row=row, column=0, columnspan=3, sticky="nsew", pady=(0, 10))
+        # The log widget itself is built on first use by _ensure_log_widget
+        self._log_frame = ttk.Frame(main_frame)
+        self._log_frame.grid(row=row, column=0, columnspan=3, sticky="nsew", pady=(0, 10))
+        self._log_frame.columnconfigure(0, weight=1)
+        self._log_frame.rowconfigure(0, weight=1)
         main_frame.rowconfigure(row, weight=1)
-
-        # Configure log text tags
-        self.log_text.tag_config("error", foreground="red")
-        self.log_text.tag_config("success", foreground="green")
-        self.log_text.tag_config("info", foreground="blue")
+        self._log_text = None
+        # Follow new output only while the user is at the bottom of the log
+        self._autoscroll = True
 
         row += 1
 
@@ -240,6 +376,11 @@ class Ipc2581ConverterGUI:
 
     def _load_steps(self):
         """Load available steps from the input file."""
+        if self._discovering_converter:
+            # Runs again from _set_converter_path once discovery finishes
+            self._steps_pending = True
+            return
+
         if not self.converter_path:
             self._log("Converter not found", "error")
             return
@@ -249,39 +390,48 @@ class Ipc2581ConverterGUI:
             self._log("Please select a valid input file first", "error")
             return
 
+        stamp = self._steps_stamp(input_path)
+        cached = self._steps_cache.get(input_path)
+        if cached and cached.get("stamp") == stamp:
+            self._apply_steps(cached["steps"])
+            return
+
         self._log("Loading steps from file...", "info")
         self._set_status("Loading steps...")
 
+        cmd = [self.converter_path, "--list-steps", input_path]
+
         def run():
-            try:
-                result = subprocess.run(
-                    [self.converter_path, "--list-steps", input_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                self.root.after(0, lambda: self._process_steps(result))
-            except Exception as e:
-                self.root.after(0, lambda: self._log(f"Error: {e}", "error"))
-                self.root.after(0, lambda: self._set_status("Ready"))
+            lines = []
+            returncode = self._stream_command(cmd, 30, lines.append)
+            return returncode, lines
 
-        threading.Thread(target=run, daemon=True).start()
+        self._submit(run,
+                     lambda r: self._process_steps(r[0], r[1], input_path, stamp),
+                     self._task_error)
 
-    def _process_steps(self, result):
-        """Process the list-steps output."""
+    def _process_steps(self, returncode, lines, input_path, stamp):
+        """Process the list-steps output lines."""
         self._set_status("Ready")
 
-        if result.returncode != 0:
-            self._log(f"Error loading steps: {result.stderr}", "error")
+        if returncode != 0:
+            output = "\n".join(lines).strip()
+            self._log(f"Error loading steps: {output}", "error")
             return
 
         # Parse steps from output
-        steps = []
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if line and not line.startswith("Steps in") and not line.startswith("No steps"):
-                steps.append(line)
-
+        steps = [line for line in map(str.strip, lines)
+                 if line and not line.startswith(("Steps in", "No steps"))]
+
+        self._steps_cache[input_path] = {
+            "stamp": stamp,
+            "steps": steps,
+        }
+        self._write_steps_cache()
+        self._apply_steps(steps)
+
+    def _apply_steps(self, steps):
+        """Populate the step selector with the given step names."""
         self.available_steps = steps
 
         if steps:
@@ -293,6 +443,41 @@ class Ipc2581ConverterGUI:
             self.step_combo.set("(no steps found)")
             self._log("No steps found in file", "error")
 
+    def _steps_stamp(self, input_path):
+        """Identify the input and converter a --list-steps result is valid for.
+
+        Directory inputs are stamped by their files, since re-exporting an
+        ODB++ tree leaves the top directory's size and mtime unchanged. The
+        converter's mtime makes a rebuilt converter invalidate old entries.
+        Lists rather than tuples, so stamps compare equal after a JSON round trip.
+        """
+        if os.path.isdir(input_path):
+            source = [_tree_signature(input_path)]
+        else:
+            st = os.stat(input_path)
+            source = [st.st_size, st.st_mtime]
+        return [*source, self.converter_path, os.path.getmtime(self.converter_path)]
+
+    def _read_steps_cache(self):
+        """Load the persistent steps cache, or an empty one if unreadable."""
+        try:
+            with open(STEPS_CACHE_FILE, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _write_steps_cache(self):
+        """Save the steps cache; failures only cost a re-scan next session."""
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = STEPS_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._steps_cache, f)
+            os.replace(tmp_path, STEPS_CACHE_FILE)
+        except OSError:
+            pass
+
     def _list_layers(self):
         """Show layer mapping for the input file."""
         if not self.converter_path:
@@ -307,20 +492,10 @@ class Ipc2581ConverterGUI:
         self._log("Loading layer mapping...", "info")
         self._set_status("Loading layers...")
 
-        def run():
-            try:
-                result = subprocess.run(
-                    [self.converter_path, "--list-layers", "--verbose", input_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                self.root.after(0, lambda: self._show_result(result, "Layer mapping loaded"))
-            except Exception as e:
-                self.root.after(0, lambda: self._log(f"Error: {e}", "error"))
-                self.root.after(0, lambda: self._set_status("Ready"))
-
-        threading.Thread(target=run, daemon=True).start()
+        cmd = [self.converter_path, "--list-layers", "--verbose", input_path]
+        self._submit(lambda: self._stream_command(cmd, 30, self._log_from_thread),
+                     lambda returncode: self._show_result(returncode, "Layer mapping loaded"),
+                     self._task_error)
 
     def _convert(self):
         """Run the conversion."""
@@ -364,41 +539,24 @@ class Ipc2581ConverterGUI:
         self._log("-" * 60)
         self._set_status("Converting...")
         self.convert_btn.state(['disabled'])
-        self.progress.start(10)
+        self._set_busy(True)
 
-        def run():
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
-                self.root.after(0, lambda: self._conversion_complete(result, output_path))
-            except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: self._conversion_error("Conversion timed out"))
-            except Exception as e:
-                self.root.after(0, lambda: self._conversion_error(str(e)))
+        def failed(error):
+            if isinstance(error, subprocess.TimeoutExpired):
+                self._conversion_error("Conversion timed out")
+            else:
+                self._conversion_error(str(error))
 
-        threading.Thread(target=run, daemon=True).start()
+        self._submit(lambda: self._stream_command(cmd, 300, self._log_from_thread),
+                     lambda returncode: self._conversion_complete(returncode, output_path),
+                     failed)
 
-    def _conversion_complete(self, result, output_path):
+    def _conversion_complete(self, returncode, output_path):
         """Handle conversion completion."""
-        self.progress.stop()
+        self._set_busy(False)
         self.convert_btn.state(['!disabled'])
 
-        # Log output
-        if result.stdout:
-            for line in result.stdout.split('\n'):
-                if line.strip():
-                    self._log(line)
-
-        if result.stderr:
-            for line in result.stderr.split('\n'):
-                if line.strip():
-                    self._log(line, "error")
-
-        if result.returncode == 0:
+        if returncode == 0:
             self._log("-" * 60)
             self._log(f"SUCCESS: Output saved to {output_path}", "success")
             self._set_status("Conversion complete!")
@@ -417,7 +575,7 @@ class Ipc2581ConverterGUI:
 
     def _conversion_error(self, error_msg):
         """Handle conversion error."""
-        self.progress.stop()
+        self._set_busy(False)
         self.convert_btn.state(['!disabled'])
         self._log(f"Error: {error_msg}", "error")
         self._set_status("Error")
@@ -453,63 +611,209 @@ class Ipc2581ConverterGUI:
 
         self._log(f"Loading PCB data for {mode} viewer...", "info")
         self._set_status(f"Exporting JSON for {mode} viewer...")
-        self.progress.start(10)
+        self._set_busy(True)
+
+        step = self._get_selected_step()
 
         def run():
-            try:
-                pcb = PcbData()
-                pcb.load_from_file(self.converter_path, input_path,
-                                   step=self._get_selected_step())
-                self.root.after(0, lambda: self._viewer_ready(pcb, mode))
-            except Exception as e:
-                self.root.after(0, lambda: self._viewer_error(str(e)))
+            pcb = PcbData()
+            pcb.load_from_file(self.converter_path, input_path, step=step)
+            return pcb
 
-        threading.Thread(target=run, daemon=True).start()
+        self._submit(run,
+                     lambda pcb: self._viewer_ready(pcb, mode),
+                     lambda e: self._viewer_error(str(e)))
 
     def _viewer_ready(self, pcb, mode):
         """Called on main thread when JSON data is ready."""
-        self.progress.stop()
+        self._set_busy(False)
         self._set_status("Ready")
         self._log(f"{mode} viewer data loaded: {len(pcb.components)} components, "
                   f"{len(pcb.traces)} traces", "success")
 
+        # Viewers are imported on first use; the 3D one pulls in matplotlib
         if mode == "2D":
+            from pcb_viewer_2d import PcbViewer2D
             PcbViewer2D(self.root, pcb)
         else:
+            from pcb_viewer_3d import PcbViewer3D
             PcbViewer3D(self.root, pcb)
 
     def _viewer_error(self, error_msg):
         """Called on main thread if JSON export fails."""
-        self.progress.stop()
+        self._set_busy(False)
         self._set_status("Ready")
         self._log(f"Viewer error: {error_msg}", "error")
         messagebox.showerror("Viewer Error", error_msg)
 
-    def _show_result(self, result, success_msg):
+    def _show_result(self, returncode, success_msg):
         """Show command result in log."""
         self._set_status("Ready")
 
-        if result.stdout:
-            for line in result.stdout.split('\n'):
-                if line.strip():
-                    self._log(line)
-
-        if result.stderr:
-            for line in result.stderr.split('\n'):
-                if line.strip():
-                    self._log(line, "error")
-
-        if result.returncode == 0:
+        if returncode == 0:
             self._log(success_msg, "success")
 
+    def _stream_command(self, cmd, timeout, on_line):
+        """Run a command, passing each line of stdout to on_line as it arrives.
+
+        stderr is drained concurrently into a ring of the last
+        STDERR_TAIL_LINES lines and logged as one error entry at exit, so a
+        misbehaving child cannot grow the GUI's memory without bound.
+        Returns the exit code; raises subprocess.TimeoutExpired if the
+        process is still running after timeout seconds.
+        """
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True, bufsize=1)
+        timed_out = threading.Event()
+        stderr_done = threading.Event()
+        stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+        stderr_count = 0
+
+        def drain_stderr():
+            nonlocal stderr_count
+            try:
+                with proc.stderr:
+                    for line in proc.stderr:
+                        if line.strip():
+                            stderr_tail.append(line.rstrip("\n"))
+                            stderr_count += 1
+            finally:
+                stderr_done.set()
+
+        def kill():
+            timed_out.set()
+            proc.kill()
+
+        self._workers.submit(drain_stderr)
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    on_line(line.rstrip("\n"))
+            stderr_done.wait()
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            # on_line or the read raised: don't leave the child running
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+        if stderr_tail:
+            lines = list(stderr_tail)
+            dropped = stderr_count - len(lines)
+            if dropped:
+                lines.insert(0, f"... (output truncated, {dropped} lines dropped) ...")
+            self._log("\n".join(lines), "error")
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode
+
+    def _log_from_thread(self, line):
+        """Forward a line of process output from a worker thread to the log."""
+        if line.strip():
+            self._log_q.put((line, None))
+
     def _log(self, message, tag=None):
-        """Add a message to the log."""
-        self.log_text.insert(tk.END, message + "\n", tag)
-        self.log_text.see(tk.END)
+        """Add a message to the log.
+
+        Messages are queued and written by _drain_log every LOG_POLL_MS, so
+        bursts of output cost one insert per tag run. Safe from any thread.
+        """
+        self._log_q.put((message, tag))
+
+    def _drain_log(self):
+        """Write everything queued since the last tick, then reschedule."""
+        items = []
+        try:
+            while True:
+                items.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        if items:
+            self._bulk_insert(items)
+        if self._busy:
+            self.progress["value"] = (self.progress["value"] + 1) % 100
+        self.root.after(LOG_POLL_MS, self._drain_log)
+
+    def _set_busy(self, busy):
+        """Start or stop the progress bar, which _drain_log advances."""
+        self._busy = busy
+        if not busy:
+            self.progress["value"] = 0
+
+    def _ensure_log_widget(self):
+        """Create the log text widget on first use and return it."""
+        if self._log_text is not None:
+            return self._log_text
+
+        from tkinter import scrolledtext
+
+        # No wrapping (the costly reflow path) and no undo stack; the widget
+        # stays disabled except while _bulk_insert writes to it
+        log_text = scrolledtext.ScrolledText(self._log_frame, height=15, width=80,
+                                             font=("Courier", 10), wrap="none",
+                                             undo=False, autoseparators=False, maxundo=0)
+        log_text.grid(row=0, column=0, sticky="nsew")
+
+        log_xscroll = ttk.Scrollbar(self._log_frame, orient="horizontal",
+                                    command=log_text.xview)
+        log_xscroll.grid(row=1, column=0, sticky="ew")
+        log_text.configure(xscrollcommand=log_xscroll.set, state="disabled")
+
+        # Configure log text tags
+        log_text.tag_config("error", foreground="red")
+        log_text.tag_config("success", foreground="green")
+        log_text.tag_config("info", foreground="blue")
+
+        # Any user scrolling re-evaluates whether to keep following output
+        for widget, sequences in (
+                (log_text, ("<MouseWheel>", "<Button-4>", "<Button-5>", "<KeyPress>")),
+                (log_text.vbar, ("<B1-Motion>", "<ButtonRelease-1>"))):
+            for sequence in sequences:
+                widget.bind(sequence, self._on_log_scroll, add="+")
+
+        self._log_text = log_text
+        return log_text
+
+    def _bulk_insert(self, items):
+        """Write (message, tag) pairs to the text widget."""
+        log_text = self._ensure_log_widget()
+        log_text.configure(state="normal")
+
+        # Consecutive messages with the same tag become one insert
+        for tag, entries in groupby(items, key=lambda entry: entry[1]):
+            text = "\n".join(message for message, _ in entries) + "\n"
+            log_text.insert(tk.END, text, tag)
+
+        # Trim the oldest lines in a single delete once over the cap
+        line_count = int(log_text.index("end-1c").split(".")[0])
+        excess = line_count - MAX_LOG_LINES
+        if excess > 0:
+            log_text.delete("1.0", f"{excess + 1}.0")
+
+        log_text.configure(state="disabled")
+        if self._autoscroll:
+            log_text.yview_moveto(1.0)
+
+    def _on_log_scroll(self, event=None):
+        """Re-check autoscroll once Tk has applied the user's scroll."""
+        self.root.after_idle(self._update_autoscroll)
+
+    def _update_autoscroll(self):
+        """Follow output again only when the view is back at the bottom."""
+        self._autoscroll = self._log_text.yview()[1] >= 0.999
 
     def _clear_log(self):
         """Clear the log text."""
-        self.log_text.delete(1.0, tk.END)
+        log_text = self._log_text
+        if log_text is None:
+            return
+        log_text.configure(state="normal")
+        log_text.delete(1.0, tk.END)
+        log_text.configure(state="disabled")
 
     def _set_status(self, status):
         """Set the status bar text."""
@@ -517,7 +821,6 @@ class Ipc2581ConverterGUI:
 
     def _open_folder(self, path):
         """Open a folder in the system file manager."""
-        import platform
         system = platform.system()
 
         try:
@@ -4,11 +4,31 @@ Runs the converter with --export-json and parses the result.
 For ODB++ inputs, can also use the Python odb package directly.
 """
 
+import array
+import hashlib
+import itertools
 import json
+import math
 import os
 import subprocess
-import math
 import sys
+import tempfile
+import threading
+import types
+from collections import OrderedDict
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# orjson parses export JSON several times faster and accepts bytes directly
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # KiCad layer name -> hex color for rendering
 LAYER_COLORS = {
@@ -32,19 +52,156 @@ LAYER_COLORS = {
     "Dwgs.User": "#808080",
     "Cmts.User": "#404040",
 }
+# Exposed read-only so no consumer can alter the shared palette
+LAYER_COLORS = types.MappingProxyType(LAYER_COLORS)
+
+
+DEFAULT_LAYER_COLOR = "#808080"
+
+# Layer names interned to small ints: LAYER_COLOR_TABLE[_LAYER_IDX[name]] is
+# the layer's color, and the final entry is the default for unknown layers
+_LAYER_IDX = {name: i for i, name in enumerate(LAYER_COLORS)}
+LAYER_COLOR_TABLE = tuple(LAYER_COLORS.values()) + (DEFAULT_LAYER_COLOR,)
+_UNKNOWN_LAYER_IDX = len(LAYER_COLOR_TABLE) - 1
 
 
 def layer_color(layer_name):
     """Return a hex color for the given KiCad layer name."""
-    return LAYER_COLORS.get(layer_name, "#808080")
+    return LAYER_COLORS.get(layer_name, DEFAULT_LAYER_COLOR)
+
+
+def _column(values, count, typecode="d"):
+    """Pack count numbers into a typed column.
+
+    Returns a NumPy array when NumPy is available, else an array.array;
+    typecode "d" gives float64 and "i" gives int32 columns.
+    """
+    if HAS_NUMPY:
+        dtype = np.float64 if typecode == "d" else np.int32
+        return np.fromiter(values, dtype=dtype, count=count)
+    return array.array(typecode, values)
+
+
+def _arc_extreme_points(sx, sy, mx, my, ex, ey):
+    """Return the points bounding an arc given by start, mid and end.
+
+    These are the endpoints plus every axis-aligned extreme of the circle
+    (east, north, west, south) that the arc's sweep passes through.
+    """
+    points = [(sx, sy), (ex, ey)]
+    d = 2.0 * (sx * (my - ey) + mx * (ey - sy) + ex * (sy - my))
+    if abs(d) < 1e-12:
+        # Collinear: the mid point lies between start and end
+        return points
+    s2, m2, e2 = sx * sx + sy * sy, mx * mx + my * my, ex * ex + ey * ey
+    cx = (s2 * (my - ey) + m2 * (ey - sy) + e2 * (sy - my)) / d
+    cy = (s2 * (ex - mx) + m2 * (sx - ex) + e2 * (mx - sx)) / d
+    r = math.hypot(sx - cx, sy - cy)
+
+    tau = 2 * math.pi
+    a_s = math.atan2(sy - cy, sx - cx)
+    a_e = math.atan2(ey - cy, ex - cx)
+    a_m = math.atan2(my - cy, mx - cx)
+    sweep = (a_e - a_s) % tau
+    if (a_m - a_s) % tau < sweep:
+        # Counter-clockwise from start through mid to end
+        first, sweep = a_s, sweep
+    else:
+        # Clockwise: the same arc runs counter-clockwise from end to start
+        first, sweep = a_e, (a_s - a_e) % tau
+
+    for k, (px, py) in enumerate(((cx + r, cy), (cx, cy + r),
+                                  (cx - r, cy), (cx, cy - r))):
+        if (k * math.pi / 2 - first) % tau <= sweep:
+            points.append((px, py))
+    return points
+
+
+def _arc_extreme_columns(arcs):
+    """Vectorized _arc_extreme_points over a list of arc dicts (NumPy only).
+
+    Returns (xs, ys) arrays. Where an extreme is not on an arc, the arc's
+    start point stands in for it, which leaves the bounds unchanged.
+    """
+    n = len(arcs)
+    pts = np.fromiter((v for a in arcs for k in ("start", "mid", "end") for v in a[k]),
+                      dtype=np.float64, count=6 * n).reshape(n, 6)
+    sx, sy, mx, my, ex, ey = pts.T
+    d = 2.0 * (sx * (my - ey) + mx * (ey - sy) + ex * (sy - my))
+    round_arc = np.abs(d) >= 1e-12
+    d = np.where(round_arc, d, 1.0)
+    s2, m2, e2 = sx * sx + sy * sy, mx * mx + my * my, ex * ex + ey * ey
+    cx = (s2 * (my - ey) + m2 * (ey - sy) + e2 * (sy - my)) / d
+    cy = (s2 * (ex - mx) + m2 * (sx - ex) + e2 * (mx - sx)) / d
+    r = np.hypot(sx - cx, sy - cy)
+
+    tau = 2 * np.pi
+    a_s = np.arctan2(sy - cy, sx - cx)
+    a_e = np.arctan2(ey - cy, ex - cx)
+    a_m = np.arctan2(my - cy, mx - cx)
+    sweep = np.mod(a_e - a_s, tau)
+    ccw = np.mod(a_m - a_s, tau) < sweep
+    first = np.where(ccw, a_s, a_e)
+    sweep = np.where(ccw, sweep, np.mod(a_s - a_e, tau))
+
+    xs, ys = [sx, ex], [sy, ey]
+    for k, (px, py) in enumerate(((cx + r, cy), (cx, cy + r),
+                                  (cx - r, cy), (cx, cy - r))):
+        on_arc = round_arc & (np.mod(k * np.pi / 2 - first, tau) <= sweep)
+        xs.append(np.where(on_arc, px, sx))
+        ys.append(np.where(on_arc, py, sy))
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+def _tree_signature(root):
+    """Digest of every file's relative path, size and mtime under root.
+
+    Re-exporting an ODB++ directory rewrites files below it without
+    touching the top directory's own size or mtime.
+    """
+    h = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            rel = os.path.relpath(path, root)
+            h.update(f"{rel}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+# Recently loaded boards: source key -> data, most recent last.
+# Lets the viewers re-open an unchanged file without re-running the converter.
+_LOAD_CACHE_SIZE = 4
+_load_cache = OrderedDict()
+
+# On-disk cache of --export-json output, shared between sessions. Per-user,
+# next to the GUI's other caches: a shared temp dir could be pre-created
+# or seeded by another local user.
+EXPORT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ipc2581-gui", "exports")
 
 
 class PcbData:
     """Holds the full parsed PCB model from JSON export."""
 
+    __slots__ = (
+        "data", "bbox",
+        # Columns built by _build_soa
+        "trace_x0", "trace_y0", "trace_x1", "trace_y1", "trace_width",
+        "trace_layer", "layer_names", "layer_colors",
+        "via_x", "via_y", "via_diameter", "via_drill",
+        "comp_x", "comp_y", "comp_rotation",
+        # Every layer name on the board, sorted, and its index in that list
+        "board_layers", "layer_id",
+    )
+
     def __init__(self):
         self.data = {}
         self.bbox = None  # (min_x, min_y, max_x, max_y)
+        self._build_soa()
 
     @staticmethod
     def _is_odb_input(filepath):
@@ -61,24 +218,126 @@ class PcbData:
 
         For ODB++ inputs, uses the Python odb package directly (faster than
         double subprocess through the C++ binary).
+
+        Results are kept in a small in-process cache keyed by the input's
+        path, size, mtime and step (for a directory, of every file in it),
+        so re-opening an unchanged input is free.
+        """
+        key = self._source_key(converter_path, ipc_file, step)
+        cached = _load_cache.get(key)
+        if cached is not None:
+            _load_cache.move_to_end(key)
+            self.data = cached
+        else:
+            if self._is_odb_input(ipc_file):
+                self._load_odb(ipc_file, step)
+            else:
+                self._load_converter(converter_path, ipc_file, step)
+
+            _load_cache[key] = self.data
+            if len(_load_cache) > _LOAD_CACHE_SIZE:
+                _load_cache.popitem(last=False)
+
+        self._build_soa()
+        self.bbox = self.compute_bbox()
+
+    @staticmethod
+    def _source_key(converter_path, ipc_file, step):
+        """Identify a load by converter, input path, size, mtime and step.
+
+        Directory inputs use the size and mtime of every file in the tree.
         """
-        if self._is_odb_input(ipc_file):
-            self._load_odb(ipc_file, step)
+        if os.path.isdir(ipc_file):
+            stamp = (_tree_signature(ipc_file),)
+        else:
+            st = os.stat(ipc_file)
+            stamp = (st.st_size, st.st_mtime)
+        return (converter_path, os.path.abspath(ipc_file), *stamp, step)
+
+    @staticmethod
+    def _export_cache_path(converter_path, ipc_file, step):
+        """Return the disk cache file for an export of ipc_file.
+
+        The key covers the input's path, mtime and size, the step, and the
+        converter's mtime so a rebuilt converter invalidates old exports.
+        """
+        key = (f"{os.path.abspath(ipc_file)}|{os.path.getmtime(ipc_file)}|"
+               f"{os.path.getsize(ipc_file)}|{step}|"
+               f"{os.path.getmtime(converter_path)}")
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(EXPORT_CACHE_DIR, f"{digest}.json")
+
+    def _load_converter(self, converter_path, ipc_file, step=None):
+        """Run the converter with --export-json and parse its stdout.
+
+        The raw JSON is also written to EXPORT_CACHE_DIR and read back from
+        there on later loads of the same unchanged input.
+        """
+        cache_path = self._export_cache_path(converter_path, ipc_file, step)
+        try:
+            with open(cache_path, "rb") as f:
+                self.data = _json_loads(f.read())
             return
+        except (OSError, ValueError):
+            pass
 
         cmd = [converter_path, "--export-json"]
         if step:
             cmd.extend(["-s", step])
         cmd.append(ipc_file)
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"Converter failed (exit {result.returncode}):\n{result.stderr}"
-            )
+        raw = self._run_export(cmd, timeout=120)
+        self.data = _json_loads(raw)
+        self._write_export_cache(cache_path, raw)
 
-        self.data = json.loads(result.stdout)
-        self.bbox = self.compute_bbox()
+    @staticmethod
+    def _run_export(cmd, timeout):
+        """Run an export command and return its stdout as bytes.
+
+        stdout is read straight off the pipe in one pass; stderr goes to a
+        temporary file so a chatty converter can never block on it.
+        """
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                with proc.stdout:
+                    raw = proc.stdout.read()
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                raise RuntimeError(
+                    f"Converter failed (exit {returncode}):\n{stderr}"
+                )
+        return raw
+
+    @staticmethod
+    def _write_export_cache(cache_path, raw):
+        """Atomically store export JSON; a failed write only loses the cache."""
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(EXPORT_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
     def _load_odb(self, odb_file, step=None):
         """Load ODB++ input directly using the Python odb package (no subprocess)."""
@@ -94,48 +353,110 @@ class PcbData:
 
         model = parse_odb(Path(odb_file))
         self.data = model_to_json(model)
-        self.bbox = self.compute_bbox()
 
     def load_from_json(self, json_text):
         """Parse JSON text directly (for testing)."""
-        self.data = json.loads(json_text)
+        self.data = _json_loads(json_text)
+        self._build_soa()
         self.bbox = self.compute_bbox()
 
-    def compute_bbox(self):
-        """Compute bounding box from outline and all geometry."""
-        xs, ys = [], []
-
-        # Outline segments
-        for seg in self.data.get("outline", {}).get("segments", []):
-            xs.extend([seg["start"][0], seg["end"][0]])
-            ys.extend([seg["start"][1], seg["end"][1]])
-
-        # Outline arcs
-        for arc in self.data.get("outline", {}).get("arcs", []):
-            xs.extend([arc["start"][0], arc["mid"][0], arc["end"][0]])
-            ys.extend([arc["start"][1], arc["mid"][1], arc["end"][1]])
-
-        # Components
-        for comp in self.data.get("components", []):
-            xs.append(comp["position"][0])
-            ys.append(comp["position"][1])
+    def _build_soa(self):
+        """Pack trace, via and component geometry into per-field columns.
 
-        # Traces
-        for t in self.data.get("traces", []):
-            xs.extend([t["start"][0], t["end"][0]])
-            ys.extend([t["start"][1], t["end"][1]])
-
-        # Vias
-        for v in self.data.get("vias", []):
-            xs.append(v["position"][0])
-            ys.append(v["position"][1])
+        The dict lists in self.data stay as they are for the viewers; the
+        columns give bbox and other whole-board passes flat numeric arrays.
+        Trace layers are interned into indices into self.layer_names, with
+        self.layer_colors giving the color for each of those indices.
+        """
+        traces = self.data.get("traces", [])
+        n = len(traces)
+        self.trace_x0 = _column((t["start"][0] for t in traces), n)
+        self.trace_y0 = _column((t["start"][1] for t in traces), n)
+        self.trace_x1 = _column((t["end"][0] for t in traces), n)
+        self.trace_y1 = _column((t["end"][1] for t in traces), n)
+        self.trace_width = _column((t["width"] for t in traces), n)
+
+        layer_index = {}
+        self.trace_layer = _column(
+            (layer_index.setdefault(t["layer"], len(layer_index)) for t in traces),
+            n, "i")
+        self.layer_names = [sys.intern(name) for name in layer_index]
+        self.layer_colors = [
+            LAYER_COLOR_TABLE[_LAYER_IDX.get(name, _UNKNOWN_LAYER_IDX)]
+            for name in self.layer_names]
+
+        vias = self.data.get("vias", [])
+        n = len(vias)
+        self.via_x = _column((v["position"][0] for v in vias), n)
+        self.via_y = _column((v["position"][1] for v in vias), n)
+        self.via_diameter = _column((v["diameter"] for v in vias), n)
+        self.via_drill = _column((v["drill"] for v in vias), n)
+
+        comps = self.data.get("components", [])
+        n = len(comps)
+        self.comp_x = _column((c["position"][0] for c in comps), n)
+        self.comp_y = _column((c["position"][1] for c in comps), n)
+        self.comp_rotation = _column((c.get("rotation", 0) for c in comps), n)
+
+        self.board_layers = self._collect_layers()
+        self.layer_id = {name: i for i, name in enumerate(self.board_layers)}
+
+    def _collect_layers(self):
+        """Return the sorted names of every layer used by the board."""
+        data = self.data
+        items = itertools.chain(
+            data.get("traces", []), data.get("trace_arcs", []),
+            data.get("graphics", []), data.get("zones", []),
+            (g for fp in data.get("footprints", {}).values()
+             for g in fp.get("graphics", [])))
+        names = {l["kicad_name"] for l in data.get("layers", []) if l.get("kicad_name")}
+        names.update(item.get("layer") for item in items)
+        names.discard(None)
+        names.discard("")
+        # Always include Edge.Cuts
+        names.add("Edge.Cuts")
+        return sorted(names)
 
-        if not xs or not ys:
-            return (0, 0, 100, 100)
+    def compute_bbox(self):
+        """Compute bounding box from outline and all geometry."""
+        outline = self.data.get("outline", {})
+        segments = outline.get("segments", [])
+        arcs = outline.get("arcs", [])
+        seg_x = _column((p[0] for s in segments for p in (s["start"], s["end"])),
+                        2 * len(segments))
+        seg_y = _column((p[1] for s in segments for p in (s["start"], s["end"])),
+                        2 * len(segments))
+
+        # Arcs contribute their true extent, not just start/mid/end
+        if HAS_NUMPY and arcs:
+            arc_x, arc_y = _arc_extreme_columns(arcs)
+        else:
+            arc_points = [p for a in arcs
+                          for p in _arc_extreme_points(*a["start"], *a["mid"], *a["end"])]
+            arc_x = _column((p[0] for p in arc_points), len(arc_points))
+            arc_y = _column((p[1] for p in arc_points), len(arc_points))
+
+        x_cols = [seg_x, arc_x, self.comp_x, self.trace_x0, self.trace_x1, self.via_x]
+        y_cols = [seg_y, arc_y, self.comp_y, self.trace_y0, self.trace_y1, self.via_y]
+
+        if HAS_NUMPY:
+            xs = np.concatenate(x_cols)
+            ys = np.concatenate(y_cols)
+            if not xs.size:
+                return (0, 0, 100, 100)
+            min_x, max_x = float(xs.min()), float(xs.max())
+            min_y, max_y = float(ys.min()), float(ys.max())
+        else:
+            xs = [x for col in x_cols for x in col]
+            ys = [y for col in y_cols for y in col]
+            if not xs:
+                return (0, 0, 100, 100)
+            min_x, max_x = min(xs), max(xs)
+            min_y, max_y = min(ys), max(ys)
 
         margin = 5.0
-        return (min(xs) - margin, min(ys) - margin,
-                max(xs) + margin, max(ys) + margin)
+        return (min_x - margin, min_y - margin,
+                max_x + margin, max_y + margin)
 
     @property
     def outline(self):
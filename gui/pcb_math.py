@@ -0,0 +1,118 @@
+"""
+Numeric kernels for the PCB viewers, compiled with Numba when it is installed.
+Callers check HAS_NUMBA and otherwise use their pure-Python/NumPy paths.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def arc_points(sx, sy, mx, my, ex, ey, n):
+        """Interpolate an arc given start/mid/end into n line segments.
+        Returns an (n + 1, 2) array, or the three points if collinear."""
+        d = 2.0 * (sx * (my - ey) + mx * (ey - sy) + ex * (sy - my))
+        if abs(d) < 1e-12:
+            pts = np.empty((3, 2))
+            pts[0, 0], pts[0, 1] = sx, sy
+            pts[1, 0], pts[1, 1] = mx, my
+            pts[2, 0], pts[2, 1] = ex, ey
+            return pts
+
+        s2 = sx * sx + sy * sy
+        m2 = mx * mx + my * my
+        e2 = ex * ex + ey * ey
+        ux = (s2 * (my - ey) + m2 * (ey - sy) + e2 * (sy - my)) / d
+        uy = (s2 * (ex - mx) + m2 * (sx - ex) + e2 * (mx - sx)) / d
+        r = np.hypot(sx - ux, sy - uy)
+
+        tau = 2.0 * np.pi
+        a_start = np.arctan2(sy - uy, sx - ux)
+        a_start_n = a_start % tau
+        a_mid_n = np.arctan2(my - uy, mx - ux) % tau
+        a_end_n = np.arctan2(ey - uy, ex - ux) % tau
+
+        # Mid between start and end going CCW?
+        if a_start_n <= a_end_n:
+            ccw = a_start_n <= a_mid_n <= a_end_n
+        else:
+            ccw = a_mid_n >= a_start_n or a_mid_n <= a_end_n
+        sweep = a_end_n - a_start_n
+        if ccw and sweep <= 0:
+            sweep += tau
+        elif not ccw and sweep >= 0:
+            sweep -= tau
+
+        step_c = np.cos(sweep / n)
+        step_s = np.sin(sweep / n)
+        dx = r * np.cos(a_start)
+        dy = r * np.sin(a_start)
+        pts = np.empty((n + 1, 2))
+        for i in range(n + 1):
+            pts[i, 0] = ux + dx
+            pts[i, 1] = uy + dy
+            dx, dy = dx * step_c - dy * step_s, dx * step_s + dy * step_c
+        return pts
+
+    @njit(cache=True, fastmath=True)
+    def transform_points(xy, ox, oy, scale):
+        """Map an (N, 2) array of PCB coords to canvas pixels in one pass."""
+        out = np.empty_like(xy)
+        for i in range(xy.shape[0]):
+            out[i, 0] = (xy[i, 0] - ox) * scale
+            out[i, 1] = (xy[i, 1] - oy) * scale
+        return out
+
+    @njit(cache=True)
+    def chain_edges(starts, ends, eps):
+        """Chain edges end-to-end from edge 0, given (N, 2) endpoint arrays.
+        Endpoints match when closer than eps.
+
+        Returns the edge order and, per entry, whether that edge is walked
+        end-to-start. Stops early if no remaining edge touches the tail.
+        """
+        n = starts.shape[0]
+        used = np.zeros(n, np.bool_)
+        order = np.empty(n, np.int64)
+        flipped = np.zeros(n, np.bool_)
+        used[0] = True
+        order[0] = 0
+        count = 1
+        eps2 = eps * eps
+        tx = ends[0, 0]
+        ty = ends[0, 1]
+        while count < n:
+            found = -1
+            flip = False
+            for i in range(1, n):
+                if used[i]:
+                    continue
+                dx = tx - starts[i, 0]
+                dy = ty - starts[i, 1]
+                if dx * dx + dy * dy < eps2:
+                    found = i
+                    break
+                dx = tx - ends[i, 0]
+                dy = ty - ends[i, 1]
+                if dx * dx + dy * dy < eps2:
+                    found = i
+                    flip = True
+                    break
+            if found < 0:
+                break
+            used[found] = True
+            order[count] = found
+            flipped[count] = flip
+            count += 1
+            if flip:
+                tx = starts[found, 0]
+                ty = starts[found, 1]
+            else:
+                tx = ends[found, 0]
+                ty = ends[found, 1]
+        return order[:count], flipped[:count]
@@ -2,15 +2,46 @@
 2D PCB Layer Viewer — tkinter Canvas with zoom/pan and per-layer toggles.
 """
 
+import functools
 import math
 import tkinter as tk
 from tkinter import ttk
 from pcb_data import layer_color, LAYER_COLORS
+from pcb_math import HAS_NUMBA
 
+if HAS_NUMBA:
+    from pcb_math import arc_points, transform_points
 
-def _arc_points_from_3pt(sx, sy, mx, my, ex, ey, n=32):
-    """Interpolate an arc given start/mid/end into n line segments.
-    Returns list of (x, y) tuples."""
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from PIL import Image, ImageDraw, ImageTk
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+BACKGROUND = "#1a1a1a"
+
+# Arc tessellation: roughly this many pixels per chord, within these bounds
+ARC_PIXELS_PER_SEGMENT = 3.0
+ARC_MIN_SEGMENTS = 4
+ARC_MAX_SEGMENTS = 64
+
+# Items are drawn for the viewport plus this fraction of it on every side,
+# so short pans can move existing items; see _draw_all
+CULL_MARGIN = 0.5
+
+# Pads up to this size (px) are drawn as cached sprites when Pillow is present
+SPRITE_MAX_PX = 64
+
+
+def _arc_circle(sx, sy, mx, my, ex, ey):
+    """Fit the circle through an arc's start/mid/end.
+    Returns (cx, cy, r, a_start, sweep), or None if the points are collinear."""
     # Compute circle through three points
     ax, ay = sx, sy
     bx, by = mx, my
@@ -18,7 +49,7 @@ def _arc_points_from_3pt(sx, sy, mx, my, ex, ey, n=32):
 
     D = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
     if abs(D) < 1e-12:
-        return [(sx, sy), (mx, my), (ex, ey)]
+        return None
 
     ux = ((ax * ax + ay * ay) * (by - cy) +
           (bx * bx + by * by) * (cy - ay) +
@@ -33,16 +64,10 @@ def _arc_points_from_3pt(sx, sy, mx, my, ex, ey, n=32):
     a_end = math.atan2(cy - uy, cx - ux)
 
     # Determine sweep direction (CW or CCW)
-    def norm_angle(a):
-        while a < 0:
-            a += 2 * math.pi
-        while a >= 2 * math.pi:
-            a -= 2 * math.pi
-        return a
-
-    a_start_n = norm_angle(a_start)
-    a_mid_n = norm_angle(a_mid)
-    a_end_n = norm_angle(a_end)
+    tau = 2 * math.pi
+    a_start_n = a_start % tau
+    a_mid_n = a_mid % tau
+    a_end_n = a_end % tau
 
     # Check if mid is between start and end going CCW
     def between_ccw(s, m, e):
@@ -60,40 +85,234 @@ def _arc_points_from_3pt(sx, sy, mx, my, ex, ey, n=32):
         sweep = a_end_n - a_start_n
         if sweep >= 0:
             sweep -= 2 * math.pi
+    return ux, uy, r, a_start, sweep
+
+
+def _arc_segments(r, sweep, scale):
+    """Pick a segment count for an arc drawn at scale px/mm.
+
+    Rounded up to a power of two so nearby zoom levels share tessellations.
+    """
+    n = r * abs(sweep) * scale / ARC_PIXELS_PER_SEGMENT
+    if n <= ARC_MIN_SEGMENTS:
+        return ARC_MIN_SEGMENTS
+    return min(ARC_MAX_SEGMENTS, 1 << math.ceil(math.log2(n)))
 
+
+@functools.lru_cache(maxsize=4096)
+def _arc_points_from_3pt(sx, sy, mx, my, ex, ey, n=32):
+    """Interpolate an arc given start/mid/end into n line segments.
+    Returns a tuple of (x, y) tuples, cached since boards repeat arcs."""
+    circle = _arc_circle(sx, sy, mx, my, ex, ey)
+    if circle is None:
+        return ((sx, sy), (mx, my), (ex, ey))
+    ux, uy, r, a_start, sweep = circle
+
+    # Step the radius vector by a fixed rotation rather than calling
+    # cos/sin for every sample
+    step_c = math.cos(sweep / n)
+    step_s = math.sin(sweep / n)
+    dx = r * math.cos(a_start)
+    dy = r * math.sin(a_start)
     pts = []
-    for i in range(n + 1):
-        t = i / n
-        a = a_start + sweep * t
-        pts.append((ux + r * math.cos(a), uy + r * math.sin(a)))
-    return pts
-
-
-def _all_layer_names(pcb):
-    """Collect all unique layer names used in the PCB data."""
-    names = set()
-    # From layer defs
-    for l in pcb.layers:
-        if l.get("kicad_name"):
-            names.add(l["kicad_name"])
-    # From traces
-    for t in pcb.traces:
-        names.add(t["layer"])
-    # From graphics
-    for g in pcb.graphics:
-        if g.get("layer"):
-            names.add(g["layer"])
-    # From zones
-    for z in pcb.zones:
-        names.add(z["layer"])
-    # From footprint graphics
-    for fp in pcb.footprints.values():
-        for g in fp.get("graphics", []):
-            if g.get("layer"):
-                names.add(g["layer"])
-    # Always include Edge.Cuts
-    names.add("Edge.Cuts")
-    return sorted(names)
+    append = pts.append
+    for _ in range(n + 1):
+        append((ux + dx, uy + dy))
+        dx, dy = dx * step_c - dy * step_s, dx * step_s + dy * step_c
+    return tuple(pts)
+
+
+def _chain_segments(segments):
+    """Join segments that continue the previous one with the same key.
+
+    segments yields (key, x0, y0, x1, y1). Returns a list of (key, coords)
+    polylines, coords being a flat [x0, y0, x1, y1, ...] list, so each run
+    becomes one canvas item instead of one per segment.
+    """
+    open_runs = {}
+    runs = []
+    for key, x0, y0, x1, y1 in segments:
+        run = open_runs.get(key)
+        if run is not None and run[-2] == x0 and run[-1] == y0:
+            run += (x1, y1)
+        else:
+            run = [x0, y0, x1, y1]
+            open_runs[key] = run
+            runs.append((key, run))
+    return runs
+
+
+def _pack_runs(runs):
+    """Concatenate (key, coords) runs into one flat coordinate column.
+
+    Returns (flat, spans) where spans lists (key, start, stop, x0, y0, x1, y1):
+    a slice into the transformed flat list and the run's bounding box. With
+    NumPy, flat is an (N, 2) array so a whole batch is converted to canvas
+    space in one operation.
+    """
+    flat = []
+    spans = []
+    for key, coords in runs:
+        start = len(flat)
+        flat += coords
+        xs = coords[0::2]
+        ys = coords[1::2]
+        spans.append((key, start, len(flat), min(xs), min(ys), max(xs), max(ys)))
+    return _pairs(flat), spans
+
+
+def _pairs(flat):
+    """Return a flat [x0, y0, ...] list as an (N, 2) array when NumPy is present."""
+    if HAS_NUMPY:
+        return np.array(flat, dtype=np.float64).reshape(-1, 2)
+    return flat
+
+
+def _coords_str(coords):
+    """Format canvas coords as one Tcl list string, at 0.01 px precision.
+
+    Tk parses the string itself, which beats Tkinter converting every
+    float of a long polyline separately.
+    """
+    return " ".join(map("%.2f".__mod__, coords))
+
+
+@functools.lru_cache(maxsize=None)
+def _mirrored_layer(layer):
+    """Flip layer sides for mirrored components."""
+    return layer.replace("F.SilkS", "B.SilkS").replace("F.Fab", "B.Fab").replace("F.CrtYd", "B.CrtYd")
+
+
+def _footprint_extent(fp):
+    """Return the radius around a footprint's origin covering all its pads
+    and graphics, for culling whole components."""
+    extent = 0.0
+    for pad in fp.get("pads", []):
+        x, y = pad["offset"]
+        size = max(pad.get("width", 0), pad.get("height", 0))
+        extent = max(extent, math.hypot(x, y) + size)
+        for px, py in pad.get("custom_shape", []):
+            extent = max(extent, math.hypot(x, y) + math.hypot(px, py))
+    for gi in fp.get("graphics", []):
+        w = gi.get("width", 0.1)
+        kind = gi.get("kind", "")
+        if kind == "circle":
+            extent = max(extent, math.hypot(*gi["center"]) + gi.get("radius", 0) + w)
+        elif kind == "polygon":
+            for pt in gi.get("points", []):
+                extent = max(extent, math.hypot(*pt) + w)
+        elif kind in ("line", "arc"):
+            extent = max(extent, math.hypot(*gi["start"]) + w, math.hypot(*gi["end"]) + w)
+            if kind == "arc":
+                circle = _arc_circle(*gi["start"], *gi["center"], *gi["end"])
+                if circle:
+                    extent = max(extent, math.hypot(circle[0], circle[1]) + circle[2] + w)
+    return extent
+
+
+# Item families in stacking order, bottom to top; each is also a canvas tag
+DRAW_ORDER = ("zone", "outline", "traces", "trace_arcs", "graphics",
+              "fp_graphics", "pads", "drills", "vias")
+
+
+class _ItemStore:
+    """Canvas items kept across redraws, keyed by the primitive they show.
+
+    draw() moves a primitive's existing item, restyling it only if its
+    options changed, or gives it an item on first sight. finish() hides
+    items whose primitives were not drawn in that pass, e.g. culled ones,
+    and pools them by (kind, family) for reuse instead of deleting them.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._create = {"line": canvas.create_line,
+                        "polygon": canvas.create_polygon,
+                        "oval": canvas.create_oval,
+                        "rectangle": canvas.create_rectangle,
+                        "image": canvas.create_image}
+        self._items = {}  # key -> (item id, kind, options)
+        self._live = {}
+        self._pool = {}  # (kind, family) -> hidden item ids
+        self._created = 0
+
+    def draw(self, key, kind, coords, options):
+        if kind == "line" or kind == "polygon":
+            coords = _coords_str(coords)
+        entry = self._items.pop(key, None)
+        if entry is None:
+            # Items of one family share option names, so a pooled item is
+            # fully restyled by this family's options
+            pool = self._pool.get((kind, options["tags"][1]))
+            if pool:
+                item = pool.pop()
+                self.canvas.coords(item, coords)
+                self.canvas.itemconfigure(item, state=tk.NORMAL, **options)
+            else:
+                item = self._create[kind](coords, **options)
+            self._created += 1
+        else:
+            item, _, old = entry
+            self.canvas.coords(item, coords)
+            if old != options:
+                self.canvas.itemconfigure(
+                    item, **{k: v for k, v in options.items() if old.get(k) != v})
+        self._live[key] = (item, kind, options)
+
+    def finish(self):
+        """End a pass: pool items not drawn and restore the stacking order."""
+        canvas = self.canvas
+        for item, kind, options in self._items.values():
+            # Drop the layer tags so layer toggles leave pooled items hidden
+            canvas.itemconfigure(item, state=tk.HIDDEN, tags=("pool",))
+            self._pool.setdefault((kind, options["tags"][1]), []).append(item)
+        if 0 < self._created < len(self._live):
+            # New items went on top of kept ones; put each family back in place
+            for family in DRAW_ORDER:
+                canvas.tag_raise(family)
+        self._items = self._live
+        self._live = {}
+        self._created = 0
+
+    def set_state(self, state):
+        """Hide or show the items of the last pass, keeping them for reuse."""
+        configure = self.canvas.itemconfigure
+        for item, _, _ in self._items.values():
+            configure(item, state=state)
+
+
+class _ImageCanvas:
+    """Stand-in for _ItemStore that paints onto a PIL image instead.
+
+    Lets the regular _draw_* methods render an offscreen bitmap. Items
+    tagged with a hidden layer are skipped; stippled fills are drawn as
+    outlines only.
+    """
+
+    def __init__(self, image, hidden_tags):
+        self._image_draw = ImageDraw.Draw(image)
+        self._hidden = hidden_tags
+
+    def draw(self, key, kind, coords, options):
+        if any(t in self._hidden for t in options.get("tags", ())):
+            return
+        fill = options.get("fill") or None
+        outline = options.get("outline") or None
+        d = self._image_draw
+        if kind == "line":
+            if fill:
+                d.line(list(coords), fill=fill,
+                       width=max(1, round(options.get("width", 1))), joint="curve")
+        elif kind == "polygon":
+            d.polygon(list(coords), fill=None if options.get("stipple") else fill,
+                      outline=outline)
+        elif kind == "oval":
+            d.ellipse(list(coords), fill=fill, outline=outline)
+        else:
+            d.rectangle(list(coords), fill=fill, outline=outline)
+
+    def finish(self):
+        pass
 
 
 class PcbViewer2D(tk.Toplevel):
@@ -109,12 +328,182 @@ class PcbViewer2D(tk.Toplevel):
         self.scale = 1.0
         self.offset_x = 0.0
         self.offset_y = 0.0
-        self.layer_vars = {}  # layer_name -> BooleanVar
+        self.layer_names = []  # rows of the layer Listbox; selected = shown
+        self._arc_cache = {}  # (sx, sy, mx, my, ex, ey, zoom level) -> flat points
+        self._arc_packs = {}  # (name, zoom level) -> _pack_runs result
+        self._styles = {}  # (layer name, family) -> (tags, color)
+        self._redraw_job = None
+        self._resize_job = None
+        self._zoom_job = None
+        # Zones are drawn unfilled while panning/zooming; see _begin_interaction
+        self._interactive = False
+        self._settle_job = None
+        # Offscreen render shown in place of the items while zooming
+        self._bitmap = None  # (image, scale, offset_x, offset_y)
+        self._bitmap_tk = None
+        self._sprites = {}  # (kind, w, h, drill, color) -> PhotoImage
+        self._sprite_level = None
+        self._prepare_geometry()
 
         self._build_ui()
+        # Canvas items persist across redraws; _target is what _draw_* use
+        self._items = _ItemStore(self.canvas)
+        self._target = self._items
         self._draw_all()
+        self._items.finish()
         self.after(100, self._fit_view)
 
+    def _prepare_geometry(self):
+        """Precompute view-independent geometry in PCB coords.
+
+        The board never changes while the viewer is open, so only the
+        canvas transform has to be redone on each redraw.
+        """
+        pcb = self.pcb
+        # Connected segments become polylines, keyed by (layer index, width)
+        self._trace_xy, self._trace_spans = _pack_runs(_chain_segments(zip(
+            zip(pcb.trace_layer.tolist(), pcb.trace_width.tolist()),
+            pcb.trace_x0.tolist(), pcb.trace_y0.tolist(),
+            pcb.trace_x1.tolist(), pcb.trace_y1.tolist())))
+        self._outline_runs = _chain_segments(
+            (seg["width"], *seg["start"], *seg["end"])
+            for seg in pcb.outline.get("segments", []))
+        # Arcs are tessellated once per zoom level; see _packed_arcs
+        self._outline_arcs = [(a["width"], (*a["start"], *a["mid"], *a["end"]))
+                              for a in pcb.outline.get("arcs", [])]
+        self._trace_arcs = [((a["layer"], a["width"]), (*a["start"], *a["mid"], *a["end"]))
+                            for a in pcb.trace_arcs]
+        # Zone outlines, keyed by layer
+        self._zone_xy, self._zone_spans = _pack_runs(
+            (z["layer"], [v for pt in z["outline"] for v in pt])
+            for z in pcb.zones if len(z.get("outline", [])) >= 3)
+        self._zone_layers = {span[0] for span in self._zone_spans}
+
+        # Culling slack for stroked items: the widest stroke's half width
+        self._cull_pad = max(
+            [w for (_, w), *_ in self._trace_spans] +
+            [w for (_, w), _ in self._trace_arcs] +
+            [w for w, _ in self._outline_arcs] + [0.0]) / 2
+        self._fp_extent = {name: _footprint_extent(fp)
+                           for name, fp in pcb.footprints.items()}
+        # Per-component rotation as (cos, sin) of the canvas-space angle
+        self._comp_rotation = [
+            (math.cos(math.radians(-r)), math.sin(math.radians(-r)))
+            for r in (c.get("rotation", 0) for c in pcb.components)]
+        self._bake_pads()
+
+    def _bake_pads(self):
+        """Place every pad in board coords, grouped by drawing kind and layer.
+
+        Sets _pad_groups to (kind, layer, xy, half, drill) lists, where xy
+        holds pad centers, half the half-width/half-height pairs and drill
+        each pad's drill radius. Custom pad polygons are packed separately,
+        and their drills kept in _drill_groups as (layer, xy, half).
+        """
+        groups = {}  # (kind, layer) -> ([x, y, ...], [hw, hh, ...], [drill r, ...])
+        drills = {}  # layer -> ([x, y, ...], [r, r, ...]), custom pads only
+        custom = []  # (layer, [x, y, ...])
+        footprints = self.pcb.footprints
+        for comp in self.pcb.components:
+            fp = footprints.get(comp["footprint_ref"])
+            if not fp:
+                continue
+            comp_x, comp_y = comp["position"]
+            comp_rot = comp.get("rotation", 0)
+            mirror = comp.get("mirror", False)
+            rad = math.radians(-comp_rot)
+            cos_r = math.cos(rad)
+            sin_r = math.sin(rad)
+
+            for pad in fp.get("pads", []):
+                pad_x, pad_y = pad["offset"]
+                world_x = comp_x + pad_x * cos_r - pad_y * sin_r
+                world_y = comp_y + pad_x * sin_r + pad_y * cos_r
+
+                # Determine layer
+                pad_type = pad.get("type", "smd")
+                if pad_type == "thru_hole" or pad_type == "npth":
+                    layer = "F.Cu"
+                elif mirror:
+                    layer = "B.Cu"
+                else:
+                    layer = "F.Cu"
+
+                shape = pad.get("shape", "rect")
+                hw = pad["width"] / 2
+                if shape == "custom":
+                    drill = pad.get("drill_diameter", 0)
+                    if drill > 0:
+                        xy, half = drills.setdefault(layer, ([], []))
+                        xy += (world_x, world_y)
+                        half += (drill / 2, drill / 2)
+                    pts = pad.get("custom_shape", [])
+                    if len(pts) >= 3:
+                        rad_p = math.radians(-(comp_rot + pad.get("rotation", 0)))
+                        cp = math.cos(rad_p)
+                        sp = math.sin(rad_p)
+                        custom.append((layer, [
+                            v for ppx, ppy in pts
+                            for v in (world_x + ppx * cp - ppy * sp,
+                                      world_y + ppx * sp + ppy * cp)]))
+                else:
+                    # rect / roundrect / trapezoid are drawn as rectangles
+                    kind = "oval" if shape in ("circle", "oval") else "rectangle"
+                    hh = hw if shape == "circle" else pad["height"] / 2
+                    xy, half, drill_r = groups.setdefault((kind, layer), ([], [], []))
+                    xy += (world_x, world_y)
+                    half += (hw, hh)
+                    drill_r.append(pad.get("drill_diameter", 0) / 2)
+
+        self._pad_groups = [(kind, layer, _pairs(xy), _pairs(half), drill_r)
+                            for (kind, layer), (xy, half, drill_r) in groups.items()]
+        self._drill_groups = [(layer, _pairs(xy), _pairs(half))
+                              for layer, (xy, half) in drills.items()]
+        self._pad_custom_xy, self._pad_custom_spans = _pack_runs(custom)
+
+    def _zoom_level(self):
+        """Current scale rounded to a power of two, for tessellation caches."""
+        return round(math.log2(self.scale))
+
+    def _arc_coords(self, sx, sy, mx, my, ex, ey):
+        """Tessellate an arc for the current zoom as a flat [x0, y0, ...] list.
+
+        The segment count follows the arc's size on screen. Results are
+        memoized per zoom level; footprint arcs repeat across every
+        placement of a footprint, so the cache is shared by all of them.
+        """
+        level = self._zoom_level()
+        key = (sx, sy, mx, my, ex, ey, level)
+        coords = self._arc_cache.get(key)
+        if coords is None:
+            circle = _arc_circle(sx, sy, mx, my, ex, ey)
+            n = _arc_segments(circle[2], circle[4], 2.0 ** level) if circle else 2
+            if HAS_NUMBA:
+                coords = arc_points(sx, sy, mx, my, ex, ey, n).ravel().tolist()
+            else:
+                coords = [v for pt in _arc_points_from_3pt(sx, sy, mx, my, ex, ey, n)
+                          for v in pt]
+            self._arc_cache[key] = coords
+        return coords
+
+    def _packed_arcs(self, name, arcs):
+        """Return _pack_runs of (key, points) arcs tessellated for this zoom."""
+        pack_key = (name, self._zoom_level())
+        pack = self._arc_packs.get(pack_key)
+        if pack is None:
+            arc = self._arc_coords
+            pack = self._arc_packs[pack_key] = _pack_runs(
+                (key, arc(*pts)) for key, pts in arcs)
+        return pack
+
+    def _style(self, layer, family):
+        """Return the canvas (tags, color) for a layer's items of a family."""
+        key = (layer, family)
+        style = self._styles.get(key)
+        if style is None:
+            style = self._styles[key] = ((f"layer_{layer}", family), layer_color(layer))
+        return style
+
     # ------------------------------------------------------------------ UI
 
     def _build_ui(self):
@@ -135,36 +524,28 @@ class PcbViewer2D(tk.Toplevel):
         ttk.Button(btn_frame, text="All Off", command=self._layers_all_off).pack(
             side=tk.LEFT, expand=True, fill=tk.X, padx=1)
 
-        # Scrollable layer list
-        canvas_frame = ttk.Frame(left)
-        canvas_frame.pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
-
-        layer_canvas = tk.Canvas(canvas_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL,
-                                  command=layer_canvas.yview)
-        self.layer_list_frame = ttk.Frame(layer_canvas)
+        # Layer list: one Listbox row per layer, selected rows are shown
+        list_frame = ttk.Frame(left)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
 
-        self.layer_list_frame.bind(
-            "<Configure>",
-            lambda e: layer_canvas.configure(scrollregion=layer_canvas.bbox("all"))
-        )
-        layer_canvas.create_window((0, 0), window=self.layer_list_frame, anchor="nw")
-        layer_canvas.configure(yscrollcommand=scrollbar.set)
+        self.layer_list = tk.Listbox(
+            list_frame, selectmode=tk.MULTIPLE, exportselection=False,
+            activestyle="none", bg="#222222", selectbackground="#444444",
+            highlightthickness=0)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL,
+                                  command=self.layer_list.yview)
+        self.layer_list.configure(yscrollcommand=scrollbar.set)
 
-        layer_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.layer_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        layer_names = _all_layer_names(self.pcb)
-        for name in layer_names:
-            var = tk.BooleanVar(value=True)
-            self.layer_vars[name] = var
+        self.layer_names = self.pcb.board_layers
+        self.layer_list.insert(tk.END, *self.layer_names)
+        for i, name in enumerate(self.layer_names):
             color = layer_color(name)
-            cb = tk.Checkbutton(
-                self.layer_list_frame, text=name, variable=var,
-                fg=color, selectcolor="#222222", activeforeground=color,
-                anchor="w", command=self._on_layer_toggle
-            )
-            cb.pack(fill=tk.X, padx=2)
+            self.layer_list.itemconfigure(i, fg=color, selectforeground=color)
+        self.layer_list.selection_set(0, tk.END)
+        self.layer_list.bind("<<ListboxSelect>>", lambda e: self._on_layer_toggle())
 
         # --- Right: canvas + toolbar ---
         right = ttk.Frame(pw)
@@ -184,7 +565,7 @@ class PcbViewer2D(tk.Toplevel):
         ttk.Label(tb, textvariable=self.coord_var).pack(side=tk.RIGHT, padx=6)
 
         # Canvas
-        self.canvas = tk.Canvas(right, bg="#1a1a1a", highlightthickness=0)
+        self.canvas = tk.Canvas(right, bg=BACKGROUND, highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
         # Bindings
@@ -196,25 +577,28 @@ class PcbViewer2D(tk.Toplevel):
         self.canvas.bind("<ButtonPress-3>", self._on_pan_start)
         self.canvas.bind("<B3-Motion>", self._on_pan_move)
         self.canvas.bind("<Motion>", self._on_mouse_move)
-        self.canvas.bind("<Configure>", lambda e: self.after(50, self._redraw))
+        self.canvas.bind("<Configure>", self._on_configure)
 
     # -------------------------------------------------------------- Layers
 
     def _layers_all_on(self):
-        for v in self.layer_vars.values():
-            v.set(True)
+        self.layer_list.selection_set(0, tk.END)
         self._on_layer_toggle()
 
     def _layers_all_off(self):
-        for v in self.layer_vars.values():
-            v.set(False)
+        self.layer_list.selection_clear(0, tk.END)
         self._on_layer_toggle()
 
+    def _hidden_layers(self):
+        """Return the names of the layers not selected in the layer list."""
+        shown = set(self.layer_list.curselection())
+        return [name for i, name in enumerate(self.layer_names) if i not in shown]
+
     def _on_layer_toggle(self):
-        for name, var in self.layer_vars.items():
-            tag = f"layer_{name}"
-            state = tk.NORMAL if var.get() else tk.HIDDEN
-            self.canvas.itemconfigure(tag, state=state)
+        hidden = set(self._hidden_layers())
+        for name in self.layer_names:
+            state = tk.HIDDEN if name in hidden else tk.NORMAL
+            self.canvas.itemconfigure(f"layer_{name}", state=state)
 
     # -------------------------------------------------------- Coord system
 
@@ -224,6 +608,53 @@ class PcbViewer2D(tk.Toplevel):
         cy = (py - self.offset_y) * self.scale
         return cx, cy
 
+    def _coords_to_canvas(self, coords):
+        """Convert a flat [x0, y0, x1, y1, ...] PCB list to canvas pixels."""
+        scale = self.scale
+        ox = self.offset_x
+        oy = self.offset_y
+        out = [0.0] * len(coords)
+        out[0::2] = [(x - ox) * scale for x in coords[0::2]]
+        out[1::2] = [(y - oy) * scale for y in coords[1::2]]
+        return out
+
+    def _packed_to_canvas(self, flat):
+        """Convert a column built by _pack_runs to a flat canvas list."""
+        if HAS_NUMBA:
+            return transform_points(flat, self.offset_x, self.offset_y,
+                                    self.scale).ravel().tolist()
+        if HAS_NUMPY:
+            return ((flat - (self.offset_x, self.offset_y)) * self.scale).ravel().tolist()
+        return self._coords_to_canvas(flat)
+
+    def _boxes_to_canvas(self, xy, half):
+        """Return canvas (x0, y0, x1, y1) boxes for centers xy and half-sizes,
+        skipping those outside the drawn view, and the kept indices."""
+        scale = self.scale
+        ox = self.offset_x
+        oy = self.offset_y
+        vx0, vy0, vx1, vy1 = self._drawn_view
+        if HAS_NUMPY:
+            lo = xy - half
+            hi = xy + half
+            keep = ((hi[:, 0] >= vx0) & (lo[:, 0] <= vx1) &
+                    (hi[:, 1] >= vy0) & (lo[:, 1] <= vy1))
+            return np.flatnonzero(keep).tolist(), np.hstack((
+                (lo[keep] - (ox, oy)) * scale, (hi[keep] - (ox, oy)) * scale)).tolist()
+        indices = []
+        boxes = []
+        for i in range(0, len(xy), 2):
+            x = xy[i]
+            y = xy[i + 1]
+            hw = half[i]
+            hh = half[i + 1]
+            if x + hw < vx0 or x - hw > vx1 or y + hh < vy0 or y - hh > vy1:
+                continue
+            indices.append(i // 2)
+            boxes.append(((x - hw - ox) * scale, (y - hh - oy) * scale,
+                          (x + hw - ox) * scale, (y + hh - oy) * scale))
+        return indices, boxes
+
     def _canvas_to_pcb(self, cx, cy):
         """Convert canvas pixels to PCB coords (mm)."""
         px = cx / self.scale + self.offset_x
@@ -261,12 +692,97 @@ class PcbViewer2D(tk.Toplevel):
             cy = self.canvas.winfo_height() / 2
 
         # Zoom centered on cursor
+        self._pre_zoom_view = (self.scale, self.offset_x, self.offset_y)
         px, py = self._canvas_to_pcb(cx, cy)
         self.scale *= factor
         self.offset_x = px - cx / self.scale
         self.offset_y = py - cy / self.scale
+
+        self._begin_interaction()
+        # Preview the zoom right away; the full redraw (line widths, arcs)
+        # waits until the zooming pauses
+        if HAS_PIL:
+            self._show_bitmap_preview()
+        else:
+            self.canvas.scale("all", cx, cy, factor, factor)
+        if self._zoom_job is not None:
+            self.after_cancel(self._zoom_job)
+        self._zoom_job = self.after(80, self._zoom_done)
+
+    def _render_to_image(self, width, height):
+        """Render the current view, visible layers only, to a PIL image."""
+        image = Image.new("RGB", (width, height), BACKGROUND)
+        hidden = {f"layer_{name}" for name in self._hidden_layers()}
+        target = self._target
+        self._target = _ImageCanvas(image, hidden)
+        try:
+            self._draw_all(width, height)
+        finally:
+            self._target = target
+        return image
+
+    def _show_bitmap_preview(self):
+        """Cover the canvas items with one resampled image of the board.
+
+        The view is rendered once at the start of a zoom gesture; later
+        zoom steps only resample that image until _do_redraw runs.
+        """
+        cw = self.canvas.winfo_width()
+        ch = self.canvas.winfo_height()
+        if self._bitmap is None:
+            # Render at the view as it was before this zoom step
+            scale, ox, oy = self.scale, self.offset_x, self.offset_y
+            self.scale, self.offset_x, self.offset_y = self._pre_zoom_view
+            try:
+                image = self._render_to_image(cw, ch)
+            finally:
+                self.scale, self.offset_x, self.offset_y = scale, ox, oy
+            self._bitmap = (image, *self._pre_zoom_view)
+            # Hide rather than delete the items so _do_redraw can reuse them
+            self._items.set_state(tk.HIDDEN)
+            self.canvas.create_image(0, 0, anchor="nw", tags=("bitmap",))
+            self.canvas.tag_raise("bitmap")
+
+        image, s0, ox0, oy0 = self._bitmap
+        # Output pixel (x, y) samples the source at (k*x + dx, k*y + dy)
+        k = s0 / self.scale
+        preview = image.transform(
+            (cw, ch), Image.AFFINE,
+            (k, 0, (self.offset_x - ox0) * s0, 0, k, (self.offset_y - oy0) * s0),
+            resample=Image.NEAREST, fillcolor=BACKGROUND)
+        self._bitmap_tk = ImageTk.PhotoImage(preview)
+        self.canvas.coords("bitmap", 0, 0)
+        self.canvas.itemconfigure("bitmap", image=self._bitmap_tk)
+
+    def _on_configure(self, event):
+        # A window drag sends a stream of Configure events; redraw once at the end
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(50, self._resize_done)
+
+    def _resize_done(self):
+        self._resize_job = None
+        self._redraw()
+
+    def _zoom_done(self):
+        self._zoom_job = None
         self._redraw()
 
+    def _begin_interaction(self):
+        """Drop the stippled zone fill until panning/zooming settles."""
+        if not self._interactive:
+            self._interactive = True
+            self.canvas.itemconfigure("zone", fill="")
+        if self._settle_job is not None:
+            self.after_cancel(self._settle_job)
+        self._settle_job = self.after(200, self._end_interaction)
+
+    def _end_interaction(self):
+        self._settle_job = None
+        self._interactive = False
+        for layer in self._zone_layers:
+            self.canvas.itemconfigure(f"zone_{layer}", fill=layer_color(layer))
+
     def _on_mousewheel(self, event):
         factor = 1.15 if event.delta > 0 else 1 / 1.15
         self._zoom(factor, event.x, event.y)
@@ -287,7 +803,16 @@ class PcbViewer2D(tk.Toplevel):
         self._pan_sy = event.y
         self.offset_x -= dx / self.scale
         self.offset_y -= dy / self.scale
-        self._redraw()
+        self._begin_interaction()
+        # Panning doesn't change the geometry, so shift the existing items,
+        # until the view leaves the area that was drawn
+        self.canvas.move("all", dx, dy)
+        vx0, vy0 = self._canvas_to_pcb(0, 0)
+        vx1, vy1 = self._canvas_to_pcb(self.canvas.winfo_width(),
+                                       self.canvas.winfo_height())
+        dx0, dy0, dx1, dy1 = self._drawn_view
+        if vx0 < dx0 or vy0 < dy0 or vx1 > dx1 or vy1 > dy1:
+            self._redraw()
 
     def _on_mouse_move(self, event):
         px, py = self._canvas_to_pcb(event.x, event.y)
@@ -296,13 +821,44 @@ class PcbViewer2D(tk.Toplevel):
     # ------------------------------------------------------------- Drawing
 
     def _redraw(self):
-        self.canvas.delete("all")
+        """Schedule a redraw; bursts of pan/zoom events coalesce into one."""
+        if self._redraw_job is not None:
+            return
+        self._redraw_job = self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_job = None
+        preview = self._bitmap is not None
+        if preview:
+            self._bitmap = None
+            self._bitmap_tk = None
+            self.canvas.delete("bitmap")
         self._draw_all()
+        self._items.finish()
+        if preview:
+            # Bring back the items hidden by _show_bitmap_preview
+            self._items.set_state(tk.NORMAL)
         # Reapply layer visibility
         self._on_layer_toggle()
 
-    def _draw_all(self):
-        """Draw every PCB element, tagged by layer."""
+    def _draw_all(self, width=None, height=None):
+        """Draw every PCB element in view, tagged by layer.
+
+        Anything outside the canvas (width x height px) plus CULL_MARGIN
+        on each side is skipped; _drawn_view keeps that area in PCB coords.
+        """
+        if width is None:
+            width = self.canvas.winfo_width()
+            height = self.canvas.winfo_height()
+        if width < 10 or height < 10:
+            # Not mapped yet; draw everything
+            self._drawn_view = (-math.inf, -math.inf, math.inf, math.inf)
+        else:
+            mx = width * CULL_MARGIN
+            my = height * CULL_MARGIN
+            self._drawn_view = (*self._canvas_to_pcb(-mx, -my),
+                                *self._canvas_to_pcb(width + mx, height + my))
+
         self._draw_zones()
         self._draw_outline()
         self._draw_traces()
@@ -312,249 +868,269 @@ class PcbViewer2D(tk.Toplevel):
         self._draw_pads()
         self._draw_vias()
 
+    def _cull_view(self):
+        """The drawn view grown by the widest stroke, for culling by geometry."""
+        vx0, vy0, vx1, vy1 = self._drawn_view
+        pad = self._cull_pad
+        return vx0 - pad, vy0 - pad, vx1 + pad, vy1 + pad
+
     def _draw_outline(self):
-        tag = "layer_Edge.Cuts"
-        color = layer_color("Edge.Cuts")
-
-        for seg in self.pcb.outline.get("segments", []):
-            x0, y0 = self._pcb_to_canvas(*seg["start"])
-            x1, y1 = self._pcb_to_canvas(*seg["end"])
-            w = max(1, seg["width"] * self.scale)
-            self.canvas.create_line(x0, y0, x1, y1, fill=color, width=w,
-                                    tags=(tag,))
-
-        for arc in self.pcb.outline.get("arcs", []):
-            pts = _arc_points_from_3pt(
-                *arc["start"], *arc["mid"], *arc["end"])
-            coords = []
-            for px, py in pts:
-                cx, cy = self._pcb_to_canvas(px, py)
-                coords.extend([cx, cy])
-            if len(coords) >= 4:
-                w = max(1, arc["width"] * self.scale)
-                self.canvas.create_line(coords, fill=color, width=w,
-                                        smooth=False, tags=(tag,))
+        tags, color = self._style("Edge.Cuts", "outline")
+        draw = self._target.draw
+        to_canvas = self._coords_to_canvas
+        scale = self.scale
+
+        for i, (width, coords) in enumerate(self._outline_runs):
+            draw(("outline", i), "line", to_canvas(coords),
+                 {"fill": color, "width": max(1, width * scale), "tags": tags})
+
+        arc_xy, arc_spans = self._packed_arcs("outline", self._outline_arcs)
+        coords = self._packed_to_canvas(arc_xy)
+        vx0, vy0, vx1, vy1 = self._cull_view()
+        for i, (width, start, stop, x0, y0, x1, y1) in enumerate(arc_spans):
+            if x1 < vx0 or x0 > vx1 or y1 < vy0 or y0 > vy1:
+                continue
+            draw(("outline_arc", i), "line", coords[start:stop],
+                 {"fill": color, "width": max(1, width * scale), "tags": tags})
 
     def _draw_traces(self):
-        for t in self.pcb.traces:
-            layer = t["layer"]
-            tag = f"layer_{layer}"
-            color = layer_color(layer)
-            x0, y0 = self._pcb_to_canvas(*t["start"])
-            x1, y1 = self._pcb_to_canvas(*t["end"])
-            w = max(1, t["width"] * self.scale)
-            self.canvas.create_line(x0, y0, x1, y1, fill=color, width=w,
-                                    capstyle=tk.ROUND, tags=(tag,))
+        pcb = self.pcb
+        # Per-layer tags and colors, indexed by the interned trace_layer column
+        tags = [(f"layer_{name}", "traces") for name in pcb.layer_names]
+        colors = pcb.layer_colors
+        draw = self._target.draw
+        scale = self.scale
+        coords = self._packed_to_canvas(self._trace_xy)
+        vx0, vy0, vx1, vy1 = self._cull_view()
+        for i, ((li, width), start, stop, x0, y0, x1, y1) in enumerate(self._trace_spans):
+            if x1 < vx0 or x0 > vx1 or y1 < vy0 or y0 > vy1:
+                continue
+            draw(("trace", i), "line", coords[start:stop],
+                 {"fill": colors[li], "width": max(1, width * scale),
+                  "capstyle": tk.ROUND, "tags": tags[li]})
 
     def _draw_trace_arcs(self):
-        for a in self.pcb.trace_arcs:
-            layer = a["layer"]
-            tag = f"layer_{layer}"
-            color = layer_color(layer)
-            pts = _arc_points_from_3pt(
-                *a["start"], *a["mid"], *a["end"])
-            coords = []
-            for px, py in pts:
-                cx, cy = self._pcb_to_canvas(px, py)
-                coords.extend([cx, cy])
-            if len(coords) >= 4:
-                w = max(1, a["width"] * self.scale)
-                self.canvas.create_line(coords, fill=color, width=w,
-                                        capstyle=tk.ROUND, smooth=False,
-                                        tags=(tag,))
+        draw = self._target.draw
+        scale = self.scale
+        arc_xy, arc_spans = self._packed_arcs("traces", self._trace_arcs)
+        coords = self._packed_to_canvas(arc_xy)
+        style = self._style
+        vx0, vy0, vx1, vy1 = self._cull_view()
+        for i, ((layer, width), start, stop, x0, y0, x1, y1) in enumerate(arc_spans):
+            if x1 < vx0 or x0 > vx1 or y1 < vy0 or y0 > vy1:
+                continue
+            tags, color = style(layer, "trace_arcs")
+            draw(("trace_arc", i), "line", coords[start:stop],
+                 {"fill": color, "width": max(1, width * scale),
+                  "capstyle": tk.ROUND, "tags": tags})
 
     def _draw_vias(self):
         via_color = "#C0C0C0"
         drill_color = "#1a1a1a"
-        for v in self.pcb.vias:
-            px, py = v["position"]
-            cx, cy = self._pcb_to_canvas(px, py)
-            r_outer = v["diameter"] / 2 * self.scale
-            r_drill = v["drill"] / 2 * self.scale
-            # Use F.Cu tag so vias show with copper
-            tag = "layer_F.Cu"
-            if r_outer >= 1:
-                self.canvas.create_oval(cx - r_outer, cy - r_outer,
-                                        cx + r_outer, cy + r_outer,
-                                        fill=via_color, outline=via_color,
-                                        tags=(tag,))
-            if r_drill >= 0.5:
-                self.canvas.create_oval(cx - r_drill, cy - r_drill,
-                                        cx + r_drill, cy + r_drill,
-                                        fill=drill_color, outline=drill_color,
-                                        tags=(tag,))
+        # Use F.Cu tag so vias show with copper
+        tags = ("layer_F.Cu", "vias")
+        via_options = {"fill": via_color, "outline": via_color, "tags": tags}
+        drill_options = {"fill": drill_color, "outline": drill_color, "tags": tags}
+        dot_options = {"fill": via_color, "width": 1, "tags": tags}
+        draw = self._target.draw
+        pcb = self.pcb
+        scale = self.scale
+        ox = self.offset_x
+        oy = self.offset_y
+        half = scale / 2
+        vx0, vy0, vx1, vy1 = self._drawn_view
+        for i, (px, py, diameter, drill) in enumerate(zip(
+                pcb.via_x.tolist(), pcb.via_y.tolist(),
+                pcb.via_diameter.tolist(), pcb.via_drill.tolist())):
+            if px < vx0 - diameter or px > vx1 + diameter or \
+                    py < vy0 - diameter or py > vy1 + diameter:
+                continue
+            cx = (px - ox) * scale
+            cy = (py - oy) * scale
+            r_outer = diameter * half
+            r_drill = drill * half
+            if r_outer < 1:
+                continue
+            if r_outer < 2:
+                # Too small to show the hole; a one-pixel dot stands in
+                draw(("via_dot", i), "line", (cx, cy, cx + 1, cy + 1), dot_options)
+                continue
+            draw(("via", i), "oval",
+                 (cx - r_outer, cy - r_outer, cx + r_outer, cy + r_outer),
+                 via_options)
+            if r_drill >= 1:
+                draw(("via_drill", i), "oval",
+                     (cx - r_drill, cy - r_drill, cx + r_drill, cy + r_drill),
+                     drill_options)
 
     def _draw_zones(self):
-        for z in self.pcb.zones:
-            layer = z["layer"]
-            tag = f"layer_{layer}"
-            color = layer_color(layer)
-            pts = z.get("outline", [])
-            if len(pts) < 3:
+        draw = self._target.draw
+        coords = self._packed_to_canvas(self._zone_xy)
+        # Stippled fills are slow to render, so they wait for _end_interaction
+        interactive = self._interactive
+        vx0, vy0, vx1, vy1 = self._drawn_view
+        for i, (layer, start, stop, x0, y0, x1, y1) in enumerate(self._zone_spans):
+            if x1 < vx0 or x0 > vx1 or y1 < vy0 or y0 > vy1:
                 continue
-            coords = []
-            for pt in pts:
-                cx, cy = self._pcb_to_canvas(*pt)
-                coords.extend([cx, cy])
-            self.canvas.create_polygon(coords, fill=color, outline=color,
-                                       stipple="gray25", tags=(tag,))
+            tags, color = self._style(layer, "zone")
+            draw(("zone", i), "polygon", coords[start:stop],
+                 {"fill": "" if interactive else color, "outline": color,
+                  "stipple": "gray25", "tags": tags + (f"zone_{layer}",)})
 
     def _draw_graphics(self):
-        for gi in self.pcb.graphics:
-            self._draw_graphic_item(gi)
+        for i, gi in enumerate(self.pcb.graphics):
+            self._draw_graphic_item(("graphic", i), "graphics", gi)
 
     def _draw_footprint_graphics(self):
         """Draw graphics from each footprint instance at its placed position."""
-        for comp in self.pcb.components:
+        footprints = self.pcb.footprints
+        extents = self._fp_extent
+        draw_item = self._draw_graphic_item
+        rotations = self._comp_rotation
+        vx0, vy0, vx1, vy1 = self._drawn_view
+        for ci, comp in enumerate(self.pcb.components):
             fp_name = comp["footprint_ref"]
-            fp = self.pcb.footprints.get(fp_name)
+            fp = footprints.get(fp_name)
             if not fp:
                 continue
             cx, cy = comp["position"]
-            rot = comp.get("rotation", 0)
+            r = extents[fp_name]
+            if cx + r < vx0 or cx - r > vx1 or cy + r < vy0 or cy - r > vy1:
+                continue
+            cos_r, sin_r = rotations[ci]
             mirror = comp.get("mirror", False)
-            for gi in fp.get("graphics", []):
-                self._draw_graphic_item(gi, cx, cy, rot, mirror)
-
-    def _draw_graphic_item(self, gi, comp_x=0, comp_y=0, comp_rot=0, mirror=False):
+            for gi_index, gi in enumerate(fp.get("graphics", [])):
+                draw_item(("fp_graphic", ci, gi_index), "fp_graphics",
+                          gi, cx, cy, cos_r, sin_r, mirror)
+
+    def _draw_graphic_item(self, key, family, gi, comp_x=0, comp_y=0,
+                           cos_r=1.0, sin_r=0.0, mirror=False):
+        """Draw one graphic, placed at (comp_x, comp_y) and rotated by the
+        component rotation given as its (cos_r, sin_r)."""
         layer = gi.get("layer", "")
         if mirror:
-            # Flip layer sides for mirrored components
-            layer = layer.replace("F.SilkS", "B.SilkS").replace("F.Fab", "B.Fab").replace("F.CrtYd", "B.CrtYd")
-        tag = f"layer_{layer}"
-        color = layer_color(layer)
+            layer = _mirrored_layer(layer)
+        tags, color = self._style(layer, family)
         kind = gi.get("kind", "")
+        draw = self._target.draw
+        scale = self.scale
+
+        # Rotate, place at the component, then convert to canvas, with the
+        # rotation and view folded into one affine map
+        cos_s = cos_r * scale
+        sin_s = sin_r * scale
+        tx = (comp_x - self.offset_x) * scale
+        ty = (comp_y - self.offset_y) * scale
 
         def transform(px, py):
             """Apply component transform then convert to canvas."""
-            if comp_rot != 0:
-                rad = math.radians(-comp_rot)
-                rx = px * math.cos(rad) - py * math.sin(rad)
-                ry = px * math.sin(rad) + py * math.cos(rad)
-                px, py = rx, ry
-            return self._pcb_to_canvas(px + comp_x, py + comp_y)
+            return px * cos_s - py * sin_s + tx, px * sin_s + py * cos_s + ty
 
         if kind == "line":
-            x0, y0 = transform(*gi["start"])
-            x1, y1 = transform(*gi["end"])
-            w = max(1, gi.get("width", 0.1) * self.scale)
-            self.canvas.create_line(x0, y0, x1, y1, fill=color, width=w,
-                                    tags=(tag,))
+            w = max(1, gi.get("width", 0.1) * scale)
+            draw(key, "line", (*transform(*gi["start"]), *transform(*gi["end"])),
+                 {"fill": color, "width": w, "tags": tags})
         elif kind == "arc":
             # Use start/center(mid)/end from JSON
-            pts = _arc_points_from_3pt(
-                *gi["start"], *gi["center"], *gi["end"])
+            pts = self._arc_coords(*gi["start"], *gi["center"], *gi["end"])
             coords = []
-            for px, py in pts:
-                tcx, tcy = transform(px, py)
-                coords.extend([tcx, tcy])
+            for i in range(0, len(pts), 2):
+                coords += transform(pts[i], pts[i + 1])
             if len(coords) >= 4:
-                w = max(1, gi.get("width", 0.1) * self.scale)
-                self.canvas.create_line(coords, fill=color, width=w,
-                                        smooth=False, tags=(tag,))
+                w = max(1, gi.get("width", 0.1) * scale)
+                draw(key, "line", coords,
+                     {"fill": color, "width": w, "smooth": False, "tags": tags})
         elif kind == "circle":
             ccx, ccy = gi["center"]
             r = gi.get("radius", 0)
             # Transform center
             tcx, tcy = transform(ccx, ccy)
-            rr = r * self.scale
+            rr = r * scale
             if rr >= 0.5:
                 fill = color if gi.get("fill") else ""
-                self.canvas.create_oval(tcx - rr, tcy - rr,
-                                        tcx + rr, tcy + rr,
-                                        outline=color, fill=fill,
-                                        width=max(1, gi.get("width", 0.1) * self.scale),
-                                        tags=(tag,))
+                draw(key, "oval", (tcx - rr, tcy - rr, tcx + rr, tcy + rr),
+                     {"outline": color, "fill": fill,
+                      "width": max(1, gi.get("width", 0.1) * scale), "tags": tags})
         elif kind == "polygon":
             points = gi.get("points", [])
             if len(points) >= 3:
                 coords = []
                 for pt in points:
-                    tcx, tcy = transform(*pt)
-                    coords.extend([tcx, tcy])
+                    coords += transform(*pt)
                 fill = color if gi.get("fill") else ""
-                self.canvas.create_polygon(coords, outline=color, fill=fill,
-                                           width=max(1, gi.get("width", 0.1) * self.scale),
-                                           tags=(tag,))
+                draw(key, "polygon", coords,
+                     {"outline": color, "fill": fill,
+                      "width": max(1, gi.get("width", 0.1) * scale), "tags": tags})
+
+    def _pad_sprite(self, kind, w, h, drill, color):
+        """Return a cached PhotoImage of a w x h px pad with its drill hole."""
+        level = self._zoom_level()
+        if level != self._sprite_level:
+            # Sizes at other zoom levels are unlikely to come back soon
+            self._sprites = {}
+            self._sprite_level = level
+        key = (kind, w, h, drill, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            image = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+            d = ImageDraw.Draw(image)
+            shape = d.ellipse if kind == "oval" else d.rectangle
+            shape((0, 0, w - 1, h - 1), fill=color)
+            if drill:
+                x0 = (w - drill) // 2
+                y0 = (h - drill) // 2
+                d.ellipse((x0, y0, x0 + drill - 1, y0 + drill - 1), fill=BACKGROUND)
+            sprite = self._sprites[key] = ImageTk.PhotoImage(image)
+        return sprite
 
     def _draw_pads(self):
-        """Draw pads for each component instance."""
-        for comp in self.pcb.components:
-            fp_name = comp["footprint_ref"]
-            fp = self.pcb.footprints.get(fp_name)
-            if not fp:
-                continue
-            comp_x, comp_y = comp["position"]
-            comp_rot = comp.get("rotation", 0)
-            mirror = comp.get("mirror", False)
-
-            for pad in fp.get("pads", []):
-                pad_x, pad_y = pad["offset"]
-                pad_rot = pad.get("rotation", 0)
-
-                # Rotate pad offset by component rotation
-                if comp_rot != 0:
-                    rad = math.radians(-comp_rot)
-                    rx = pad_x * math.cos(rad) - pad_y * math.sin(rad)
-                    ry = pad_x * math.sin(rad) + pad_y * math.cos(rad)
-                    pad_x, pad_y = rx, ry
-
-                world_x = comp_x + pad_x
-                world_y = comp_y + pad_y
-
-                # Determine layer/color
-                pad_type = pad.get("type", "smd")
-                if pad_type == "thru_hole" or pad_type == "npth":
-                    layer = "F.Cu"
-                elif mirror:
-                    layer = "B.Cu"
-                else:
-                    layer = "F.Cu"
-                tag = f"layer_{layer}"
-                color = layer_color(layer)
-
-                cx, cy = self._pcb_to_canvas(world_x, world_y)
-                pw = pad["width"] * self.scale / 2
-                ph = pad["height"] * self.scale / 2
-
-                shape = pad.get("shape", "rect")
-                if shape == "circle":
-                    r = pw
-                    self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
-                                            fill=color, outline=color,
-                                            tags=(tag,))
-                elif shape == "oval":
-                    self.canvas.create_oval(cx - pw, cy - ph, cx + pw, cy + ph,
-                                            fill=color, outline=color,
-                                            tags=(tag,))
-                elif shape == "custom":
-                    pts = pad.get("custom_shape", [])
-                    if len(pts) >= 3:
-                        coords = []
-                        total_rot = comp_rot + pad_rot
-                        for pt in pts:
-                            ppx, ppy = pt
-                            if total_rot != 0:
-                                rad = math.radians(-total_rot)
-                                rpx = ppx * math.cos(rad) - ppy * math.sin(rad)
-                                rpy = ppx * math.sin(rad) + ppy * math.cos(rad)
-                                ppx, ppy = rpx, rpy
-                            tcx, tcy = self._pcb_to_canvas(
-                                world_x + ppx, world_y + ppy)
-                            coords.extend([tcx, tcy])
-                        self.canvas.create_polygon(coords, fill=color,
-                                                   outline=color, tags=(tag,))
+        """Draw the pads baked by _bake_pads, one pass per shape and layer.
+
+        With Pillow, small pads are one image item each, drill included,
+        taken from a sprite cache; otherwise pads and drills are separate
+        vector items.
+        """
+        target = self._target
+        draw = target.draw
+        # Offscreen renders need vector items; see _render_to_image
+        sprites = HAS_PIL and target is self._items
+        scale = self.scale
+        for gi, (kind, layer, xy, half, drill_r) in enumerate(self._pad_groups):
+            tags, color = self._style(layer, "pads")
+            options = {"fill": color, "outline": color, "tags": tags}
+            drill_options = {"fill": "#1a1a1a", "outline": "#1a1a1a",
+                             "tags": self._style(layer, "drills")[0]}
+            for i, box in zip(*self._boxes_to_canvas(xy, half)):
+                x0, y0, x1, y1 = box
+                w = round(x1 - x0)
+                h = round(y1 - y0)
+                if sprites and 0 < w <= SPRITE_MAX_PX and 0 < h <= SPRITE_MAX_PX:
+                    sprite = self._pad_sprite(kind, w, h,
+                                              min(w, h, round(2 * drill_r[i] * scale)),
+                                              color)
+                    draw(("pad_sprite", gi, i), "image", ((x0 + x1) / 2, (y0 + y1) / 2),
+                         {"image": sprite, "tags": tags})
                 else:
-                    # rect / roundrect / trapezoid -> draw as rectangle
-                    self.canvas.create_rectangle(cx - pw, cy - ph,
-                                                 cx + pw, cy + ph,
-                                                 fill=color, outline=color,
-                                                 tags=(tag,))
-
-                # Draw drill hole
-                drill = pad.get("drill_diameter", 0)
-                if drill > 0:
-                    dr = drill * self.scale / 2
-                    self.canvas.create_oval(cx - dr, cy - dr, cx + dr, cy + dr,
-                                            fill="#1a1a1a", outline="#1a1a1a",
-                                            tags=(tag,))
+                    draw(("pad", gi, i), kind, box, options)
+                    dr = drill_r[i] * scale
+                    if dr > 0:
+                        cx = (x0 + x1) / 2
+                        cy = (y0 + y1) / 2
+                        draw(("pad_drill", gi, i), "oval",
+                             (cx - dr, cy - dr, cx + dr, cy + dr), drill_options)
+
+        coords = self._packed_to_canvas(self._pad_custom_xy)
+        vx0, vy0, vx1, vy1 = self._drawn_view
+        for i, (layer, start, stop, x0, y0, x1, y1) in enumerate(self._pad_custom_spans):
+            if x1 < vx0 or x0 > vx1 or y1 < vy0 or y0 > vy1:
+                continue
+            tags, color = self._style(layer, "pads")
+            draw(("custom_pad", i), "polygon", coords[start:stop],
+                 {"fill": color, "outline": color, "tags": tags})
+
+        # Drill holes of custom pads
+        for gi, (layer, xy, half) in enumerate(self._drill_groups):
+            tags, _ = self._style(layer, "drills")
+            options = {"fill": "#1a1a1a", "outline": "#1a1a1a", "tags": tags}
+            for i, box in zip(*self._boxes_to_canvas(xy, half)):
+                draw(("drill", gi, i), "oval", box, options)
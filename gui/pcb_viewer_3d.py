@@ -2,21 +2,36 @@
 3D Component View — matplotlib mplot3d showing components as colored boxes on the board.
 """
 
+import functools
 import math
+import multiprocessing
+import re
+from collections import defaultdict
 import tkinter as tk
 from tkinter import ttk
 from pcb_viewer_2d import _arc_points_from_3pt
+from pcb_math import HAS_NUMBA
+if HAS_NUMBA:
+    from pcb_math import chain_edges
 
 try:
     import matplotlib
     matplotlib.use("TkAgg")
     from matplotlib.figure import Figure
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+    import numpy as np  # always available alongside matplotlib
     HAS_MATPLOTLIB = True
 except ImportError:
     HAS_MATPLOTLIB = False
 
+try:
+    import pyvista as pv
+    from matplotlib.colors import to_rgb
+    HAS_PYVISTA = True
+except ImportError:
+    HAS_PYVISTA = False
+
 
 # Component height and color by refdes prefix
 _COMP_HEIGHT = {
@@ -42,50 +57,116 @@ _COMP_COLOR = {
 }
 
 
+# Leading run of letters (any alphabet, so no digits or underscore)
+_PREFIX_RE = re.compile(r"[^\W\d_]*")
+
+
 def _refdes_prefix(refdes):
     """Extract letter prefix from refdes (e.g. 'R12' -> 'R', 'LED1' -> 'LED')."""
-    prefix = ""
-    for ch in refdes:
-        if ch.isalpha():
-            prefix += ch
-        else:
-            break
-    return prefix.upper()
+    return _PREFIX_RE.match(refdes).group(0).upper()
 
 
-def _comp_height(refdes):
-    prefix = _refdes_prefix(refdes)
-    if prefix in _COMP_HEIGHT:
-        return _COMP_HEIGHT[prefix]
+def _lookup_prefix(table, prefix, default):
+    if prefix in table:
+        return table[prefix]
     # Try shorter prefixes
     for length in range(len(prefix), 0, -1):
         p = prefix[:length]
-        if p in _COMP_HEIGHT:
-            return _COMP_HEIGHT[p]
-    return 1.0
+        if p in table:
+            return table[p]
+    return default
+
+
+@functools.lru_cache(maxsize=None)
+def _prefix_style(prefix):
+    """Return (height, color) for a refdes prefix; boards reuse few prefixes."""
+    return (_lookup_prefix(_COMP_HEIGHT, prefix, 1.0),
+            _lookup_prefix(_COMP_COLOR, prefix, "#666666"))
+
+
+def _comp_height(refdes):
+    return _prefix_style(_refdes_prefix(refdes))[0]
 
 
 def _comp_color(refdes):
-    prefix = _refdes_prefix(refdes)
-    if prefix in _COMP_COLOR:
-        return _COMP_COLOR[prefix]
-    for length in range(len(prefix), 0, -1):
-        p = prefix[:length]
-        if p in _COMP_COLOR:
-            return _COMP_COLOR[p]
-    return "#666666"
+    return _prefix_style(_refdes_prefix(refdes))[1]
+
+
+# Which corner each face vertex takes per axis: 0 = (x0, y0, z0) side, 1 = (x1, y1, z1)
+_BOX_CORNERS = (
+    ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)),  # bottom
+    ((0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)),  # top
+    ((0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)),  # front
+    ((0, 1, 0), (1, 1, 0), (1, 1, 1), (0, 1, 1)),  # back
+    ((0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 0, 1)),  # left
+    ((1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1)),  # right
+)
 
 
 def _box_faces(x0, y0, z0, x1, y1, z1):
-    """Return 6 faces (each a list of 4 vertices) for an axis-aligned box."""
-    return [
-        [(x0, y0, z0), (x1, y0, z0), (x1, y1, z0), (x0, y1, z0)],  # bottom
-        [(x0, y0, z1), (x1, y0, z1), (x1, y1, z1), (x0, y1, z1)],  # top
-        [(x0, y0, z0), (x1, y0, z0), (x1, y0, z1), (x0, y0, z1)],  # front
-        [(x0, y1, z0), (x1, y1, z0), (x1, y1, z1), (x0, y1, z1)],  # back
-        [(x0, y0, z0), (x0, y1, z0), (x0, y1, z1), (x0, y0, z1)],  # left
-        [(x1, y0, z0), (x1, y1, z0), (x1, y1, z1), (x1, y0, z1)],  # right
-    ]
+    """Return the 6 faces of axis-aligned boxes as a (..., 6, 4, 3) array.
+
+    Takes scalars for a single (6, 4, 3) box, or equal-length arrays.
+    """
+    lo = np.stack(np.broadcast_arrays(x0, y0, z0), axis=-1).astype(np.float64)
+    hi = np.stack(np.broadcast_arrays(x1, y1, z1), axis=-1).astype(np.float64)
+    return np.where(np.array(_BOX_CORNERS, dtype=bool),
+                    hi[..., None, None, :], lo[..., None, None, :])
+
+
+def _pad_bbox(pads):
+    """Return (min_x, max_x, min_y, max_y) over a footprint's pads, with sizes."""
+    arr = np.array([(p["offset"][0], p["offset"][1],
+                     p.get("width", 0.5), p.get("height", 0.5)) for p in pads])
+    half_w = arr[:, 2] / 2
+    half_h = arr[:, 3] / 2
+    return (float((arr[:, 0] - half_w).min()), float((arr[:, 0] + half_w).max()),
+            float((arr[:, 1] - half_h).min()), float((arr[:, 1] + half_h).max()))
+
+
+def _arc_points_batch(starts, mids, ends, n):
+    """Interpolate N arcs given (N, 2) start/mid/end arrays into n segments each.
+
+    Vectorised form of _arc_points_from_3pt; returns an (N, n + 1, 2) array.
+    Collinear arcs become the straight path start -> mid -> end.
+    """
+    sx, sy = starts[:, 0], starts[:, 1]
+    mx, my = mids[:, 0], mids[:, 1]
+    ex, ey = ends[:, 0], ends[:, 1]
+    d = 2.0 * (sx * (my - ey) + mx * (ey - sy) + ex * (sy - my))
+    collinear = np.abs(d) < 1e-12
+    d = np.where(collinear, 1.0, d)
+    s2 = sx * sx + sy * sy
+    m2 = mx * mx + my * my
+    e2 = ex * ex + ey * ey
+    ux = (s2 * (my - ey) + m2 * (ey - sy) + e2 * (sy - my)) / d
+    uy = (s2 * (ex - mx) + m2 * (sx - ex) + e2 * (mx - sx)) / d
+    r = np.hypot(sx - ux, sy - uy)
+
+    tau = 2 * math.pi
+    a_start = np.arctan2(sy - uy, sx - ux)
+    a_start_n = a_start % tau
+    a_mid_n = np.arctan2(my - uy, mx - ux) % tau
+    a_end_n = np.arctan2(ey - uy, ex - ux) % tau
+    # Mid between start and end going CCW?
+    ccw = np.where(a_start_n <= a_end_n,
+                   (a_start_n <= a_mid_n) & (a_mid_n <= a_end_n),
+                   (a_mid_n >= a_start_n) | (a_mid_n <= a_end_n))
+    sweep = a_end_n - a_start_n
+    sweep = np.where(ccw & (sweep <= 0), sweep + tau, sweep)
+    sweep = np.where(~ccw & (sweep >= 0), sweep - tau, sweep)
+
+    t = np.arange(n + 1) / n
+    angles = a_start[:, None] + sweep[:, None] * t
+    pts = np.stack([ux[:, None] + r[:, None] * np.cos(angles),
+                    uy[:, None] + r[:, None] * np.sin(angles)], axis=2)
+    if collinear.any():
+        t2 = 2 * t[:, None]
+        line = np.where(t2 <= 1,
+                        starts[collinear, None] + (mids - starts)[collinear, None] * t2,
+                        mids[collinear, None] + (ends - mids)[collinear, None] * (t2 - 1))
+        pts[collinear] = line
+    return pts
 
 
 def _build_outline_polygon(pcb_data):
@@ -118,79 +199,163 @@ def _build_outline_polygon(pcb_data):
     # Chain edges into an ordered polygon by matching endpoints
     EPS = 0.05  # tolerance in mm
 
-    def pt_close(a, b):
-        return abs(a[0] - b[0]) < EPS and abs(a[1] - b[1]) < EPS
-
-    ordered = list(edges.pop(0))
-    max_iters = len(edges) * len(edges) + 1
-    iters = 0
-    while edges and iters < max_iters:
-        iters += 1
-        found = False
-        for i, edge in enumerate(edges):
-            e_start = edge[0]
-            e_end = edge[-1]
-            tail = ordered[-1]
-
-            if pt_close(tail, e_start):
-                ordered.extend(edge[1:])
-                edges.pop(i)
-                found = True
-                break
-            elif pt_close(tail, e_end):
-                ordered.extend(reversed(edge[:-1]))
-                edges.pop(i)
-                found = True
-                break
-        if not found:
+    if HAS_NUMBA:
+        order, flipped = chain_edges(np.array([e[0] for e in edges], dtype=np.float64),
+                                     np.array([e[-1] for e in edges], dtype=np.float64),
+                                     EPS)
+        ordered = list(edges[0])
+        for i, flip in zip(order[1:].tolist(), flipped[1:].tolist()):
+            edge = edges[i]
+            ordered.extend(reversed(edge[:-1]) if flip else edge[1:])
+        return ordered
+
+    # Bucket edge endpoints on a grid of 2 * EPS cells. A match for the tail
+    # lies in the tail's cell or one of its 8 neighbours, so each step looks
+    # at a few candidates instead of scanning every remaining edge
+    EPS2 = EPS * EPS
+    CELL = 2 * EPS
+    buckets = defaultdict(list)
+    for i in range(1, len(edges)):
+        edge = edges[i]
+        # flip: the edge is joined at its end, so walked end-to-start
+        for (x, y), flip in ((edge[0], False), (edge[-1], True)):
+            buckets[(round(x / CELL), round(y / CELL))].append((i, flip))
+
+    used = [False] * len(edges)
+    ordered = list(edges[0])
+    for _ in range(len(edges) - 1):
+        tx, ty = ordered[-1]
+        qx = round(tx / CELL)
+        qy = round(ty / CELL)
+        # Take the earliest matching edge, its start before its end, as a
+        # linear scan over the remaining edges would
+        best = None
+        for cx in (qx - 1, qx, qx + 1):
+            for cy in (qy - 1, qy, qy + 1):
+                for cand in buckets.get((cx, cy), ()):
+                    i, flip = cand
+                    if used[i] or (best is not None and cand >= best):
+                        continue
+                    px, py = edges[i][-1 if flip else 0]
+                    dx = tx - px
+                    dy = ty - py
+                    if dx * dx + dy * dy < EPS2:
+                        best = cand
+        if best is None:
             break
+        i, flip = best
+        used[i] = True
+        edge = edges[i]
+        ordered.extend(reversed(edge[:-1]) if flip else edge[1:])
 
     return ordered
 
 
 def _extrude_polygon(polygon, z_top, z_bot):
-    """Extrude a 2D polygon into a 3D prism, returning a list of faces."""
+    """Extrude a 2D polygon into a 3D prism.
+
+    Returns (caps, sides): the top and bottom faces as a (2, n, 3) array and
+    the side walls as an (n, 4, 3) array, or None for fewer than 3 points.
+    """
     n = len(polygon)
     if n < 3:
-        return []
+        return None
+
+    p = np.asarray(polygon, dtype=np.float64)
+    top = np.column_stack([p, np.full(n, z_top)])
+    bot = np.column_stack([p, np.full(n, z_bot)])
+    # Side walls: quad i joins vertex i and vertex i + 1 (wrapping)
+    top_next = np.roll(top, -1, axis=0)
+    bot_next = np.roll(bot, -1, axis=0)
+    sides = np.stack([top, top_next, bot_next, bot], axis=1)
+    # Bottom face has reversed winding
+    return np.stack([top, bot[::-1]]), sides
+
+
+# Drop sub-pixel path vertices and split long paths while the scene is built
+# and first drawn
+_FAST_DRAW_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
 
-    faces = []
-    # Top face
-    faces.append([(x, y, z_top) for x, y in polygon])
-    # Bottom face (reversed winding)
-    faces.append([(x, y, z_bot) for x, y in reversed(polygon)])
-    # Side walls
-    for i in range(n):
-        j = (i + 1) % n
-        x0, y0 = polygon[i]
-        x1, y1 = polygon[j]
-        faces.append([
-            (x0, y0, z_top), (x1, y1, z_top),
-            (x1, y1, z_bot), (x0, y0, z_bot),
-        ])
-    return faces
+# Exact (cos, sin) of -angle for angle = 0, 90, 180, 270 degrees
+_QUARTER_COS = (1.0, 0.0, -1.0, 0.0)
+_QUARTER_SIN = (0.0, -1.0, 0.0, 1.0)
 
 
 def _rotate_box_faces(faces, cx, cy, angle_deg):
-    """Rotate all face vertices around (cx, cy) by angle_deg."""
-    if abs(angle_deg) < 0.01:
-        return faces
-    rad = math.radians(-angle_deg)
-    cos_a = math.cos(rad)
-    sin_a = math.sin(rad)
-    result = []
-    for face in faces:
-        new_face = []
-        for (x, y, z) in face:
-            dx = x - cx
-            dy = y - cy
-            rx = dx * cos_a - dy * sin_a + cx
-            ry = dx * sin_a + dy * cos_a + cy
-            new_face.append((rx, ry, z))
-        result.append(new_face)
+    """Rotate (..., 6, 4, 3) face vertices around (cx, cy) by angle_deg.
+
+    cx, cy and angle_deg are scalars or arrays matching the leading axes.
+    Right angles use exact cos/sin; angles within 0.01 deg of 0 are not rotated.
+    """
+    angle = np.asarray(angle_deg, dtype=np.float64)
+    quarter = np.round(angle / 90)
+    exact = (np.abs(angle - quarter * 90) < 1e-9) | (np.abs(angle) < 0.01)
+    k = quarter.astype(np.int64) % 4
+    rad = np.radians(-angle)
+    cos_a = np.where(exact, np.take(_QUARTER_COS, k), np.cos(rad))[..., None, None]
+    sin_a = np.where(exact, np.take(_QUARTER_SIN, k), np.sin(rad))[..., None, None]
+    cx = np.asarray(cx, dtype=np.float64)[..., None, None]
+    cy = np.asarray(cy, dtype=np.float64)[..., None, None]
+    dx = faces[..., 0] - cx
+    dy = faces[..., 1] - cy
+    result = faces.copy()
+    result[..., 0] = dx * cos_a - dy * sin_a + cx
+    result[..., 1] = dx * sin_a + dy * cos_a + cy
     return result
 
 
+def _faces_polydata(groups):
+    """Merge (faces, colors) groups into one PyVista mesh with per-face RGB.
+
+    faces is a sequence of (V, 3) vertex arrays, colors one color per face.
+    """
+    points = []
+    cells = []
+    rgb = []
+    offset = 0
+    for faces, colors in groups:
+        for face, color in zip(faces, colors):
+            face = np.asarray(face, dtype=np.float64)
+            n = len(face)
+            points.append(face)
+            cells.append(n)
+            cells.extend(range(offset, offset + n))
+            offset += n
+            rgb.append(to_rgb(color))
+    mesh = pv.PolyData(np.concatenate(points), np.array(cells))
+    mesh.cell_data["rgb"] = (np.array(rgb) * 255).astype(np.uint8)
+    return mesh
+
+
+def _lines_polydata(groups):
+    """Merge ((N, 2, 3) segments, color) groups into one PyVista line mesh."""
+    points = np.concatenate([segs.reshape(-1, 3) for segs, _ in groups])
+    n = len(points) // 2
+    cells = np.column_stack([np.full(n, 2), np.arange(0, 2 * n, 2),
+                             np.arange(1, 2 * n, 2)]).ravel()
+    rgb = np.concatenate([np.tile(to_rgb(color), (len(segs), 1))
+                          for segs, color in groups])
+    mesh = pv.PolyData(points, lines=cells)
+    mesh.cell_data["rgb"] = (rgb * 255).astype(np.uint8)
+    return mesh
+
+
+def _run_pyvista(solids, lines):
+    """Build the meshes and run a PyVista window until it is closed.
+
+    Runs in its own process: VTK's event loop would otherwise block Tk's.
+    """
+    plotter = pv.Plotter(title="3D PCB View")
+    plotter.add_mesh(_faces_polydata(solids), scalars="rgb", rgb=True)
+    if lines:
+        plotter.add_mesh(_lines_polydata(lines), scalars="rgb", rgb=True)
+    plotter.show()
+
+
 class PcbViewer3D(tk.Toplevel):
     """3D component viewer window using matplotlib."""
 
@@ -201,6 +366,9 @@ class PcbViewer3D(tk.Toplevel):
         self.minsize(600, 400)
 
         self.pcb = pcb_data
+        self._artists = None  # (collections, components, scene) from _build_artists
+        self._comp_artists = []  # component boxes and labels now on the axes
+        self._limits_job = None
 
         if not HAS_MATPLOTLIB:
             ttk.Label(self, text="matplotlib is required for 3D view.\n"
@@ -221,151 +389,251 @@ class PcbViewer3D(tk.Toplevel):
 
         toolbar = NavigationToolbar2Tk(canvas, self)
         toolbar.update()
+        if HAS_PYVISTA:
+            ttk.Button(toolbar, text="Open in PyVista",
+                       command=self._show_pyvista).pack(side=tk.RIGHT, padx=4)
 
-    def _render(self):
-        ax = self.ax
-        ax.cla()
+    def invalidate(self):
+        """Drop the cached scene so the next _render rebuilds it from self.pcb."""
+        self._artists = None
 
-        bbox = self.pcb.bbox
-        if not bbox:
-            return
-        bx0, by0, bx1, by1 = bbox
-        # Add back the margin that compute_bbox adds
-        bx0 += 3
-        by0 += 3
-        bx1 -= 3
-        by1 -= 3
+    def _build_artists(self, bx0, by0, bx1, by1, thickness, max_range):
+        """Build the board, zone and trace collections and the component boxes.
 
-        thickness = self.pcb.board_thickness
+        Returns (collections, components, scene). components holds the
+        arrays _show_components filters by view, or None if nothing is
+        placed. scene lists the raw geometry for _show_pyvista as
+        ("faces" or "lines", faces/segments, color) entries.
+        """
+        collections = []
+        scene = []
 
         # --- Draw board from actual outline ---
         outline_poly = _build_outline_polygon(self.pcb)
         if outline_poly and len(outline_poly) >= 3:
-            board_faces = _extrude_polygon(outline_poly, 0, -thickness)
+            # Caps and walls have different vertex counts; keeping them in
+            # separate collections avoids padding every wall to the cap size
+            board_parts = _extrude_polygon(outline_poly, 0, -thickness)
         else:
-            board_faces = _box_faces(bx0, by0, 0, bx1, by1, -thickness)
-        board = Poly3DCollection(board_faces, alpha=0.3, facecolor="#228B22",
-                                 edgecolor="#006400", linewidth=0.5)
-        ax.add_collection3d(board)
+            board_parts = (_box_faces(bx0, by0, 0, bx1, by1, -thickness),)
+        for faces in board_parts:
+            collections.append(Poly3DCollection(
+                faces, alpha=0.3, facecolor="#228B22",
+                edgecolor="#006400", linewidth=0.5))
+            scene.append(("faces", faces, "#228B22"))
 
         # --- Draw copper zones (pours) ---
+        # One collection per board side, as for traces
+        top_zones = []
+        bot_zones = []
+        z_top = 0.01
+        z_bot = -thickness - 0.01
         for z in self.pcb.zones:
-            layer = z.get("layer", "")
-            z_height = 0.01 if "F." in layer else -thickness - 0.01
             pts = z.get("outline", [])
             if len(pts) >= 3:
-                face = [(x, y, z_height) for x, y in pts]
-                color = "#CC0000" if "F." in layer else "#0000CC"
-                poly = Poly3DCollection([face], alpha=0.25, facecolor=color,
-                                        edgecolor=color, linewidth=0)
-                ax.add_collection3d(poly)
-
-        # --- Draw traces ---
-        for t in self.pcb.traces:
-            layer = t.get("layer", "")
-            z_height = 0.02 if "F." in layer else -thickness - 0.02
-            sx, sy = t["start"]
-            ex, ey = t["end"]
-            color = "#FF0000" if "F." in layer else "#0044FF"
-            ax.plot([sx, ex], [sy, ey], [z_height, z_height],
-                    color=color, linewidth=0.8, alpha=0.8)
-
-        # --- Draw trace arcs ---
-        for a in self.pcb.trace_arcs:
-            layer = a.get("layer", "")
-            z_height = 0.02 if "F." in layer else -thickness - 0.02
-            color = "#FF0000" if "F." in layer else "#0044FF"
-            pts = _arc_points_from_3pt(
-                *a["start"], *a["mid"], *a["end"], n=16)
-            xs = [p[0] for p in pts]
-            ys = [p[1] for p in pts]
-            zs = [z_height] * len(pts)
-            ax.plot(xs, ys, zs, color=color, linewidth=0.8, alpha=0.8)
-
-        # --- Draw vias ---
-        for v in self.pcb.vias:
-            vx, vy = v["position"]
-            r = v["diameter"] / 2
-            angles = [i * 2 * math.pi / 12 for i in range(13)]
-            xs = [vx + r * math.cos(a) for a in angles]
-            ys = [vy + r * math.sin(a) for a in angles]
-            # Draw on both surfaces
-            ax.plot(xs, ys, [0.02] * len(angles),
-                    color="#C0C0C0", linewidth=0.5, alpha=0.7)
-            ax.plot(xs, ys, [-thickness - 0.02] * len(angles),
-                    color="#C0C0C0", linewidth=0.5, alpha=0.7)
+                if "F." in z.get("layer", ""):
+                    top_zones.append([(x, y, z_top) for x, y in pts])
+                else:
+                    bot_zones.append([(x, y, z_bot) for x, y in pts])
+        for faces, color in ((top_zones, "#CC0000"), (bot_zones, "#0000CC")):
+            if faces:
+                collections.append(Poly3DCollection(
+                    faces, alpha=0.25, facecolor=color, linewidth=0))
+                scene.append(("faces", faces, color))
+
+        # --- Draw traces and trace arcs ---
+        # Everything becomes (N, 2, 3) segments, one collection per board side
+        pcb = self.pcb
+        z_top = 0.02
+        z_bot = -thickness - 0.02
+        segments = []
+        on_top = []
+
+        if len(pcb.trace_x0):
+            segs = np.empty((len(pcb.trace_x0), 2, 3))
+            segs[:, 0, 0] = pcb.trace_x0
+            segs[:, 0, 1] = pcb.trace_y0
+            segs[:, 1, 0] = pcb.trace_x1
+            segs[:, 1, 1] = pcb.trace_y1
+            top_layer = np.array(["F." in name for name in pcb.layer_names])
+            top = top_layer[np.asarray(pcb.trace_layer)]
+            segs[:, :, 2] = np.where(top, z_top, z_bot)[:, None]
+            segments.append(segs)
+            on_top.append(top)
+
+        arcs = pcb.trace_arcs
+        if arcs:
+            pts = _arc_points_batch(np.array([a["start"] for a in arcs], dtype=np.float64),
+                                    np.array([a["mid"] for a in arcs], dtype=np.float64),
+                                    np.array([a["end"] for a in arcs], dtype=np.float64),
+                                    16)
+            top = np.array(["F." in a.get("layer", "") for a in arcs])
+            arcs3d = np.empty(pts.shape[:2] + (3,))
+            arcs3d[:, :, :2] = pts
+            arcs3d[:, :, 2] = np.where(top, z_top, z_bot)[:, None]
+            # Each 17-point arc is 16 consecutive segments
+            segments.append(np.stack([arcs3d[:, :-1], arcs3d[:, 1:]], axis=2).reshape(-1, 2, 3))
+            on_top.append(np.repeat(top, 16))
+
+        if segments:
+            segments = np.concatenate(segments)
+            on_top = np.concatenate(on_top)
+            for lines, color in ((segments[on_top], "#FF0000"),
+                                 (segments[~on_top], "#0044FF")):
+                if len(lines):
+                    collections.append(Line3DCollection(
+                        lines, colors=color, linewidths=0.8, alpha=0.8))
+                    scene.append(("lines", lines, color))
 
         # --- Draw components ---
-        for comp in self.pcb.components:
+        # Gather the drawable components, then build, place and rotate
+        # all of their boxes as (N, 6, 4, 3) arrays in one go
+        pcb = self.pcb
+        # Pad extents per footprint, shared by all of its components
+        fp_bbox = {name: _pad_bbox(fp["pads"])
+                   for name, fp in pcb.footprints.items() if fp.get("pads")}
+        index = []
+        pad_boxes = []
+        heights = []
+        colors = []
+        mirrors = []
+        refdes_list = []
+        for i, comp in enumerate(pcb.components):
             refdes = comp["refdes"]
             prefix = _refdes_prefix(refdes)
             if prefix == "H":  # skip mounting holes
                 continue
-
-            fp_name = comp["footprint_ref"]
-            fp = self.pcb.footprints.get(fp_name)
-            if not fp:
-                continue
-
-            cx, cy = comp["position"]
-            rot = comp.get("rotation", 0)
-            mirror = comp.get("mirror", False)
-
-            # Compute component size from pad bounding box
-            pads = fp.get("pads", [])
-            if not pads:
+            # Footprints without pads have no extent and are skipped
+            pad_box = fp_bbox.get(comp["footprint_ref"])
+            if pad_box is None:
                 continue
+            height, color = _prefix_style(prefix)
+            index.append(i)
+            pad_boxes.append(pad_box)
+            heights.append(height)
+            colors.append(color)
+            mirrors.append(comp.get("mirror", False))
+            refdes_list.append(refdes)
+
+        components = None
+        if index:
+            cx = np.asarray(pcb.comp_x)[index]
+            cy = np.asarray(pcb.comp_y)[index]
+            # Component size from pad bounding box, plus a margin
+            margin = 0.3
+            min_px, max_px, min_py, max_py = np.array(pad_boxes).T
+            min_px = min_px - margin
+            max_px = max_px + margin
+            min_py = min_py - margin
+            max_py = max_py + margin
+
+            # Top side boxes sit on the board; bottom side ones hang below
+            mirror = np.array(mirrors, dtype=bool)
+            height = np.array(heights)
+            z_base = np.where(mirror, -thickness, 0.0)
+            z_top = np.where(mirror, -thickness - height, height)
+            faces = _box_faces(cx + min_px, cy + min_py, z_base,
+                               cx + max_px, cy + max_py, z_top)
+            faces = _rotate_box_faces(faces, cx, cy,
+                                      np.asarray(pcb.comp_rotation)[index])
+
+            # Refdes labels on parts smaller than ~8 px across would be unreadable
+            min_label_size = max_range / (self.fig.get_figwidth() * self.fig.dpi) * 8
+            label_z = z_top + np.where(mirror, -0.1, 0.1)
+            components = {
+                "faces": faces,
+                "colors": np.array(colors),
+                # xy extent of each rotated box, for culling against the view
+                "x0": faces[..., 0].min(axis=(1, 2)),
+                "x1": faces[..., 0].max(axis=(1, 2)),
+                "y0": faces[..., 1].min(axis=(1, 2)),
+                "y1": faces[..., 1].max(axis=(1, 2)),
+                "labels": np.stack([cx, cy, label_z], axis=1),
+                "refdes": refdes_list,
+                "labeled": np.hypot(max_px - min_px, max_py - min_py) >= min_label_size,
+            }
+
+        return collections, components, scene
+
+    def _show_components(self):
+        """(Re)build the component boxes and labels inside the current x/y limits."""
+        for artist in self._comp_artists:
+            artist.remove()
+        self._comp_artists = []
+        comps = self._artists[1]
+        if comps is None:
+            return
+        ax = self.ax
+        (vx0, vx1), (vy0, vy1) = ax.get_xlim(), ax.get_ylim()
+        visible = ((comps["x1"] >= vx0) & (comps["x0"] <= vx1) &
+                   (comps["y1"] >= vy0) & (comps["y0"] <= vy1))
+        if not visible.any():
+            return
+        # Boxes overlap in depth, so these faces need the per-draw sort
+        boxes = Poly3DCollection(
+            comps["faces"][visible].reshape(-1, 4, 3), alpha=0.7,
+            facecolors=np.repeat(comps["colors"][visible], 6),
+            edgecolors="#000000", linewidth=0.3, zsort="average")
+        self._comp_artists.append(ax.add_collection3d(boxes))
+        refdes = comps["refdes"]
+        for k in np.flatnonzero(visible & comps["labeled"]).tolist():
+            x, y, z = comps["labels"][k].tolist()
+            self._comp_artists.append(ax.text(
+                x, y, z, refdes[k], fontsize=5, ha="center", va="center",
+                color="white", fontweight="bold"))
+
+    def _show_pyvista(self):
+        """Show the whole board in a GPU-rendered PyVista window.
+
+        The window runs in a spawned process fed the scene arrays, so the
+        Tk windows stay responsive (and Tk is never forked).
+        """
+        if self._artists is None:
+            return
+        _, comps, scene = self._artists
+        solids = []
+        lines = []
+        for kind, geometry, color in scene:
+            if kind == "faces":
+                solids.append((geometry, [color] * len(geometry)))
+            else:
+                lines.append((geometry, color))
+        if comps is not None:
+            solids.append((comps["faces"].reshape(-1, 4, 3),
+                           np.repeat(comps["colors"], 6).tolist()))
 
-            pad_xs = [p["offset"][0] for p in pads]
-            pad_ys = [p["offset"][1] for p in pads]
-            # Add pad sizes
-            pad_ws = [p.get("width", 0.5) for p in pads]
-            pad_hs = [p.get("height", 0.5) for p in pads]
+        ctx = multiprocessing.get_context("spawn")
+        ctx.Process(target=_run_pyvista, args=(solids, lines), daemon=True).start()
 
-            min_px = min(px - pw / 2 for px, pw in zip(pad_xs, pad_ws))
-            max_px = max(px + pw / 2 for px, pw in zip(pad_xs, pad_ws))
-            min_py = min(py - ph / 2 for py, ph in zip(pad_ys, pad_hs))
-            max_py = max(py + ph / 2 for py, ph in zip(pad_ys, pad_hs))
+    def _on_limits_changed(self, ax):
+        # Zooming changes x and y together; rebuild once for both
+        if self._limits_job is None:
+            self._limits_job = self.after_idle(self._refresh_components)
 
-            # Add margin
-            margin = 0.3
-            min_px -= margin
-            max_px += margin
-            min_py -= margin
-            max_py += margin
-
-            height = _comp_height(refdes)
-            color = _comp_color(refdes)
-
-            if mirror:
-                # Bottom side: box hangs below board
-                z_base = -thickness
-                z_top = -thickness - height
-                faces = _box_faces(cx + min_px, cy + min_py, z_base,
-                                   cx + max_px, cy + max_py, z_top)
-            else:
-                # Top side: box sits on board
-                z_base = 0
-                z_top = height
-                faces = _box_faces(cx + min_px, cy + min_py, z_base,
-                                   cx + max_px, cy + max_py, z_top)
+    def _refresh_components(self):
+        self._limits_job = None
+        self._show_components()
+        self.fig.canvas.draw_idle()
 
-            faces = _rotate_box_faces(faces, cx, cy, rot)
+    def _render(self):
+        with matplotlib.rc_context(_FAST_DRAW_RC):
+            self._render_scene()
 
-            comp_poly = Poly3DCollection(faces, alpha=0.7, facecolor=color,
-                                         edgecolor="#000000", linewidth=0.3)
-            ax.add_collection3d(comp_poly)
+    def _render_scene(self):
+        ax = self.ax
+        ax.cla()
 
-            # Label on top
-            label_z = z_top + 0.1 if not mirror else z_top - 0.1
-            ax.text(cx, cy, label_z, refdes, fontsize=5,
-                    ha="center", va="center", color="white",
-                    fontweight="bold")
+        bbox = self.pcb.bbox
+        if not bbox:
+            return
+        bx0, by0, bx1, by1 = bbox
+        # Add back the margin that compute_bbox adds
+        bx0 += 3
+        by0 += 3
+        bx1 -= 3
+        by1 -= 3
 
-        # --- Set view ---
-        ax.set_xlabel("X (mm)")
-        ax.set_ylabel("Y (mm)")
-        ax.set_zlabel("Z (mm)")
+        thickness = self.pcb.board_thickness
 
         # Equal aspect ratio
         x_range = bx1 - bx0
@@ -373,6 +641,18 @@ class PcbViewer3D(tk.Toplevel):
         z_range = max(thickness * 4, 5)  # ensure some Z range
         max_range = max(x_range, y_range, z_range)
 
+        # Geometry is static, so its artists are built once and re-added
+        if self._artists is None:
+            self._artists = self._build_artists(bx0, by0, bx1, by1,
+                                                thickness, max_range)
+        for collection in self._artists[0]:
+            ax.add_collection3d(collection)
+
+        # --- Set view ---
+        ax.set_xlabel("X (mm)")
+        ax.set_ylabel("Y (mm)")
+        ax.set_zlabel("Z (mm)")
+
         mid_x = (bx0 + bx1) / 2
         mid_y = (by0 + by1) / 2
         mid_z = -thickness / 2
@@ -381,6 +661,27 @@ class PcbViewer3D(tk.Toplevel):
         ax.set_ylim(mid_y - max_range / 2, mid_y + max_range / 2)
         ax.set_zlim(mid_z - max_range / 2, mid_z + max_range / 2)
 
+        # Components are culled to the x/y limits and rebuilt when they change.
+        # ax.cla() dropped the old artists and callbacks
+        self._comp_artists = []
+        self._show_components()
+        ax.callbacks.connect("xlim_changed", self._on_limits_changed)
+        ax.callbacks.connect("ylim_changed", self._on_limits_changed)
+
+        # --- Draw vias ---
+        # One hollow-marker scatter over both surfaces. Marker sizes are in
+        # points, so the via diameter is scaled by the initial view's mm/pt
+        pcb = self.pcb
+        n_vias = len(pcb.via_x)
+        if n_vias:
+            ax_width_pt = ax.get_position().width * self.fig.get_figwidth() * 72
+            sizes = (np.asarray(pcb.via_diameter) * (ax_width_pt / max_range)) ** 2
+            ax.scatter(np.tile(pcb.via_x, 2), np.tile(pcb.via_y, 2),
+                       np.repeat([0.02, -thickness - 0.02], n_vias),
+                       s=np.tile(sizes, 2), marker="o", facecolors="none",
+                       edgecolors="#C0C0C0", linewidths=0.5, alpha=0.7,
+                       depthshade=False)
+
         ax.view_init(elev=35, azim=-60)
         self.fig.tight_layout()
         self.fig.canvas.draw()
@@ -12,16 +12,33 @@ ODB++ structure reference:
   steps/<step>/layers/<layer>/components - Component placements
 """
 
+import functools
+import hashlib
 import logging
 import math
+import multiprocessing
 import os
+import pickle
 import re
+import shutil
+import subprocess
+import sys
 import tarfile
 import tempfile
 import zipfile
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Optional
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 from .pcb_model import (
     ComponentInstance, Footprint, FootprintPad, GraphicItem,
     LayerDef, LayerType, NetDef, PadDef, PadShape, PcbModel,
@@ -30,11 +47,261 @@ from .pcb_model import (
 )
 from .utils import (
     arc_center_to_mid, convert_to_mm, fmt, make_uuid, negate_y,
-    parse_float, parse_int, reset_uuid_counter,
+    parse_float, reset_uuid_counter,
 )
 
 log = logging.getLogger(__name__)
 
+# Below these sizes a process pool costs more to start than it saves
+_PARALLEL_MIN_SYMBOLS = 64
+_PARALLEL_MIN_BYTES = 8 << 20
+
+# Read buffer for streaming tar extraction
+_EXTRACT_BUFSIZE = 1 << 20
+
+# Opt-in cache of parsed models, keyed by a hash of the input's contents;
+# set ODB2KICAD_CACHE=1 to enable. Bump _CACHE_VERSION when parser output
+# or the PcbModel layout changes so stale entries are not reused.
+_CACHE_ENV = "ODB2KICAD_CACHE"
+_CACHE_DIR = Path.home() / ".cache" / "odb2kicad"
+_CACHE_VERSION = b"1"
+
+# Side hints in layer names: mask/silk/paste layers, then component layers
+_TOP_RE = re.compile(r"top|front|comp", re.I)
+_COMP_TOP_RE = re.compile(r"top|comp", re.I)
+_COMP_BOT_RE = re.compile(r"bot|sold", re.I)
+
+# Contour records (profile, symbol and surface features)
+_RE_OB = re.compile(r"^OB\s+([\d.eE+-]+)\s+([\d.eE+-]+)", re.I)
+_RE_OS = re.compile(r"^OS\s+([\d.eE+-]+)\s+([\d.eE+-]+)", re.I)
+_RE_OC = re.compile(r"^OC\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)", re.I)
+
+# eda/data records, used when a line does not split cleanly
+_RE_FID = re.compile(r"^FID\s+(\w)\s+(\S+)\s+(\d+)", re.I)
+_RE_PIN = re.compile(r"^PIN\s+(\S+)\s+(\w+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)", re.I)
+
+# layers/<comp>/components records
+_RE_CMP = re.compile(
+    r"^CMP\s+(\d+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)\s+(\S+)", re.I)
+_RE_CMP_REF = re.compile(r";\s*(?:ID|REF)\s*=\s*(\S+)", re.I)
+_RE_TOP = re.compile(
+    r"^TOP\s+(\d+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)\s+(\d+)\s+(\d+)", re.I)
+_RE_BOT = re.compile(
+    r"^BOT\s+(\d+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)\s+(\d+)\s+(\d+)", re.I)
+_RE_PRP = re.compile(r"^PRP\s+(\S+)\s+'([^']*)'", re.I)
+
+# A TOP/BOT pin record, buffered until its component is finalized
+_PadTmp = namedtuple("_PadTmp", "pin x y rotation mirror net_num pad_usage")
+
+# layers/<layer>/features records (copper and drill) and drill tools
+_RE_SYM_REF = re.compile(r"^\$(\d+)\s+(\S+)")
+_RE_LINE = re.compile(
+    r"^L\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\d+)\s+(\w+)", re.I)
+_RE_PAD = re.compile(r"^P\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\d+)\s+(\w+)", re.I)
+_RE_ARC = re.compile(
+    r"^A\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+"
+    r"([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\d+)\s+(\w+)\s*;?\s*(\w*)", re.I)
+_RE_TOOL = re.compile(r"^T(\d+)\s+([\d.eE+-]+)", re.I)
+
+# Standard symbol names: one alternative per shape, tried in order, with the
+# outer group named after the shape. Thermals only need the leading size.
+_RE_SYM = re.compile(
+    r"^(?:"
+    r"(?P<round>r(?P<round_d>[\d.]+))$"
+    r"|(?P<square>s(?P<square_d>[\d.]+))$"
+    r"|(?P<rect>rect(?P<rect_w>[\d.]+)x(?P<rect_h>[\d.]+))$"
+    r"|(?P<oval>oval(?P<oval_w>[\d.]+)x(?P<oval_h>[\d.]+))$"
+    r"|(?P<rc>rc[r]?(?P<rc_w>[\d.]+)x(?P<rc_h>[\d.]+)x[r]?(?P<rc_r>[\d.]+))$"
+    r"|(?P<donut>donut_r(?P<donut_od>[\d.]+)x[\d.]+)$"
+    r"|(?P<thermal>th[r]?(?P<thermal_d>[\d.]+))"
+    r")",
+    re.I,
+)
+_RE_SYM_DIM = re.compile(r"^[\w]*?([\d.]+)")
+
+
+# matrix/matrix TYPE= values; anything else is LayerType.OTHER
+_LAYER_TYPES = {
+    "SIGNAL": LayerType.SIGNAL,
+    "POWER_GROUND": LayerType.POWER,
+    "POWER": LayerType.POWER,
+    "MIXED": LayerType.MIXED,
+    "SOLDER_MASK": LayerType.SOLDER_MASK,
+    "SILK_SCREEN": LayerType.SILK_SCREEN,
+    "SOLDER_PASTE": LayerType.SOLDER_PASTE,
+    "DRILL": LayerType.DRILL,
+    "DOCUMENT": LayerType.DOCUMENT,
+    "COMPONENT": LayerType.COMPONENT,
+    "ROUT": LayerType.DRILL,
+}
+_COPPER_TYPES = frozenset({LayerType.SIGNAL, LayerType.POWER, LayerType.MIXED})
+
+# matrix/matrix LAYER keys that matter; CONTEXT, ROW, OLD_NAME and the
+# drill span START_NAME/END_NAME are ignored
+_MATRIX_HANDLERS = {
+    "NAME": lambda layer, val: setattr(layer, "odb_name", val),
+    "TYPE": lambda layer, val: setattr(
+        layer, "layer_type", OdbParser._classify_layer_type(val)),
+    "POLARITY": lambda layer, val: setattr(layer, "polarity", val.lower()),
+}
+
+
+def _record_floats(parts: list, line: str, pattern, count: int,
+                   first: int = 1) -> Optional[list]:
+    """Return `count` numeric fields of a split record line, from parts[first].
+
+    Well-formed lines are converted straight from the split tokens; anything
+    else falls back to the record's regex, whose groups are numbered like
+    the tokens. That includes tokens float() accepts but the regex does not,
+    such as nan, inf or 1_0. Returns None if the line has too few fields or
+    the regex does not match either.
+    """
+    end = first + count
+    if len(parts) < end:
+        return None
+    fields = parts[first:end]
+    try:
+        vals = [float(v) for v in fields]
+    except ValueError:
+        pass
+    else:
+        if math.isfinite(sum(vals)) and "_" not in "".join(fields):
+            return vals
+    m = pattern.match(line)
+    if not m:
+        return None
+    return [parse_float(m.group(i)) for i in range(first, end)]
+
+
+def _is_word_start(token: str) -> bool:
+    """True if token starts with a character a regex \\w+ field accepts."""
+    c = token[0]
+    return c.isalnum() or c == "_"
+
+
+def _record_symbol(parts: list, i: int) -> Optional[int]:
+    """Return the <sym_num> at parts[i] of a split L/P record.
+
+    Like the record regexes, requires it to be all digits and followed by a
+    <polarity> field starting with a word character; otherwise None.
+    """
+    if len(parts) <= i + 1 or not parts[i].isdecimal():
+        return None
+    if not _is_word_start(parts[i + 1]):
+        return None
+    return int(parts[i])
+
+
+def _read_text(path: Path) -> str:
+    """Read a whole ODB++ text file.
+
+    Reads the bytes and decodes them once, skipping the text layer's
+    newline translation; the callers split lines themselves. UTF-8 with
+    replacement, as before (ASCII input takes the decoder's fast path).
+    """
+    return path.read_bytes().decode("utf-8", "replace")
+
+
+def _iter_file_lines(path: Path):
+    """Yield the stripped lines of a text file without reading it whole.
+
+    The file is read in 1 MiB chunks and each line is decoded on its own.
+    Lines end at \n, \r\n or a bare \r, as with str.splitlines(). An
+    unreadable file is logged and yields nothing.
+    """
+    try:
+        f = open(path, "rb")
+    except OSError as e:
+        log.warning("Cannot read %s: %s", path, e)
+        return
+    with f:
+        rest = b""
+        while chunk := f.read(1 << 20):
+            lines = (rest + chunk).splitlines(True)
+            # The last line may continue in the next chunk, or be the first
+            # half of a \r\n split across chunks
+            rest = lines.pop()
+            for raw in lines:
+                yield raw.strip().decode("utf-8", "replace")
+        if rest:
+            yield rest.strip().decode("utf-8", "replace")
+
+
+def _run_jobs(func, jobs: list, parallel: bool) -> list:
+    """Call func(*args) for each args tuple in jobs and return the results in order.
+
+    With parallel set and more than one CPU, the calls are spread over a
+    process pool; otherwise, or if the pool cannot be used, they run here.
+    Workers are spawned, never forked: the GUI parses from a worker thread,
+    and forking a threaded Tk process can deadlock the child.
+    """
+    workers = min(os.cpu_count() or 1, len(jobs))
+    if parallel and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                return list(pool.map(func, *zip(*jobs), chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as exc:
+            log.debug("Process pool unavailable (%s), parsing serially", exc)
+    return [func(*args) for args in jobs]
+
+
+@functools.lru_cache(maxsize=4096)
+def _symbol_name_to_pad(name: str) -> PadDef:
+    """Decode standard ODB++ symbol names into pad definitions.
+
+    Common patterns:
+        r<diameter>          - round pad
+        s<size>              - square pad
+        rect<w>x<h>          - rectangle
+        oval<w>x<h>          - oval
+        donut_r<od>x<id>     - annular ring
+        rc<w>x<h>x<corner>   - rounded rectangle
+    All dimensions are typically in mils (thousandths of an inch).
+
+    Results are cached by name, so the returned PadDef is shared and must
+    not be modified.
+    """
+    m = _RE_SYM.match(name)
+    if m:
+        def mil(group):
+            return convert_to_mm(parse_float(m.group(group)), "MIL")
+
+        kind = m.lastgroup
+        if kind == "round":
+            d = mil("round_d")
+            return PadDef(shape=PadShape.CIRCLE, width=d, height=d)
+        if kind == "square":
+            d = mil("square_d")
+            return PadDef(shape=PadShape.RECT, width=d, height=d)
+        if kind == "rect":
+            return PadDef(shape=PadShape.RECT, width=mil("rect_w"), height=mil("rect_h"))
+        if kind == "oval":
+            return PadDef(shape=PadShape.OVAL, width=mil("oval_w"), height=mil("oval_h"))
+        if kind == "rc":
+            w = mil("rc_w")
+            h = mil("rc_h")
+            corner = mil("rc_r")
+            ratio = corner / min(w, h) * 2 if min(w, h) > 0 else 0.25
+            return PadDef(shape=PadShape.ROUNDRECT, width=w, height=h,
+                          roundrect_ratio=min(ratio, 0.5))
+        if kind == "donut":
+            od = mil("donut_od")
+            return PadDef(shape=PadShape.CIRCLE, width=od, height=od)
+        # Thermal: thermal patterns - treat as circle
+        d = mil("thermal_d")
+        return PadDef(shape=PadShape.CIRCLE, width=d, height=d)
+
+    # Fallback: try to extract any dimension
+    m = _RE_SYM_DIM.match(name)
+    if m:
+        d = convert_to_mm(parse_float(m.group(1)), "MIL")
+        if d > 0:
+            return PadDef(shape=PadShape.CIRCLE, width=d, height=d)
+
+    return PadDef(shape=PadShape.CUSTOM, width=1.0, height=1.0)
+
 
 def parse_odb(path: Path) -> PcbModel:
     """Parse an ODB++ archive or directory and return a PcbModel.
@@ -46,8 +313,71 @@ def parse_odb(path: Path) -> PcbModel:
         Populated PcbModel
     """
     reset_uuid_counter()
+    path = Path(path)
+    cache_path = None
+    if os.environ.get(_CACHE_ENV, "") not in ("", "0"):
+        try:
+            cache_path = _CACHE_DIR / f"{_cache_key(path)}.pkl"
+        except OSError:
+            pass
+        else:
+            model = _load_cached_model(cache_path)
+            if model is not None:
+                log.info("Loaded cached model %s", cache_path)
+                return model
+
     parser = OdbParser()
-    return parser.parse(path)
+    model = parser.parse(path)
+    if cache_path is not None:
+        _store_cached_model(cache_path, model)
+    return model
+
+
+def _cache_key(path: Path) -> str:
+    """Hash an archive's bytes, or every file's name and bytes under a directory."""
+    h = hashlib.blake2b(_CACHE_VERSION, digest_size=16)
+    if path.is_dir():
+        files = sorted(p for p in path.rglob("*") if p.is_file())
+    else:
+        files = [path]
+    for f in files:
+        if f != path:
+            h.update(b"%s\0%d\0" % (f.relative_to(path).as_posix().encode(),
+                                      f.stat().st_size))
+        with open(f, "rb") as fh:
+            while chunk := fh.read(_EXTRACT_BUFSIZE):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _load_cached_model(cache_path: Path) -> Optional[PcbModel]:
+    """Return the cached model, or None if it is missing or unreadable."""
+    try:
+        with open(cache_path, "rb") as f:
+            model = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Truncated or from an incompatible version; re-parse and overwrite
+        log.debug("Ignoring model cache %s: %s", cache_path, e)
+        return None
+    return model if isinstance(model, PcbModel) else None
+
+
+def _store_cached_model(cache_path: Path, model: PcbModel):
+    """Save the model; failures only cost a re-parse next run."""
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError) as e:
+        log.debug("Could not write model cache %s: %s", cache_path, e)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
 
 
 class OdbParser:
@@ -66,13 +396,17 @@ class OdbParser:
         # Per-layer symbol tables: maps local index -> symbol_name
         self._layer_sym_tables = {}
         # EDA net data: feature_id -> net_index (per layer)
-        self._layer_net_map = {}  # layer_name -> {feature_id -> net_index}
+        self._layer_net_map = {}  # (layer_name, feature_id) -> net_index
         # EDA package data: pkg_name -> list of pin PadDefs
         self._eda_packages = {}
+        # Nets as parsed from eda/data: net_index -> NetDef
+        self._net_by_index = {}
         # EDA subnet feature mapping: net_index -> list of (layer, feature_id)
         self._subnet_features = {}
         # Drill tool table: tool_num -> diameter (mm)
         self._drill_tools = {}
+        # Directory listings for _find_ci: dir -> {lowercased name -> Path}
+        self._ci_cache = {}
 
     def parse(self, path: Path) -> PcbModel:
         path = Path(path)
@@ -94,10 +428,10 @@ class OdbParser:
             # Ensure net 0 (unconnected) exists
             if not self.model.nets or self.model.nets[0].name != "":
                 self.model.nets.insert(0, NetDef(index=0, name=""))
-            # Re-index nets
+            # Re-index nets, then build the name lookup from the final indices
             for i, nd in enumerate(self.model.nets):
                 nd.index = i
-                self.model._net_name_to_index[nd.name] = i
+            self.model._net_name_to_index = {nd.name: nd.index for nd in self.model.nets}
 
             return self.model
         finally:
@@ -114,48 +448,88 @@ class OdbParser:
         dest = Path(self._temp_dir)
 
         if path.suffixes[-2:] == [".tar", ".gz"] or path.suffix == ".tgz":
-            with tarfile.open(path, "r:gz") as tf:
-                tf.extractall(dest, filter="data")
+            self._extract_tgz(path, dest)
         elif path.suffix == ".zip":
-            with zipfile.ZipFile(path, "r") as zf:
-                zf.extractall(dest)
+            self._extract_zip(path, dest)
         else:
             raise ValueError(f"Unsupported archive format: {path}")
 
         self.root = dest
 
+    def _extract_tgz(self, path: Path, dest: Path):
+        """Extract a gzipped tar, decompressing through pigz when available.
+
+        Either way the tar is read as a stream and extracted by tarfile, so
+        the "data" filter still guards against unsafe members.
+        """
+        pigz = shutil.which("pigz")
+        if not pigz:
+            with tarfile.open(path, "r|gz", bufsize=_EXTRACT_BUFSIZE) as tf:
+                tf.extractall(dest, filter="data")
+            return
+
+        with subprocess.Popen([pigz, "-dc", str(path)], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as proc:
+            with tarfile.open(fileobj=proc.stdout, mode="r|",
+                              bufsize=_EXTRACT_BUFSIZE) as tf:
+                tf.extractall(dest, filter="data")
+        if proc.returncode:
+            raise tarfile.ReadError(f"pigz failed on {path} (exit {proc.returncode})")
+
+    def _extract_zip(self, path: Path, dest: Path):
+        """Extract a zip with one thread per member; zlib releases the GIL."""
+        with zipfile.ZipFile(path, "r") as zf:
+            # Later entries win for duplicate names, as with extractall()
+            members = list({info.filename: info for info in zf.infolist()}.values())
+
+            def extract(info):
+                try:
+                    zf.extract(info, dest)
+                except FileExistsError:
+                    # Another thread created a shared parent directory
+                    # between zipfile's exists() check and its makedirs()
+                    zf.extract(info, dest)
+
+            with ThreadPoolExecutor() as pool:
+                # list() re-raises the first extraction error, if any
+                list(pool.map(extract, members))
+
     def _cleanup(self):
         if self._temp_dir:
-            import shutil
             shutil.rmtree(self._temp_dir, ignore_errors=True)
 
     def _find_root(self):
-        """Locate the ODB++ root by finding matrix/matrix file."""
-        # Might be directly in root, or one level down
-        for candidate in [self.root] + list(self.root.iterdir()):
-            if candidate.is_dir():
-                matrix = candidate / "matrix" / "matrix"
-                if matrix.exists():
-                    self.root = candidate
-                    return
-                # Try case-insensitive
-                matrix_dir = self._find_ci(candidate, "matrix")
-                if matrix_dir and self._find_ci(matrix_dir, "matrix"):
+        """Locate the ODB++ root by finding matrix/matrix file.
+
+        Searches breadth-first from the extracted root, at most two
+        directory levels down, so a wrapper directory or two is fine.
+        """
+        level = [self.root]
+        for depth in range(3):
+            next_level = []
+            for candidate in level:
+                if self._has_matrix(candidate):
                     self.root = candidate
                     return
-        # Try two levels deep
-        for child in self.root.iterdir():
-            if child.is_dir():
-                for grandchild in child.iterdir():
-                    if grandchild.is_dir():
-                        matrix = grandchild / "matrix" / "matrix"
-                        if matrix.exists():
-                            self.root = grandchild
-                            return
+                if depth < 2:
+                    try:
+                        with os.scandir(candidate) as it:
+                            subdirs = [e.path for e in it if e.is_dir()]
+                    except OSError:
+                        continue
+                    next_level.extend(Path(d) for d in sorted(subdirs))
+            level = next_level
         raise FileNotFoundError(
             f"Cannot find matrix/matrix in {self.root}. Not a valid ODB++ archive."
         )
 
+    def _has_matrix(self, candidate: Path) -> bool:
+        """Check for matrix/matrix under candidate, trying the exact case first."""
+        if (candidate / "matrix" / "matrix").exists():
+            return True
+        matrix_dir = self._find_ci(candidate, "matrix")
+        return matrix_dir is not None and self._find_ci(matrix_dir, "matrix") is not None
+
     def _find_step(self):
         """Find the first step directory."""
         steps_dir = self._find_ci(self.root, "steps")
@@ -168,14 +542,27 @@ class OdbParser:
         raise FileNotFoundError("No step found in steps/ directory")
 
     def _find_ci(self, parent: Path, name: str) -> Optional[Path]:
-        """Case-insensitive directory/file lookup."""
-        target = name.lower()
-        if not parent.exists():
-            return None
-        for entry in parent.iterdir():
-            if entry.name.lower() == target:
-                return entry
-        return None
+        """Case-insensitive directory/file lookup.
+
+        An exact-case match costs one stat. Otherwise each directory is
+        listed once and later lookups hit the cached lowercased-name map
+        (the tree is not modified while parsing).
+        """
+        direct = parent / name
+        if direct.exists():
+            return direct
+        return self._dir_entries(parent).get(name.lower())
+
+    def _dir_entries(self, parent: Path) -> dict:
+        """Cached listing of parent as {lowercased name: Path}, in listing order."""
+        entries = self._ci_cache.get(parent)
+        if entries is None:
+            entries = {}
+            if parent.is_dir():
+                for entry in parent.iterdir():
+                    entries.setdefault(entry.name.lower(), entry)
+            self._ci_cache[parent] = entries
+        return entries
 
     def _step_path(self) -> Path:
         steps = self._find_ci(self.root, "steps")
@@ -191,15 +578,11 @@ class OdbParser:
             current = found
         if current.is_file():
             try:
-                return current.read_text(encoding="utf-8", errors="replace")
+                return _read_text(current)
             except Exception:
                 return None
         return None
 
-    def _read_step_file(self, *parts) -> Optional[str]:
-        """Read a file under the current step directory."""
-        return self._read_file("steps", self.step_name, *parts)
-
     def _find_step_path(self, *parts) -> Optional[Path]:
         """Find a path under the current step directory."""
         current = self._step_path()
@@ -265,33 +648,19 @@ class OdbParser:
                 continue
 
             # Parse key=value pairs
-            m = re.match(r"(\w+)\s*=\s*(.*)", line)
-            if not m:
+            key, eq, val = line.partition("=")
+            if not eq:
                 continue
-            key, val = m.group(1).upper(), m.group(2).strip()
-
-            if key == "NAME":
-                current_layer.odb_name = val
-            elif key == "TYPE":
-                current_layer.layer_type = self._classify_layer_type(val)
-            elif key == "CONTEXT":
-                pass  # BOARD or MISC
-            elif key == "POLARITY":
-                current_layer.polarity = val.lower()
-            elif key == "ROW" or key == "OLD_NAME":
-                pass
-            elif key == "START_NAME":
-                # Drill span
-                pass
-            elif key == "END_NAME":
-                pass
+            handler = _MATRIX_HANDLERS.get(key.strip().upper())
+            if handler:
+                handler(current_layer, val.strip())
 
         # Now assign KiCad names and layer IDs
         copper_order = 0
         copper_layers = []
         for layer in layers:
             lt = layer.layer_type
-            if lt in (LayerType.SIGNAL, LayerType.POWER, LayerType.MIXED):
+            if lt in _COPPER_TYPES:
                 layer.copper_order = copper_order
                 copper_layers.append(layer)
                 copper_order += 1
@@ -316,24 +685,24 @@ class OdbParser:
         for layer in layers:
             lt = layer.layer_type
             name_lower = layer.odb_name.lower()
-            if lt in (LayerType.SIGNAL, LayerType.POWER, LayerType.MIXED):
+            if lt in _COPPER_TYPES:
                 continue  # Already mapped
             elif lt == LayerType.SOLDER_MASK:
-                if "top" in name_lower or "front" in name_lower or "comp" in name_lower:
+                if _TOP_RE.search(name_lower):
                     layer.kicad_name = "F.Mask"
                     layer.side = Side.TOP
                 else:
                     layer.kicad_name = "B.Mask"
                     layer.side = Side.BOTTOM
             elif lt == LayerType.SILK_SCREEN:
-                if "top" in name_lower or "front" in name_lower or "comp" in name_lower:
+                if _TOP_RE.search(name_lower):
                     layer.kicad_name = "F.SilkS"
                     layer.side = Side.TOP
                 else:
                     layer.kicad_name = "B.SilkS"
                     layer.side = Side.BOTTOM
             elif lt == LayerType.SOLDER_PASTE:
-                if "top" in name_lower or "front" in name_lower or "comp" in name_lower:
+                if _TOP_RE.search(name_lower):
                     layer.kicad_name = "F.Paste"
                     layer.side = Side.TOP
                 else:
@@ -342,7 +711,7 @@ class OdbParser:
             elif lt == LayerType.DRILL:
                 layer.kicad_name = "drill"  # handled specially
             elif lt == LayerType.COMPONENT:
-                if "top" in name_lower or "comp" in name_lower:
+                if _COMP_TOP_RE.search(name_lower):
                     layer.kicad_name = "F.Fab"
                     layer.side = Side.TOP
                 else:
@@ -361,41 +730,27 @@ class OdbParser:
 
         log.info("Found %d layers (%d copper)", len(layers), len(copper_layers))
 
-    def _classify_layer_type(self, type_str: str) -> LayerType:
-        t = type_str.upper().strip()
-        mapping = {
-            "SIGNAL": LayerType.SIGNAL,
-            "POWER_GROUND": LayerType.POWER,
-            "POWER": LayerType.POWER,
-            "MIXED": LayerType.MIXED,
-            "SOLDER_MASK": LayerType.SOLDER_MASK,
-            "SILK_SCREEN": LayerType.SILK_SCREEN,
-            "SOLDER_PASTE": LayerType.SOLDER_PASTE,
-            "DRILL": LayerType.DRILL,
-            "DOCUMENT": LayerType.DOCUMENT,
-            "COMPONENT": LayerType.COMPONENT,
-            "ROUT": LayerType.DRILL,
-        }
-        return mapping.get(t, LayerType.OTHER)
+    @staticmethod
+    def _classify_layer_type(type_str: str) -> LayerType:
+        # Matrix values arrive already stripped
+        return _LAYER_TYPES.get(type_str.upper(), LayerType.OTHER)
 
     # ── steps/<step>/profile ──────────────────────────────────────────
 
     def _parse_profile(self):
-        content = self._read_step_file("profile")
-        if not content:
+        profile_path = self._find_step_path("profile")
+        if not profile_path or not profile_path.is_file():
             log.warning("Profile not found, no board outline")
             return
 
-        lines_list = content.splitlines()
-        i = 0
         outline_items = []
         in_surface = False
-        contour_points = []
-
-        while i < len(lines_list):
-            line = lines_list[i].strip()
-            i += 1
+        # Only the contour's first and latest points are needed; the count
+        # decides whether OE has anything to close
+        first_x = first_y = last_x = last_y = 0.0
+        n_points = 0
 
+        for line in _iter_file_lines(profile_path):
             # ODB++ profile can use simple coordinate records or surface records
             # Format: OB x y   (outline begin)
             #          OS x y   (outline segment - line)
@@ -403,78 +758,89 @@ class OdbParser:
             #          OE        (outline end)
             # Or: S P 0 ... (surface)
 
-            m = re.match(r"^OB\s+([\d.eE+-]+)\s+([\d.eE+-]+)", line, re.I)
-            if m:
-                sx = convert_to_mm(parse_float(m.group(1)), self.units)
-                sy = convert_to_mm(parse_float(m.group(2)), self.units)
-                contour_points = [(sx, negate_y(sy))]
+            parts = line.split()
+            if not parts:
+                continue
+            kind = parts[0].upper()
+
+            if kind == "OB":
+                vals = _record_floats(parts, line, _RE_OB, 2)
+                if vals:
+                    sx = convert_to_mm(vals[0], self.units)
+                    sy = convert_to_mm(vals[1], self.units)
+                    first_x = last_x = sx
+                    first_y = last_y = negate_y(sy)
+                    n_points = 1
                 continue
 
-            m = re.match(r"^OS\s+([\d.eE+-]+)\s+([\d.eE+-]+)", line, re.I)
-            if m:
-                ex = convert_to_mm(parse_float(m.group(1)), self.units)
-                ey = convert_to_mm(parse_float(m.group(2)), self.units)
-                if contour_points:
-                    px, py = contour_points[-1]
+            if kind == "OS":
+                vals = _record_floats(parts, line, _RE_OS, 2)
+                if not vals:
+                    continue
+                ex = convert_to_mm(vals[0], self.units)
+                ey_k = negate_y(convert_to_mm(vals[1], self.units))
+                if n_points:
                     outline_items.append(GraphicItem(
                         item_type="line",
                         layer="Edge.Cuts",
-                        start=Point(px, py),
-                        end=Point(ex, negate_y(ey)),
+                        start=Point(last_x, last_y),
+                        end=Point(ex, ey_k),
                         width=0.05,
                     ))
-                contour_points.append((ex, negate_y(ey)))
+                else:
+                    first_x, first_y = ex, ey_k
+                last_x, last_y = ex, ey_k
+                n_points += 1
                 continue
 
-            m = re.match(
-                r"^OC\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)",
-                line, re.I
-            )
-            if m:
-                ex = convert_to_mm(parse_float(m.group(1)), self.units)
-                ey = convert_to_mm(parse_float(m.group(2)), self.units)
-                cx = convert_to_mm(parse_float(m.group(3)), self.units)
-                cy = convert_to_mm(parse_float(m.group(4)), self.units)
-                cw = m.group(5).upper() == "Y"
-
-                if contour_points:
-                    px, py = contour_points[-1]
-                    # Convert to KiCad Y-down
-                    ey_k = negate_y(ey)
+            if kind == "OC":
+                vals = _record_floats(parts, line, _RE_OC, 4)
+                if not vals or len(parts) < 6:
+                    continue
+                ex = convert_to_mm(vals[0], self.units)
+                ey = convert_to_mm(vals[1], self.units)
+                cx = convert_to_mm(vals[2], self.units)
+                cy = convert_to_mm(vals[3], self.units)
+                cw = parts[5].upper() == "Y"
+
+                # Convert to KiCad Y-down
+                ey_k = negate_y(ey)
+                if n_points:
                     cy_k = negate_y(cy)
-                    mid_x, mid_y = arc_center_to_mid(px, py, ex, ey_k, cx, cy_k, cw)
+                    mid_x, mid_y = arc_center_to_mid(last_x, last_y, ex, ey_k, cx, cy_k, cw)
                     outline_items.append(GraphicItem(
                         item_type="arc",
                         layer="Edge.Cuts",
-                        start=Point(px, py),
+                        start=Point(last_x, last_y),
                         end=Point(ex, ey_k),
                         mid=Point(mid_x, mid_y),
                         width=0.05,
                     ))
-                contour_points.append((ex, negate_y(ey)))
+                else:
+                    first_x, first_y = ex, ey_k
+                last_x, last_y = ex, ey_k
+                n_points += 1
                 continue
 
-            if re.match(r"^OE\b", line, re.I):
+            if kind == "OE":
                 # Close the outline if needed
-                if len(contour_points) >= 2:
-                    first = contour_points[0]
-                    last = contour_points[-1]
-                    if abs(first[0] - last[0]) > 0.001 or abs(first[1] - last[1]) > 0.001:
+                if n_points >= 2:
+                    if abs(first_x - last_x) > 0.001 or abs(first_y - last_y) > 0.001:
                         outline_items.append(GraphicItem(
                             item_type="line",
                             layer="Edge.Cuts",
-                            start=Point(last[0], last[1]),
-                            end=Point(first[0], first[1]),
+                            start=Point(last_x, last_y),
+                            end=Point(first_x, first_y),
                             width=0.05,
                         ))
-                contour_points = []
+                n_points = 0
                 continue
 
             # Handle surface-based profile (S P 0 ...)
             if line.upper().startswith("S P"):
                 in_surface = True
                 continue
-            if in_surface and line.upper().startswith("SE"):
+            if in_surface and kind.startswith("SE"):
                 in_surface = False
                 continue
 
@@ -484,18 +850,16 @@ class OdbParser:
     # ── steps/<step>/eda/data ─────────────────────────────────────────
 
     def _parse_eda_data(self):
-        content = self._read_step_file("eda", "data")
-        if not content:
+        data_path = self._find_step_path("eda", "data")
+        if not data_path or not data_path.is_file():
             log.warning("eda/data not found, no netlist data")
             return
 
-        lines = content.splitlines()
-        i = 0
         current_net = None
         current_net_index = 0
         net_list = []  # (name, index)
         # Per-layer feature-to-net mapping
-        layer_feature_net = {}  # layer_name -> {feature_id -> net_index}
+        layer_feature_net = {}  # (layer_name, feature_id) -> net_index
         # Package data
         current_pkg = None
         pkg_pins = {}  # pkg_name -> list of pin info dicts
@@ -505,48 +869,48 @@ class OdbParser:
 
         net_idx = 1  # 0 is reserved for no-net
 
-        while i < len(lines):
-            line = lines[i].strip()
-            i += 1
-
+        for line in _iter_file_lines(data_path):
             if not line or line.startswith("#"):
                 continue
 
+            parts = line.split()
+            kind = parts[0].upper()
+
             # NET <name>
-            m = re.match(r"^NET\s+(\S+)", line, re.I)
-            if m:
-                current_net = m.group(1)
+            if kind == "NET" and len(parts) > 1:
+                current_net = parts[1]
                 in_net = True
                 in_pkg = False
                 net_list.append(NetDef(index=net_idx, name=current_net))
-                self.model._net_name_to_index[current_net] = net_idx
                 current_net_index = net_idx
                 net_idx += 1
                 continue
 
             # SNT (subnet) - contains feature references for net
-            m = re.match(r"^SNT\s+(\w+)", line, re.I)
-            if m:
+            if kind == "SNT" and len(parts) > 1:
                 in_subnet = True
                 continue
 
             # FID (feature id reference within subnet)
             # FID L <layer> <feature_id> [P|T]
-            m = re.match(r"^FID\s+(\w)\s+(\S+)\s+(\d+)", line, re.I)
-            if m and current_net:
-                fid_type = m.group(1).upper()
-                layer_name = m.group(2)
-                feature_id = parse_int(m.group(3))
-
-                if layer_name not in layer_feature_net:
-                    layer_feature_net[layer_name] = {}
-                layer_feature_net[layer_name][feature_id] = current_net_index
+            if kind == "FID" and current_net:
+                if len(parts) >= 4 and parts[3].isdecimal():
+                    layer_name = parts[2]
+                    feature_id = int(parts[3])
+                else:
+                    m = _RE_FID.match(line)
+                    if not m:
+                        continue
+                    layer_name = m.group(2)
+                    feature_id = int(m.group(3))
+
+                # Interned so the keys share one string per layer
+                layer_feature_net[(sys.intern(layer_name), feature_id)] = current_net_index
                 continue
 
             # PKG <name>
-            m = re.match(r"^PKG\s+(\S+)", line, re.I)
-            if m:
-                current_pkg = m.group(1)
+            if kind == "PKG" and len(parts) > 1:
+                current_pkg = parts[1]
                 in_pkg = True
                 in_net = False
                 if current_pkg not in pkg_pins:
@@ -555,18 +919,15 @@ class OdbParser:
 
             # PIN records within PKG
             # PIN <name> <type> <x> <y> ...
-            m = re.match(r"^PIN\s+(\S+)\s+(\w+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)", line, re.I)
-            if m and current_pkg and in_pkg:
-                pin_name = m.group(1)
-                pin_type = m.group(2)
-                px = parse_float(m.group(3))
-                py = parse_float(m.group(4))
-                pkg_pins[current_pkg].append({
-                    "name": pin_name,
-                    "type": pin_type,
-                    "x": px,
-                    "y": py,
-                })
+            if kind == "PIN" and current_pkg and in_pkg:
+                vals = _record_floats(parts, line, _RE_PIN, 2, first=3)
+                if vals:
+                    pkg_pins[current_pkg].append({
+                        "name": parts[1],
+                        "type": parts[2],
+                        "x": vals[0],
+                        "y": vals[1],
+                    })
                 continue
 
             if line == "$" or line.startswith("$"):
@@ -574,6 +935,7 @@ class OdbParser:
                 continue
 
         self.model.nets = [NetDef(index=0, name="")] + net_list
+        self._net_by_index = {nd.index: nd for nd in self.model.nets}
         self._layer_net_map = layer_feature_net
         self._eda_packages = pkg_pins
 
@@ -591,205 +953,67 @@ class OdbParser:
             log.warning("No symbols directory found")
             return
 
-        for entry in sorted(sym_dir.iterdir()):
-            if entry.is_dir():
-                self._parse_symbol_dir(entry)
+        jobs = [(entry, self.units) for entry in sorted(sym_dir.iterdir())
+                if entry.is_dir()]
+        parallel = len(jobs) >= _PARALLEL_MIN_SYMBOLS
+        for name, pad_def in _run_jobs(_parse_symbol_dir, jobs, parallel):
+            self._symbol_defs[name] = pad_def
 
         log.info("Parsed %d symbol definitions", len(self._symbol_defs))
 
-    def _parse_symbol_dir(self, sym_path: Path):
-        """Parse a single symbol directory."""
-        name = sym_path.name
-        features_file = self._find_ci(sym_path, "features")
-
-        # First, try to determine shape from the name
-        pad_def = self._symbol_name_to_pad(name)
-
-        # If we have a features file with custom geometry, parse it
-        if features_file and pad_def.shape == PadShape.CUSTOM:
-            pad_def = self._parse_symbol_features(features_file) or pad_def
-
-        self._symbol_defs[name] = pad_def
-
-    def _symbol_name_to_pad(self, name: str) -> PadDef:
-        """Decode standard ODB++ symbol names into pad definitions.
-
-        Common patterns:
-            r<diameter>          - round pad
-            s<size>              - square pad
-            rect<w>x<h>          - rectangle
-            oval<w>x<h>          - oval
-            donut_r<od>x<id>     - annular ring
-            rc<w>x<h>x<corner>   - rounded rectangle
-        All dimensions are typically in mils (thousandths of an inch).
-        """
-        # Round: r100, r50
-        m = re.match(r"^r([\d.]+)$", name, re.I)
-        if m:
-            d = convert_to_mm(parse_float(m.group(1)), "MIL")
-            return PadDef(shape=PadShape.CIRCLE, width=d, height=d)
-
-        # Square: s100
-        m = re.match(r"^s([\d.]+)$", name, re.I)
-        if m:
-            d = convert_to_mm(parse_float(m.group(1)), "MIL")
-            return PadDef(shape=PadShape.RECT, width=d, height=d)
-
-        # Rectangle: rect100x50
-        m = re.match(r"^rect([\d.]+)x([\d.]+)$", name, re.I)
-        if m:
-            w = convert_to_mm(parse_float(m.group(1)), "MIL")
-            h = convert_to_mm(parse_float(m.group(2)), "MIL")
-            return PadDef(shape=PadShape.RECT, width=w, height=h)
-
-        # Oval: oval100x50
-        m = re.match(r"^oval([\d.]+)x([\d.]+)$", name, re.I)
-        if m:
-            w = convert_to_mm(parse_float(m.group(1)), "MIL")
-            h = convert_to_mm(parse_float(m.group(2)), "MIL")
-            return PadDef(shape=PadShape.OVAL, width=w, height=h)
-
-        # Rounded rectangle: rc100x50x10 or rcr100x50xr10
-        m = re.match(r"^rc[r]?([\d.]+)x([\d.]+)x[r]?([\d.]+)$", name, re.I)
-        if m:
-            w = convert_to_mm(parse_float(m.group(1)), "MIL")
-            h = convert_to_mm(parse_float(m.group(2)), "MIL")
-            corner = convert_to_mm(parse_float(m.group(3)), "MIL")
-            ratio = corner / min(w, h) * 2 if min(w, h) > 0 else 0.25
-            return PadDef(shape=PadShape.ROUNDRECT, width=w, height=h,
-                          roundrect_ratio=min(ratio, 0.5))
-
-        # Donut: donut_r100x50
-        m = re.match(r"^donut_r([\d.]+)x([\d.]+)$", name, re.I)
-        if m:
-            od = convert_to_mm(parse_float(m.group(1)), "MIL")
-            return PadDef(shape=PadShape.CIRCLE, width=od, height=od)
-
-        # Thermal: thermal patterns - treat as circle
-        m = re.match(r"^th[r]?([\d.]+)", name, re.I)
-        if m:
-            d = convert_to_mm(parse_float(m.group(1)), "MIL")
-            return PadDef(shape=PadShape.CIRCLE, width=d, height=d)
-
-        # Fallback: try to extract any dimension
-        m = re.match(r"^[\w]*?([\d.]+)", name)
-        if m:
-            d = convert_to_mm(parse_float(m.group(1)), "MIL")
-            if d > 0:
-                return PadDef(shape=PadShape.CIRCLE, width=d, height=d)
-
-        return PadDef(shape=PadShape.CUSTOM, width=1.0, height=1.0)
-
-    def _parse_symbol_features(self, features_path: Path) -> Optional[PadDef]:
-        """Parse a symbol's features file for custom geometry."""
-        try:
-            content = features_path.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            return None
-
-        # Extract contour/surface from symbol features
-        outline_pts = []
-        in_surface = False
-        x_min = y_min = float("inf")
-        x_max = y_max = float("-inf")
-
-        for line in content.splitlines():
-            line = line.strip()
-            if line.startswith("S P") or line.startswith("s p"):
-                in_surface = True
-                continue
-            if in_surface:
-                # OB x y - outline begin
-                m = re.match(r"^OB\s+([\d.eE+-]+)\s+([\d.eE+-]+)", line, re.I)
-                if m:
-                    x = convert_to_mm(parse_float(m.group(1)), self.units)
-                    y = convert_to_mm(parse_float(m.group(2)), self.units)
-                    outline_pts.append((x, y))
-                    x_min, x_max = min(x_min, x), max(x_max, x)
-                    y_min, y_max = min(y_min, y), max(y_max, y)
-                    continue
-
-                m = re.match(r"^OS\s+([\d.eE+-]+)\s+([\d.eE+-]+)", line, re.I)
-                if m:
-                    x = convert_to_mm(parse_float(m.group(1)), self.units)
-                    y = convert_to_mm(parse_float(m.group(2)), self.units)
-                    outline_pts.append((x, y))
-                    x_min, x_max = min(x_min, x), max(x_max, x)
-                    y_min, y_max = min(y_min, y), max(y_max, y)
-                    continue
-
-                if line.upper().startswith("SE"):
-                    in_surface = False
-                    continue
-
-        if outline_pts:
-            w = x_max - x_min
-            h = y_max - y_min
-            # Center the outline
-            cx = (x_min + x_max) / 2
-            cy = (y_min + y_max) / 2
-            centered = [(x - cx, y - cy) for x, y in outline_pts]
-            return PadDef(
-                shape=PadShape.CUSTOM,
-                width=max(w, 0.01),
-                height=max(h, 0.01),
-                custom_outline=centered,
-            )
-        return None
+    # Kept on the class for callers that decode names through a parser
+    _symbol_name_to_pad = staticmethod(_symbol_name_to_pad)
 
     # ── Component layers ──────────────────────────────────────────────
 
     def _parse_components(self):
         """Parse component placements from comp_+_top and comp_+_bot."""
-        for side_name, side in [("top", Side.TOP), ("bottom", Side.BOTTOM)]:
-            self._parse_component_layer(side_name, side)
+        comp_dirs = self._index_component_dirs()
+        for side in (Side.TOP, Side.BOTTOM):
+            if comp_dirs[side]:
+                self._parse_component_layer(comp_dirs[side], side)
 
         log.info("Parsed %d component instances", len(self.model.components))
 
-    def _parse_component_layer(self, side_name: str, side: Side):
-        """Parse components from a specific side."""
-        # Find the component layer directory
-        step = self._step_path()
-        if not step:
-            return
+    def _index_component_dirs(self) -> dict:
+        """Find the component layer directory for each side in one pass.
 
-        layers_dir = self._find_ci(step, "layers")
+        Returns {Side.TOP: Path or None, Side.BOTTOM: Path or None}.
+        """
+        comp_dirs = {Side.TOP: None, Side.BOTTOM: None}
+        step = self._step_path()
+        layers_dir = self._find_ci(step, "layers") if step else None
         if not layers_dir:
-            return
+            return comp_dirs
 
         # Look for comp_+_top, comp_+_bot, or similar names
-        comp_dir = None
-        for entry in layers_dir.iterdir():
-            name_lower = entry.name.lower()
-            if entry.is_dir() and "comp" in name_lower:
-                if side_name == "top" and ("top" in name_lower or name_lower.endswith("_t")):
-                    comp_dir = entry
-                    break
-                elif side_name == "bottom" and ("bot" in name_lower or name_lower.endswith("_b")):
-                    comp_dir = entry
-                    break
+        for name_lower, entry in self._dir_entries(layers_dir).items():
+            if "comp" not in name_lower or not entry.is_dir():
+                continue
+            if not comp_dirs[Side.TOP] and ("top" in name_lower or name_lower.endswith("_t")):
+                comp_dirs[Side.TOP] = entry
+            if not comp_dirs[Side.BOTTOM] and ("bot" in name_lower or name_lower.endswith("_b")):
+                comp_dirs[Side.BOTTOM] = entry
 
         # Also check COMPONENT type layers from matrix
-        if not comp_dir:
+        for side, side_re in ((Side.TOP, _COMP_TOP_RE), (Side.BOTTOM, _COMP_BOT_RE)):
+            if comp_dirs[side]:
+                continue
             for layer in self.model.layers:
-                if layer.layer_type == LayerType.COMPONENT:
-                    name_lower = layer.odb_name.lower()
-                    if side_name == "top" and ("top" in name_lower or "comp" in name_lower):
-                        comp_dir = self._find_ci(layers_dir, layer.odb_name)
-                        break
-                    elif side_name == "bottom" and ("bot" in name_lower or "sold" in name_lower):
-                        comp_dir = self._find_ci(layers_dir, layer.odb_name)
-                        break
-
-        if not comp_dir:
-            return
+                if layer.layer_type == LayerType.COMPONENT and side_re.search(layer.odb_name):
+                    comp_dirs[side] = self._find_ci(layers_dir, layer.odb_name)
+                    break
 
+        return comp_dirs
+
+    def _parse_component_layer(self, comp_dir: Path, side: Side):
+        """Parse components from a specific side's component layer."""
         comp_file = self._find_ci(comp_dir, "components")
         if not comp_file:
             return
 
         try:
-            content = comp_file.read_text(encoding="utf-8", errors="replace")
+            content = _read_text(comp_file)
         except Exception:
             return
 
@@ -802,17 +1026,18 @@ class OdbParser:
             if not line or line.startswith("#"):
                 continue
 
+            kind = line.split(None, 1)[0].upper()
+
             # CMP <index> <x> <y> <rotation> <mirror> <comp_name> ; ...
-            m = re.match(
-                r"^CMP\s+(\d+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)\s+(\S+)",
-                line, re.I
-            )
-            if m:
+            if kind == "CMP":
+                m = _RE_CMP.match(line)
+                if not m:
+                    continue
                 # Save previous component
                 if current_comp:
                     self._finalize_component(current_comp, current_pads, current_props, side)
 
-                idx = parse_int(m.group(1))
+                idx = int(m.group(1))
                 x = convert_to_mm(parse_float(m.group(2)), self.units)
                 y = convert_to_mm(parse_float(m.group(3)), self.units)
                 rot = parse_float(m.group(4))
@@ -832,65 +1057,34 @@ class OdbParser:
 
                 # Extract reference from ;ID= or ;REF= or part after semicolons
                 rest = line[m.end():]
-                ref_m = re.search(r";\s*(?:ID|REF)\s*=\s*(\S+)", rest, re.I)
+                ref_m = _RE_CMP_REF.search(rest)
                 if ref_m:
                     current_comp["ref"] = ref_m.group(1)
                 continue
 
             # TOP <pin_num> <x> <y> <rotation> <mirror> <net_name> <pad_usage> ; ...
-            m = re.match(
-                r"^TOP\s+(\d+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)\s+(\d+)\s+(\d+)",
-                line, re.I
-            )
-            if m and current_comp:
-                pin_num = parse_int(m.group(1))
-                px = convert_to_mm(parse_float(m.group(2)), self.units)
-                py = convert_to_mm(parse_float(m.group(3)), self.units)
-                prot = parse_float(m.group(4))
-                pmirror = m.group(5)
-                net_num = parse_int(m.group(6))
-                pad_usage = parse_int(m.group(7))
-
-                current_pads.append({
-                    "pin": pin_num,
-                    "x": px,
-                    "y": py,
-                    "rotation": prot,
-                    "mirror": pmirror,
-                    "net_num": net_num,
-                    "pad_usage": pad_usage,
-                })
-                continue
-
             # BOT records (same format as TOP but bottom layer)
-            m = re.match(
-                r"^BOT\s+(\d+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)\s+(\d+)\s+(\d+)",
-                line, re.I
-            )
-            if m and current_comp:
-                pin_num = parse_int(m.group(1))
+            if kind == "TOP" or kind == "BOT":
+                m = (_RE_TOP if kind == "TOP" else _RE_BOT).match(line)
+                if not m or not current_comp:
+                    continue
+                pin_num = int(m.group(1))
                 px = convert_to_mm(parse_float(m.group(2)), self.units)
                 py = convert_to_mm(parse_float(m.group(3)), self.units)
                 prot = parse_float(m.group(4))
                 pmirror = m.group(5)
-                net_num = parse_int(m.group(6))
-                pad_usage = parse_int(m.group(7))
-
-                current_pads.append({
-                    "pin": pin_num,
-                    "x": px,
-                    "y": py,
-                    "rotation": prot,
-                    "mirror": pmirror,
-                    "net_num": net_num,
-                    "pad_usage": pad_usage,
-                })
+                net_num = int(m.group(6))
+                pad_usage = int(m.group(7))
+
+                current_pads.append(_PadTmp(
+                    pin_num, px, py, prot, pmirror, net_num, pad_usage))
                 continue
 
             # PRP <key> '<value>'
-            m = re.match(r"^PRP\s+(\S+)\s+'([^']*)'", line, re.I)
-            if m and current_comp:
-                current_props[m.group(1)] = m.group(2)
+            if kind == "PRP":
+                m = _RE_PRP.match(line)
+                if m and current_comp:
+                    current_props[m.group(1)] = m.group(2)
                 continue
 
         # Save last component
@@ -906,20 +1100,18 @@ class OdbParser:
 
         # Build pads
         for pad_data in pads:
-            pin_str = str(pad_data["pin"])
-            pad_x = convert_to_mm(pad_data["x"], self.units) if self.units != "MM" else pad_data["x"]
-            pad_y = convert_to_mm(pad_data["y"], self.units) if self.units != "MM" else pad_data["y"]
+            pin_str = str(pad_data.pin)
+            # Already in mm: TOP/BOT records are converted as they are parsed
+            pad_x = pad_data.x
+            pad_y = pad_data.y
 
             # Try to find pad shape from symbols
             pad_def = PadDef(shape=PadShape.CIRCLE, width=0.5, height=0.5)
 
             # Determine net
-            net_idx = pad_data.get("net_num", 0)
-            net_name = ""
-            for nd in self.model.nets:
-                if nd.index == net_idx:
-                    net_name = nd.name
-                    break
+            net_idx = pad_data.net_num
+            nd = self._net_by_index.get(net_idx)
+            net_name = nd.name if nd else ""
 
             # Determine pad type and layers
             pad_type = "smd"
@@ -932,7 +1124,7 @@ class OdbParser:
                 number=pin_str,
                 pad_def=pad_def,
                 pos=Point(pad_x, negate_y(pad_y)),
-                rotation=pad_data.get("rotation", 0),
+                rotation=pad_data.rotation,
                 net_index=net_idx,
                 net_name=net_name,
                 pad_type=pad_type,
@@ -955,202 +1147,56 @@ class OdbParser:
 
     def _parse_layer_features(self):
         """Parse features from each copper layer."""
+        found = []
+        total_size = 0
         for cl in self._copper_layers:
-            self._parse_single_layer(cl)
+            features_path = self._find_layer_file(cl, "features")
+            if features_path:
+                found.append((cl, features_path))
+                total_size += features_path.stat().st_size
+
+        parallel = total_size >= _PARALLEL_MIN_BYTES
+        if parallel:
+            # Ship each worker only its own layer's entries
+            net_maps = self._split_net_map([cl.odb_name for cl, _ in found])
+        jobs = []
+        for cl, features_path in found:
+            net_map = net_maps[cl.odb_name] if parallel else self._layer_net_map
+            jobs.append((features_path, cl.odb_name, cl.kicad_name, self.units,
+                         self._symbol_defs, net_map, self._net_by_index))
+
+        for traces, arcs, zones in _run_jobs(_parse_copper_features, jobs, parallel):
+            self.model.traces.extend(traces)
+            self.model.arcs.extend(arcs)
+            self.model.zones.extend(zones)
 
         log.info("Parsed %d traces, %d arcs, %d zones",
                  len(self.model.traces), len(self.model.arcs), len(self.model.zones))
 
-    def _parse_single_layer(self, layer_def: LayerDef):
-        """Parse features from a single layer's features file."""
+    def _split_net_map(self, layer_names: list) -> dict:
+        """Split the (layer, feature_id) net map into one dict per layer."""
+        maps = {name: {} for name in layer_names}
+        for key, net_idx in self._layer_net_map.items():
+            layer_map = maps.get(key[0])
+            if layer_map is not None:
+                layer_map[key] = net_idx
+        return maps
+
+    def _find_layer_file(self, layer_def: LayerDef, name: str) -> Optional[Path]:
+        """Find a file in a layer's directory under the current step."""
         step = self._step_path()
         if not step:
-            return
+            return None
 
         layers_dir = self._find_ci(step, "layers")
         if not layers_dir:
-            return
+            return None
 
         layer_dir = self._find_ci(layers_dir, layer_def.odb_name)
         if not layer_dir:
-            return
-
-        features_path = self._find_ci(layer_dir, "features")
-        if not features_path:
-            return
-
-        try:
-            content = features_path.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            return
-
-        kicad_layer = layer_def.kicad_name
-        net_map = self._layer_net_map.get(layer_def.odb_name, {})
-
-        # Parse symbol table at top of features file
-        sym_table = {}  # local_index -> symbol_name
-        feature_id = 0
-        in_features = False
-        in_surface = False
-        surface_points = []
-        surface_net_idx = 0
-
-        for line in content.splitlines():
-            line = line.strip()
-
-            if not line or line.startswith("#"):
-                continue
-
-            # Symbol table: $<index> <symbol_name>
-            m = re.match(r"^\$(\d+)\s+(\S+)", line)
-            if m:
-                sym_table[parse_int(m.group(1))] = m.group(2)
-                continue
-
-            # Feature records start after symbol table
-            # L <xs> <ys> <xe> <ye> <sym_num> <polarity> <dcode> ;...
-            m = re.match(
-                r"^L\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\d+)\s+(\w+)",
-                line, re.I
-            )
-            if m:
-                xs = convert_to_mm(parse_float(m.group(1)), self.units)
-                ys = convert_to_mm(parse_float(m.group(2)), self.units)
-                xe = convert_to_mm(parse_float(m.group(3)), self.units)
-                ye = convert_to_mm(parse_float(m.group(4)), self.units)
-                sym_idx = parse_int(m.group(5))
-
-                # Get trace width from symbol
-                width = 0.25  # default
-                sym_name = sym_table.get(sym_idx, "")
-                if sym_name:
-                    pd = self._symbol_defs.get(sym_name)
-                    if pd:
-                        width = pd.width
-                    else:
-                        pd = self._symbol_name_to_pad(sym_name)
-                        width = pd.width
-
-                net_idx = net_map.get(feature_id, 0)
-
-                self.model.traces.append(TraceSegment(
-                    start=Point(xs, negate_y(ys)),
-                    end=Point(xe, negate_y(ye)),
-                    width=max(width, 0.01),
-                    layer=kicad_layer,
-                    net_index=net_idx,
-                ))
-                feature_id += 1
-                continue
-
-            # P <x> <y> <sym_num> <polarity> <dcode> <rotation> ;...
-            m = re.match(
-                r"^P\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\d+)\s+(\w+)",
-                line, re.I
-            )
-            if m:
-                # Pads in copper layers - could be via pads or standalone pads
-                feature_id += 1
-                continue
-
-            # A <xs> <ys> <xe> <ye> <xc> <yc> <sym_num> <polarity> <dcode> <cw/ccw>
-            m = re.match(
-                r"^A\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+"
-                r"([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\d+)\s+(\w+)\s*;?\s*(\w*)",
-                line, re.I
-            )
-            if m:
-                xs = convert_to_mm(parse_float(m.group(1)), self.units)
-                ys = convert_to_mm(parse_float(m.group(2)), self.units)
-                xe = convert_to_mm(parse_float(m.group(3)), self.units)
-                ye = convert_to_mm(parse_float(m.group(4)), self.units)
-                xc = convert_to_mm(parse_float(m.group(5)), self.units)
-                yc = convert_to_mm(parse_float(m.group(6)), self.units)
-                sym_idx = parse_int(m.group(7))
-                cw_str = m.group(9) if m.group(9) else ""
-
-                width = 0.25
-                sym_name = sym_table.get(sym_idx, "")
-                if sym_name:
-                    pd = self._symbol_defs.get(sym_name) or self._symbol_name_to_pad(sym_name)
-                    width = pd.width
-
-                clockwise = cw_str.upper() in ("Y", "CW")
-                net_idx = net_map.get(feature_id, 0)
-
-                # Convert center-based arc to midpoint-based
-                sy_k = negate_y(ys)
-                ey_k = negate_y(ye)
-                cy_k = negate_y(yc)
-                mid_x, mid_y = arc_center_to_mid(xs, sy_k, xe, ey_k, xc, cy_k, clockwise)
-
-                self.model.arcs.append(TraceArc(
-                    start=Point(xs, sy_k),
-                    mid=Point(mid_x, mid_y),
-                    end=Point(xe, ey_k),
-                    width=max(width, 0.01),
-                    layer=kicad_layer,
-                    net_index=net_idx,
-                ))
-                feature_id += 1
-                continue
-
-            # Surface records (zones/fills)
-            if line.upper().startswith("S P"):
-                in_surface = True
-                surface_points = []
-                surface_net_idx = net_map.get(feature_id, 0)
-                feature_id += 1
-                continue
-
-            if in_surface:
-                if line.upper().startswith("SE"):
-                    # End of surface - create zone
-                    if surface_points:
-                        zone_poly = ZonePolygon(
-                            outline=[Point(p[0], p[1]) for p in surface_points]
-                        )
-                        net_name = ""
-                        for nd in self.model.nets:
-                            if nd.index == surface_net_idx:
-                                net_name = nd.name
-                                break
-                        self.model.zones.append(Zone(
-                            net_index=surface_net_idx,
-                            net_name=net_name,
-                            layer=kicad_layer,
-                            polygons=[zone_poly],
-                        ))
-                    in_surface = False
-                    continue
-
-                # OB x y
-                m = re.match(r"^OB\s+([\d.eE+-]+)\s+([\d.eE+-]+)", line, re.I)
-                if m:
-                    x = convert_to_mm(parse_float(m.group(1)), self.units)
-                    y = convert_to_mm(parse_float(m.group(2)), self.units)
-                    surface_points.append((x, negate_y(y)))
-                    continue
-
-                # OS x y
-                m = re.match(r"^OS\s+([\d.eE+-]+)\s+([\d.eE+-]+)", line, re.I)
-                if m:
-                    x = convert_to_mm(parse_float(m.group(1)), self.units)
-                    y = convert_to_mm(parse_float(m.group(2)), self.units)
-                    surface_points.append((x, negate_y(y)))
-                    continue
+            return None
 
-                # OC x y xc yc cw
-                m = re.match(
-                    r"^OC\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\w+)",
-                    line, re.I
-                )
-                if m:
-                    x = convert_to_mm(parse_float(m.group(1)), self.units)
-                    y = convert_to_mm(parse_float(m.group(2)), self.units)
-                    # For zones, just use the endpoint (simplify arcs to lines)
-                    surface_points.append((x, negate_y(y)))
-                    continue
+        return self._find_ci(layer_dir, name)
 
     # ── Drill layers ──────────────────────────────────────────────────
 
@@ -1182,14 +1228,25 @@ class OdbParser:
         drill_tools = {}
         if tools_path:
             try:
-                tools_content = tools_path.read_text(encoding="utf-8", errors="replace")
+                tools_content = _read_text(tools_path)
                 for tline in tools_content.splitlines():
                     # T<num> <diameter> <unit> ...
-                    tm = re.match(r"^T(\d+)\s+([\d.eE+-]+)", tline, re.I)
-                    if tm:
-                        tool_num = parse_int(tm.group(1))
-                        drill_dia = convert_to_mm(parse_float(tm.group(2)), self.units)
-                        drill_tools[tool_num] = drill_dia
+                    if not tline.startswith(("T", "t")):
+                        continue
+                    parts = tline.split()
+                    if len(parts) < 2 or not parts[0][1:].isdecimal():
+                        continue
+                    try:
+                        dia = float(parts[1])
+                    except ValueError:
+                        dia = math.nan
+                    # float() also takes nan, inf and 1_0; the regex does not
+                    if not math.isfinite(dia) or "_" in parts[1]:
+                        tm = _RE_TOOL.match(tline)
+                        if not tm:
+                            continue
+                        dia = parse_float(tm.group(2))
+                    drill_tools[int(parts[0][1:])] = convert_to_mm(dia, self.units)
             except Exception:
                 pass
 
@@ -1199,12 +1256,13 @@ class OdbParser:
             return
 
         try:
-            content = features_path.read_text(encoding="utf-8", errors="replace")
+            content = _read_text(features_path)
         except Exception:
             return
 
         sym_table = {}
-        net_map = self._layer_net_map.get(layer_def.odb_name, {})
+        layer_name = layer_def.odb_name
+        net_map = self._layer_net_map
         feature_id = 0
 
         # Determine via layer pair from drill span
@@ -1215,33 +1273,35 @@ class OdbParser:
             if not line or line.startswith("#"):
                 continue
 
-            m = re.match(r"^\$(\d+)\s+(\S+)", line)
-            if m:
-                sym_table[parse_int(m.group(1))] = m.group(2)
+            parts = line.split()
+            kind = parts[0].upper()
+
+            if kind[0] == "$":
+                if len(parts) > 1 and kind[1:].isdecimal():
+                    sym_table[int(kind[1:])] = parts[1]
                 continue
 
             # P <x> <y> <sym_num> <polarity> <dcode> <rotation>
-            m = re.match(
-                r"^P\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\d+)\s+(\w+)",
-                line, re.I
-            )
-            if m:
-                x = convert_to_mm(parse_float(m.group(1)), self.units)
-                y = convert_to_mm(parse_float(m.group(2)), self.units)
-                sym_idx = parse_int(m.group(3))
+            if kind == "P":
+                sym_idx = _record_symbol(parts, 3)
+                vals = _record_floats(parts, line, _RE_PAD, 2)
+                if sym_idx is None or vals is None:
+                    continue
+                x = convert_to_mm(vals[0], self.units)
+                y = convert_to_mm(vals[1], self.units)
 
                 # Get drill diameter from symbol
                 drill = 0.3  # default
                 sym_name = sym_table.get(sym_idx, "")
                 if sym_name:
-                    pd = self._symbol_defs.get(sym_name) or self._symbol_name_to_pad(sym_name)
+                    pd = self._symbol_defs.get(sym_name) or _symbol_name_to_pad(sym_name)
                     drill = pd.width
 
                 # Check drill tools
                 if sym_idx in drill_tools:
                     drill = drill_tools[sym_idx]
 
-                net_idx = net_map.get(feature_id, 0)
+                net_idx = net_map.get((layer_name, feature_id), 0)
 
                 # Via diameter is typically drill + annular ring
                 via_diameter = drill + 0.2  # rough estimate
@@ -1255,3 +1315,244 @@ class OdbParser:
                 ))
                 feature_id += 1
                 continue
+
+
+# ── Per-file workers ──────────────────────────────────────────────────
+# Module-level so that _run_jobs can hand them to worker processes; they
+# take plain arguments and return results for the parser to merge.
+
+def _parse_symbol_dir(sym_path: Path, units: str):
+    """Parse a single symbol directory into (name, PadDef)."""
+    name = sym_path.name
+    features_file = next(
+        (e for e in sym_path.iterdir() if e.name.lower() == "features"), None)
+
+    # First, try to determine shape from the name
+    pad_def = _symbol_name_to_pad(name)
+
+    # If we have a features file with custom geometry, parse it
+    if features_file and pad_def.shape == PadShape.CUSTOM:
+        pad_def = _parse_symbol_features(features_file, units) or pad_def
+
+    return name, pad_def
+
+
+def _parse_symbol_features(features_path: Path, units: str) -> Optional[PadDef]:
+    """Parse a symbol's features file for custom geometry."""
+    # Extract contour/surface from symbol features
+    xs = array("d")
+    ys = array("d")
+    in_surface = False
+
+    for line in _iter_file_lines(features_path):
+        if line.startswith("S P") or line.startswith("s p"):
+            in_surface = True
+            continue
+        if in_surface:
+            # OB x y - outline begin, OS x y - outline segment
+            m = _RE_OB.match(line) or _RE_OS.match(line)
+            if m:
+                xs.append(convert_to_mm(parse_float(m.group(1)), units))
+                ys.append(convert_to_mm(parse_float(m.group(2)), units))
+                continue
+
+            if line.upper().startswith("SE"):
+                in_surface = False
+                continue
+
+    if not xs:
+        return None
+
+    if HAS_NUMPY:
+        x_arr = np.frombuffer(xs)
+        y_arr = np.frombuffer(ys)
+        x_min, x_max = float(x_arr.min()), float(x_arr.max())
+        y_min, y_max = float(y_arr.min()), float(y_arr.max())
+    else:
+        x_min, x_max = min(xs), max(xs)
+        y_min, y_max = min(ys), max(ys)
+
+    w = x_max - x_min
+    h = y_max - y_min
+    # Center the outline
+    cx = (x_min + x_max) / 2
+    cy = (y_min + y_max) / 2
+    if HAS_NUMPY:
+        centered = list(zip((x_arr - cx).tolist(), (y_arr - cy).tolist()))
+    else:
+        centered = [(x - cx, y - cy) for x, y in zip(xs, ys)]
+    return PadDef(
+        shape=PadShape.CUSTOM,
+        width=max(w, 0.01),
+        height=max(h, 0.01),
+        custom_outline=centered,
+    )
+
+
+def _parse_copper_features(features_path: Path, layer_name: str, kicad_layer: str,
+                           units: str, symbol_defs: dict, net_map: dict, net_by_index: dict):
+    """Parse a copper layer's features file.
+
+    net_map is keyed by (layer_name, feature_id); net_by_index maps net
+    indices to NetDefs. Returns (traces, arcs, zones) for the layer.
+    """
+    try:
+        content = _read_text(features_path)
+    except Exception:
+        return [], [], []
+
+    traces, arcs, zones = [], [], []
+
+    # Parse symbol table at top of features file
+    sym_table = {}  # local_index -> symbol_name
+    feature_id = 0
+    in_features = False
+    in_surface = False
+    surface_points = []
+    surface_net_idx = 0
+
+    for line in content.splitlines():
+        line = line.strip()
+
+        if not line or line.startswith("#"):
+            continue
+
+        parts = line.split()
+        kind = parts[0].upper()
+
+        # Symbol table: $<index> <symbol_name>
+        if kind[0] == "$":
+            if len(parts) > 1 and kind[1:].isdecimal():
+                sym_table[int(kind[1:])] = parts[1]
+            continue
+
+        # Feature records start after symbol table
+        # L <xs> <ys> <xe> <ye> <sym_num> <polarity> <dcode> ;...
+        if kind == "L":
+            sym_idx = _record_symbol(parts, 5)
+            vals = _record_floats(parts, line, _RE_LINE, 4)
+            if sym_idx is None or vals is None:
+                continue
+            xs = convert_to_mm(vals[0], units)
+            ys = convert_to_mm(vals[1], units)
+            xe = convert_to_mm(vals[2], units)
+            ye = convert_to_mm(vals[3], units)
+
+            # Get trace width from symbol
+            width = 0.25  # default
+            sym_name = sym_table.get(sym_idx, "")
+            if sym_name:
+                pd = symbol_defs.get(sym_name)
+                if pd:
+                    width = pd.width
+                else:
+                    pd = _symbol_name_to_pad(sym_name)
+                    width = pd.width
+
+            net_idx = net_map.get((layer_name, feature_id), 0)
+
+            traces.append(TraceSegment(
+                start=Point(xs, negate_y(ys)),
+                end=Point(xe, negate_y(ye)),
+                width=max(width, 0.01),
+                layer=kicad_layer,
+                net_index=net_idx,
+            ))
+            feature_id += 1
+            continue
+
+        # P <x> <y> <sym_num> <polarity> <dcode> <rotation> ;...
+        if kind == "P":
+            # Pads in copper layers - could be via pads or standalone pads
+            # Only counted, so one match beats splitting out the fields
+            if _RE_PAD.match(line):
+                feature_id += 1
+            continue
+
+        # A <xs> <ys> <xe> <ye> <xc> <yc> <sym_num> <polarity> <dcode> <cw/ccw>
+        if kind == "A":
+            m = _RE_ARC.match(line)
+            if not m:
+                continue
+            xs = convert_to_mm(parse_float(m.group(1)), units)
+            ys = convert_to_mm(parse_float(m.group(2)), units)
+            xe = convert_to_mm(parse_float(m.group(3)), units)
+            ye = convert_to_mm(parse_float(m.group(4)), units)
+            xc = convert_to_mm(parse_float(m.group(5)), units)
+            yc = convert_to_mm(parse_float(m.group(6)), units)
+            sym_idx = int(m.group(7))
+            cw_str = m.group(9) if m.group(9) else ""
+
+            width = 0.25
+            sym_name = sym_table.get(sym_idx, "")
+            if sym_name:
+                pd = symbol_defs.get(sym_name) or _symbol_name_to_pad(sym_name)
+                width = pd.width
+
+            clockwise = cw_str.upper() in ("Y", "CW")
+            net_idx = net_map.get((layer_name, feature_id), 0)
+
+            # Convert center-based arc to midpoint-based
+            sy_k = negate_y(ys)
+            ey_k = negate_y(ye)
+            cy_k = negate_y(yc)
+            mid_x, mid_y = arc_center_to_mid(xs, sy_k, xe, ey_k, xc, cy_k, clockwise)
+
+            arcs.append(TraceArc(
+                start=Point(xs, sy_k),
+                mid=Point(mid_x, mid_y),
+                end=Point(xe, ey_k),
+                width=max(width, 0.01),
+                layer=kicad_layer,
+                net_index=net_idx,
+            ))
+            feature_id += 1
+            continue
+
+        # Surface records (zones/fills)
+        if kind == "S":
+            if line.upper().startswith("S P"):
+                in_surface = True
+                surface_points = []
+                surface_net_idx = net_map.get((layer_name, feature_id), 0)
+                feature_id += 1
+            continue
+
+        if in_surface:
+            if kind.startswith("SE"):
+                # End of surface - create zone
+                if surface_points:
+                    zone_poly = ZonePolygon(
+                        outline=[Point(p[0], p[1]) for p in surface_points]
+                    )
+                    nd = net_by_index.get(surface_net_idx)
+                    net_name = nd.name if nd else ""
+                    zones.append(Zone(
+                        net_index=surface_net_idx,
+                        net_name=net_name,
+                        layer=kicad_layer,
+                        polygons=[zone_poly],
+                    ))
+                in_surface = False
+                continue
+
+            # OB x y / OS x y
+            if kind == "OB" or kind == "OS":
+                vals = _record_floats(parts, line, _RE_OB if kind == "OB" else _RE_OS, 2)
+                if vals is not None:
+                    x = convert_to_mm(vals[0], units)
+                    y = convert_to_mm(vals[1], units)
+                    surface_points.append((x, negate_y(y)))
+                continue
+
+            # OC x y xc yc cw
+            if kind == "OC":
+                vals = _record_floats(parts, line, _RE_OC, 4)
+                if vals is not None and len(parts) >= 6 and _is_word_start(parts[5]):
+                    x = convert_to_mm(vals[0], units)
+                    y = convert_to_mm(vals[1], units)
+                    # For zones, just use the endpoint (simplify arcs to lines)
+                    surface_points.append((x, negate_y(y)))
+                continue
+
+    return traces, arcs, zones
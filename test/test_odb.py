@@ -12,6 +12,7 @@ import tempfile
 import tarfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -23,6 +24,7 @@ from odb.utils import (
     convert_to_mm, negate_y, fmt, arc_center_to_mid, make_uuid, reset_uuid_counter,
     inch_to_mm, mils_to_mm,
 )
+from odb import odb_parser
 from odb.odb_parser import parse_odb, OdbParser
 from odb.odb_to_json import model_to_json
 
@@ -134,6 +136,74 @@ class TestSymbolParsing(unittest.TestCase):
         self.assertAlmostEqual(pd.height, 1.27)
 
 
+class TestFileLookup(unittest.TestCase):
+    """Test case-insensitive path lookup."""
+
+    def test_find_ci(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "Steps" / "PCB").mkdir(parents=True)
+            parser = OdbParser()
+            steps = parser._find_ci(root, "steps")
+            # Case-insensitive filesystems return the caller's spelling
+            self.assertTrue(steps.samefile(root / "Steps"))
+            self.assertTrue(parser._find_ci(steps, "pcb").samefile(root / "Steps" / "PCB"))
+            self.assertEqual(parser._find_ci(root, "Steps"), root / "Steps")
+            self.assertIsNone(parser._find_ci(root, "matrix"))
+            self.assertIsNone(parser._find_ci(root / "missing", "matrix"))
+
+
+class TestComponentParsing(unittest.TestCase):
+    """Test component layer parsing."""
+
+    def test_pin_units(self):
+        """Pin positions in inch files are converted to mm exactly once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            comp_dir = Path(tmpdir)
+            (comp_dir / "components").write_text(
+                "CMP 0 1.0 2.0 0 N R1 RES ;ID=R1\n"
+                "TOP 0 1.5 2.0 0 N 0 0\n"
+            )
+            parser = OdbParser()
+            parser.units = "INCH"
+            parser._parse_component_layer(comp_dir, Side.TOP)
+
+            comp = parser.model.components[0]
+            self.assertEqual(comp.reference, "R1")
+            self.assertAlmostEqual(comp.pos.x, 25.4)
+            pad = comp.footprint.pads[0]
+            self.assertAlmostEqual(pad.pos.x, 38.1)
+            self.assertAlmostEqual(pad.pos.y, -50.8)
+
+
+class TestRecordParsing(unittest.TestCase):
+    """Test numeric field extraction from feature records."""
+
+    def _floats(self, line):
+        return odb_parser._record_floats(line.split(), line, odb_parser._RE_LINE, 4)
+
+    def test_plain_numbers(self):
+        self.assertEqual(self._floats("L 1 2.5 -3 4e1 0 P"), [1.0, 2.5, -3.0, 40.0])
+
+    def test_nan_rejected(self):
+        """Tokens float() takes but the record regex does not are skipped."""
+        self.assertIsNone(self._floats("L nan 0 1 1 0 P"))
+        self.assertIsNone(self._floats("L 0 inf 1 1 0 P"))
+        self.assertIsNone(self._floats("L 0 0 1_0 1 0 P"))
+
+
+class TestFileLines(unittest.TestCase):
+    """Test streamed line reading."""
+
+    def test_unreadable_file_logged(self):
+        """A file that cannot be opened is reported, not silently empty."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "features"
+            with self.assertLogs(odb_parser.log, "WARNING") as cm:
+                self.assertEqual(list(odb_parser._iter_file_lines(path)), [])
+            self.assertIn(str(path), cm.output[0])
+
+
 class TestEndToEnd(unittest.TestCase):
     """End-to-end integration tests with sample ODB++ data."""
 
@@ -250,6 +320,27 @@ class TestEndToEnd(unittest.TestCase):
             # Check traces
             self.assertTrue(len(model.traces) >= 3)  # 2 on top, 1 on bottom
 
+    def test_parse_cr_line_endings(self):
+        """Files with bare CR line endings parse like LF ones."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            odb_root = self._create_sample_odb(Path(tmpdir))
+            profile = odb_root / "steps" / "pcb" / "profile"
+            profile.write_bytes(profile.read_bytes().replace(b"\n", b"\r"))
+            model = parse_odb(odb_root)
+            self.assertEqual(len(model.outline), 4)
+
+    def test_net_name_index(self):
+        """Net name lookup matches the final net indices."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            odb_root = self._create_sample_odb(Path(tmpdir))
+            model = parse_odb(odb_root)
+
+            self.assertEqual(model.nets[0].name, "")
+            self.assertEqual(model._net_name_to_index,
+                             {nd.name: nd.index for nd in model.nets})
+            self.assertEqual(model._net_name_to_index["VCC"], 1)
+            self.assertEqual(model._net_name_to_index["GND"], 2)
+
     def test_parse_tgz_archive(self):
         """Test parsing from a .tgz archive."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -264,6 +355,20 @@ class TestEndToEnd(unittest.TestCase):
             self.assertTrue(len(model.layers) > 0)
             self.assertTrue(len(model.outline) > 0)
 
+    def test_model_cache(self):
+        """With the cache enabled, a second parse loads the pickled model."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            odb_root = self._create_sample_odb(Path(tmpdir))
+            cache_dir = Path(tmpdir) / "cache"
+            with mock.patch.dict(os.environ, {"ODB2KICAD_CACHE": "1"}), \
+                    mock.patch.object(odb_parser, "_CACHE_DIR", cache_dir):
+                model = parse_odb(odb_root)
+                self.assertEqual(len(list(cache_dir.glob("*.pkl"))), 1)
+                with mock.patch.object(OdbParser, "parse") as parse:
+                    cached = parse_odb(odb_root)
+                    parse.assert_not_called()
+            self.assertEqual(model_to_json(cached), model_to_json(model))
+
 
 class TestJsonBridge(unittest.TestCase):
     """Test the ODB++ to JSON bridge (odb_to_json.py)."""